@@ -0,0 +1,119 @@
+"""Store monitor type and check interval as small integers
+
+Revision ID: 2c8e6f1a9d34
+Revises: 7a2f5c8e1b93
+Create Date: 2026-10-17 17:05:12.418305
+
+"""
+
+from typing import Dict, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2c8e6f1a9d34"
+down_revision: Union[str, None] = "7a2f5c8e1b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum member name -> stored code, matching Monitor's SmallIntEnum columns
+MONITOR_TYPE_CODES = {"HTTP": 1, "HTTPS": 2, "TCP": 3, "PING": 4, "KAFKA": 5}
+CHECK_INTERVAL_SECONDS = {
+    "THIRTY_SECONDS": 30,
+    "ONE_MINUTE": 60,
+    "FIVE_MINUTES": 300,
+    "FIFTEEN_MINUTES": 900,
+    "THIRTY_MINUTES": 1800,
+    "ONE_HOUR": 3600,
+}
+
+TYPE_INDEX = "idx_monitor_user_type_active"
+TYPE_INDEX_COLUMNS = ["user_id", "type", "is_active"]
+
+
+def _case(column: str, mapping: Dict[object, object]) -> str:
+    """Build a CASE expression translating the values of a column."""
+    whens = " ".join(
+        f"WHEN {column} = {_literal(old)} THEN {_literal(new)}"
+        for old, new in mapping.items()
+    )
+    return f"CASE {whens} END"
+
+
+def _literal(value: object) -> str:
+    return str(value) if isinstance(value, int) else f"'{value}'"
+
+
+def _convert(
+    old_types: Dict[str, sa.types.TypeEngine],
+    new_types: Dict[str, sa.types.TypeEngine],
+    mappings: Dict[str, Dict[object, object]],
+) -> None:
+    """Rewrite the type and check_interval columns through temporary columns."""
+    op.drop_index(TYPE_INDEX, table_name="monitor")
+
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        for column, new_type in new_types.items():
+            batch_op.add_column(sa.Column(f"{column}_new", new_type, nullable=True))
+
+    assignments = ", ".join(
+        f"{column}_new = {_case(column, mapping)}"
+        for column, mapping in mappings.items()
+    )
+    op.execute(f"UPDATE monitor SET {assignments}")
+
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        for column in old_types:
+            batch_op.drop_column(column)
+            batch_op.alter_column(
+                f"{column}_new",
+                new_column_name=column,
+                existing_type=new_types[column],
+                nullable=False,
+            )
+
+    op.create_index(TYPE_INDEX, "monitor", TYPE_INDEX_COLUMNS, unique=False)
+
+
+def _enum_types() -> Dict[str, sa.Enum]:
+    return {
+        "type": sa.Enum(*MONITOR_TYPE_CODES, name="monitortype"),
+        "check_interval": sa.Enum(*CHECK_INTERVAL_SECONDS, name="checkinterval"),
+    }
+
+
+def upgrade() -> None:
+    enum_types = _enum_types()
+    _convert(
+        old_types=enum_types,
+        new_types={"type": sa.SmallInteger(), "check_interval": sa.SmallInteger()},
+        mappings={
+            "type": MONITOR_TYPE_CODES,
+            "check_interval": CHECK_INTERVAL_SECONDS,
+        },
+    )
+
+    # Native enum types are left behind on PostgreSQL once no column uses them
+    bind = op.get_bind()
+    for enum_type in enum_types.values():
+        enum_type.drop(bind, checkfirst=True)
+
+
+def downgrade() -> None:
+    enum_types = _enum_types()
+    bind = op.get_bind()
+    for enum_type in enum_types.values():
+        enum_type.create(bind, checkfirst=True)
+
+    _convert(
+        old_types={"type": sa.SmallInteger(), "check_interval": sa.SmallInteger()},
+        new_types=enum_types,
+        mappings={
+            "type": {code: name for name, code in MONITOR_TYPE_CODES.items()},
+            "check_interval": {
+                seconds: name for name, seconds in CHECK_INTERVAL_SECONDS.items()
+            },
+        },
+    )
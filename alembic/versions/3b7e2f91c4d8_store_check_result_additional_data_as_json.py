@@ -0,0 +1,50 @@
+"""Store check_result.additional_data as native JSON
+
+Revision ID: 3b7e2f91c4d8
+Revises: 6fee1ec26f10
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e2f91c4d8"
+down_revision: Union[str, None] = "6fee1ec26f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # SQLite stores JSON as TEXT, existing rows are already compatible
+        return
+
+    op.alter_column(
+        "check_result",
+        "additional_data",
+        existing_type=sa.Text(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="additional_data::json",
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    op.alter_column(
+        "check_result",
+        "additional_data",
+        existing_type=sa.JSON(),
+        type_=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="additional_data::text",
+    )
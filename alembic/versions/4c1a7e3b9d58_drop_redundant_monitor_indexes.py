@@ -0,0 +1,41 @@
+"""Drop redundant and unused monitor indexes
+
+Revision ID: 4c1a7e3b9d58
+Revises: b85e2c9d4f17
+Create Date: 2026-10-17 15:58:37.204116
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1a7e3b9d58"
+down_revision: Union[str, None] = "b85e2c9d4f17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Index name -> columns. Each is a prefix of a remaining index or is not used
+# by any query, and most are rewritten by every check's status update.
+REDUNDANT_INDEXES = {
+    "ix_monitor_user_id": ["user_id"],
+    "ix_monitor_type": ["type"],
+    "ix_monitor_is_active": ["is_active"],
+    "idx_monitor_user_active": ["user_id", "is_active"],
+    "idx_monitor_type_active": ["type", "is_active"],
+    "idx_monitor_user_active_updated": ["user_id", "is_active", "updated_at"],
+    "idx_monitor_status_check_time": ["last_status", "last_check"],
+    "idx_monitor_consecutive_failures": ["consecutive_failures", "is_active"],
+}
+
+
+def upgrade() -> None:
+    for name in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name="monitor")
+
+
+def downgrade() -> None:
+    for name, columns in REDUNDANT_INDEXES.items():
+        op.create_index(name, "monitor", columns, unique=False)
@@ -0,0 +1,61 @@
+"""Store incident timestamps with time zone
+
+Revision ID: 5d2b9e7f3a16
+Revises: 2c8e6f1a9d34
+Create Date: 2026-10-17 18:24:37.906152
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2b9e7f3a16"
+down_revision: Union[str, None] = "2c8e6f1a9d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Incident timestamp columns and whether they are nullable
+COLUMNS = {
+    "started_at": False,
+    "resolved_at": True,
+    "created_at": False,
+    "updated_at": False,
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # SQLite has no time zone aware type; UTCDateTime stores UTC text
+        # in the same format as before
+        return
+
+    for column, nullable in COLUMNS.items():
+        op.alter_column(
+            "incident",
+            column,
+            existing_type=sa.DateTime(),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    for column, nullable in COLUMNS.items():
+        op.alter_column(
+            "incident",
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,49 @@
+"""Add covering index for active incident listings
+
+Revision ID: 5e0b8c4a7d12
+Revises: f3a9d27c6b80
+Create Date: 2026-10-17 13:48:31.662047
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0b8c4a7d12"
+down_revision: Union[str, None] = "f3a9d27c6b80"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_incident_active_covering",
+        "incident",
+        ["status", "started_at", "monitor_id", "severity", "duration"],
+        unique=False,
+    )
+    # Both were (status, started_at), a prefix of the covering index
+    op.drop_index("idx_incident_status_started", table_name="incident")
+    op.drop_index("idx_incident_active_started", table_name="incident")
+
+    # Refresh planner statistics so the new index is picked up
+    op.execute("ANALYZE incident")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_incident_active_started",
+        "incident",
+        ["status", "started_at"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_incident_status_started",
+        "incident",
+        ["status", "started_at"],
+        unique=False,
+    )
+    op.drop_index("idx_incident_active_covering", table_name="incident")
@@ -0,0 +1,34 @@
+"""Add partial index for unresolved incidents
+
+Revision ID: 7a2f5c8e1b93
+Revises: e0d94b7a2c61
+Create Date: 2026-10-17 16:47:25.690143
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2f5c8e1b93"
+down_revision: Union[str, None] = "e0d94b7a2c61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_incident_unresolved",
+        "incident",
+        ["monitor_id", "started_at"],
+        unique=False,
+        sqlite_where=sa.text("resolved_at IS NULL"),
+        postgresql_where=sa.text("resolved_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_incident_unresolved", table_name="incident")
@@ -0,0 +1,86 @@
+"""Extend monitor rolling uptime counters to 30 days
+
+Revision ID: 8a4f1c6e2b95
+Revises: 5d2b9e7f3a16
+Create Date: 2026-10-17 18:05:12.417306
+
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4f1c6e2b95"
+down_revision: Union[str, None] = "5d2b9e7f3a16"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.alter_column("uptime_7d_days", new_column_name="uptime_days")
+        batch_op.add_column(
+            sa.Column(
+                "uptime_30d_num", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "uptime_30d_den", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+
+    # Backfill per-day buckets for today and the 29 days before it
+    connection = op.get_bind()
+    today = datetime.now(timezone.utc).date()
+    start = datetime.combine(today - timedelta(days=29), datetime.min.time())
+    week_start = (today - timedelta(days=6)).toordinal()
+    rows = connection.execute(
+        sa.text(
+            "SELECT monitor_id, date(timestamp) AS day, "
+            "SUM(CASE WHEN status = 'up' THEN 1 ELSE 0 END), COUNT(*) "
+            "FROM check_result WHERE timestamp >= :start "
+            "GROUP BY monitor_id, date(timestamp) ORDER BY monitor_id, day"
+        ),
+        {"start": start},
+    ).fetchall()
+
+    buckets = {}
+    for monitor_id, day, up, total in rows:
+        ordinal = date.fromisoformat(str(day)).toordinal()
+        buckets.setdefault(monitor_id, []).append([ordinal, int(up), int(total)])
+
+    monitor_ids = [
+        row[0] for row in connection.execute(sa.text("SELECT id FROM monitor"))
+    ]
+    for monitor_id in monitor_ids:
+        days = buckets.get(monitor_id, [])
+        week = [day for day in days if day[0] >= week_start]
+        connection.execute(
+            sa.text(
+                "UPDATE monitor SET uptime_days = :days, "
+                "uptime_7d_num = :week_num, uptime_7d_den = :week_den, "
+                "uptime_30d_num = :num, uptime_30d_den = :den WHERE id = :id"
+            ),
+            {
+                "days": json.dumps(days),
+                "week_num": sum(day[1] for day in week),
+                "week_den": sum(day[2] for day in week),
+                "num": sum(day[1] for day in days),
+                "den": sum(day[2] for day in days),
+                "id": monitor_id,
+            },
+        )
+
+
+def downgrade() -> None:
+    # Buckets older than 7 days are ignored and pruned by the 7 day counters
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.drop_column("uptime_30d_den")
+        batch_op.drop_column("uptime_30d_num")
+        batch_op.alter_column("uptime_days", new_column_name="uptime_7d_days")
@@ -0,0 +1,46 @@
+"""Add covering index for check_result dashboard queries
+
+Revision ID: 8d4a1c6e0f27
+Revises: 3b7e2f91c4d8
+Create Date: 2026-10-17 10:03:17.284519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4a1c6e0f27"
+down_revision: Union[str, None] = "3b7e2f91c4d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_check_result_monitor_ts_covering",
+        "check_result",
+        ["monitor_id", "timestamp", "status", "response_time"],
+        unique=False,
+    )
+    # No query filters or sorts on response_time alone
+    op.drop_index("idx_check_result_response_time", table_name="check_result")
+    op.drop_index(op.f("ix_check_result_response_time"), table_name="check_result")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_check_result_response_time"),
+        "check_result",
+        ["response_time"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_check_result_response_time",
+        "check_result",
+        ["response_time"],
+        unique=False,
+    )
+    op.drop_index("idx_check_result_monitor_ts_covering", table_name="check_result")
@@ -0,0 +1,91 @@
+"""Shorten error_messages.message_hash to 128 bits
+
+Revision ID: 9b4e1f6a2c35
+Revises: 5e0b8c4a7d12
+Create Date: 2026-10-17 14:10:52.804613
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e1f6a2c35"
+down_revision: Union[str, None] = "5e0b8c4a7d12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicates the unique ix_error_messages_message_hash index
+    op.drop_index("idx_error_message_hash", table_name="error_messages")
+
+    # New hashes are the first 32 hex digits of the sha256 digest, so
+    # existing rows keep matching after truncation. A message already stored
+    # under its short hash (written by newer code) is merged into one row.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, message_hash, usage_count FROM error_messages ORDER BY id")
+    ).fetchall()
+    kept = {}
+    for row_id, message_hash, usage_count in rows:
+        keep_id = kept.setdefault(message_hash[:32], row_id)
+        if keep_id == row_id:
+            continue
+        bind.execute(
+            sa.text(
+                "UPDATE check_result SET error_message_id = :keep "
+                "WHERE error_message_id = :dup"
+            ),
+            {"keep": keep_id, "dup": row_id},
+        )
+        bind.execute(
+            sa.text(
+                "UPDATE error_messages SET usage_count = usage_count + :uses "
+                "WHERE id = :keep"
+            ),
+            {"uses": usage_count, "keep": keep_id},
+        )
+        bind.execute(
+            sa.text("DELETE FROM error_messages WHERE id = :dup"), {"dup": row_id}
+        )
+    op.execute(
+        "UPDATE error_messages SET message_hash = substr(message_hash, 1, 32) "
+        "WHERE length(message_hash) > 32"
+    )
+
+    with op.batch_alter_table("error_messages") as batch_op:
+        batch_op.alter_column(
+            "message_hash",
+            existing_type=sa.String(length=64),
+            type_=sa.String(length=32),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    # Full digests cannot be restored from the truncated values; rehash
+    import hashlib
+
+    with op.batch_alter_table("error_messages") as batch_op:
+        batch_op.alter_column(
+            "message_hash",
+            existing_type=sa.String(length=32),
+            type_=sa.String(length=64),
+            existing_nullable=False,
+        )
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, message FROM error_messages")).fetchall()
+    for row_id, message in rows:
+        bind.execute(
+            sa.text("UPDATE error_messages SET message_hash = :hash WHERE id = :id"),
+            {"hash": hashlib.sha256(message.encode()).hexdigest(), "id": row_id},
+        )
+
+    op.create_index(
+        "idx_error_message_hash", "error_messages", ["message_hash"], unique=False
+    )
@@ -0,0 +1,29 @@
+"""Add rendered_css column to app_settings
+
+Revision ID: a47c2d9e5b16
+Revises: e51f0b9a7c33
+Create Date: 2026-10-17 12:04:18.331207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a47c2d9e5b16"
+down_revision: Union[str, None] = "e51f0b9a7c33"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Left NULL here; the CSS is rendered on first request or next save
+    op.add_column("app_settings", sa.Column("rendered_css", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("app_settings") as batch_op:
+        batch_op.drop_column("rendered_css")
@@ -0,0 +1,35 @@
+"""Add notification outbox claims
+
+Revision ID: a9e4c7d2f168
+Revises: f7b3d8e1c925
+Create Date: 2026-10-17 23:58:12.406731
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9e4c7d2f168"
+down_revision: Union[str, None] = "f7b3d8e1c925"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notification_outbox", sa.Column("claimed_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "notification_outbox",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("notification_outbox") as batch_op:
+        batch_op.drop_column("attempts")
+        batch_op.drop_column("claimed_at")
@@ -0,0 +1,45 @@
+"""Add notification outbox
+
+Revision ID: b3e7d2a9c418
+Revises: 8a4f1c6e2b95
+Create Date: 2026-10-17 19:42:37.208514
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e7d2a9c418"
+down_revision: Union[str, None] = "8a4f1c6e2b95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("monitor_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["monitor_id"], ["monitor.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_notification_outbox_monitor_id"),
+        "notification_outbox",
+        ["monitor_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_notification_outbox_monitor_id"), table_name="notification_outbox"
+    )
+    op.drop_table("notification_outbox")
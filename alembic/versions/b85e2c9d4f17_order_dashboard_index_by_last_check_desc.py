@@ -0,0 +1,41 @@
+"""Order idx_monitor_dashboard_primary by last_check DESC
+
+Revision ID: b85e2c9d4f17
+Revises: d7c3a5f18e62
+Create Date: 2026-10-17 15:41:09.527318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b85e2c9d4f17"
+down_revision: Union[str, None] = "d7c3a5f18e62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The dashboard orders by last_check DESC, name ASC; with an ascending
+    # last_check the mixed directions forced a temp B-tree sort
+    op.drop_index("idx_monitor_dashboard_primary", table_name="monitor")
+    op.create_index(
+        "idx_monitor_dashboard_primary",
+        "monitor",
+        ["user_id", "is_active", sa.text("last_check DESC"), "name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_monitor_dashboard_primary", table_name="monitor")
+    op.create_index(
+        "idx_monitor_dashboard_primary",
+        "monitor",
+        ["user_id", "is_active", "last_check", "name"],
+        unique=False,
+    )
@@ -0,0 +1,37 @@
+"""Drop check_result indexes covered by the monitor/timestamp covering index
+
+Revision ID: c2f86b3d1e49
+Revises: a47c2d9e5b16
+Create Date: 2026-10-17 12:41:09.516832
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2f86b3d1e49"
+down_revision: Union[str, None] = "a47c2d9e5b16"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Index name -> columns; each is a prefix of idx_check_result_monitor_ts_covering
+REDUNDANT_INDEXES = {
+    "ix_check_result_monitor_id": ["monitor_id"],
+    "idx_check_result_monitor_timestamp": ["monitor_id", "timestamp"],
+    "idx_recent_checks": ["monitor_id", "timestamp"],
+    "idx_check_result_monitor_success_time": ["monitor_id", "timestamp", "status"],
+    "idx_uptime_calculation": ["monitor_id", "timestamp", "status"],
+}
+
+
+def upgrade() -> None:
+    for name in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name="check_result")
+
+
+def downgrade() -> None:
+    for name, columns in REDUNDANT_INDEXES.items():
+        op.create_index(name, "check_result", columns, unique=False)
@@ -0,0 +1,34 @@
+"""Add CHECK constraints for monitor enum codes
+
+Revision ID: c6d1f8e3a7b2
+Revises: b3e7d2a9c418
+Create Date: 2026-10-17 20:31:09.664812
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6d1f8e3a7b2"
+down_revision: Union[str, None] = "b3e7d2a9c418"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Codes of MonitorType (in _MONITOR_TYPE_CODES order) and CheckInterval
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.create_check_constraint("ck_monitor_type", "type IN (1, 2, 3, 4, 5)")
+        batch_op.create_check_constraint(
+            "ck_monitor_check_interval",
+            "check_interval IN (30, 60, 300, 900, 1800, 3600)",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_monitor_check_interval", type_="check")
+        batch_op.drop_constraint("ck_monitor_type", type_="check")
@@ -0,0 +1,48 @@
+"""Drop unused incident_check_results association table
+
+Revision ID: d7c3a5f18e62
+Revises: 9b4e1f6a2c35
+Create Date: 2026-10-17 15:02:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7c3a5f18e62"
+down_revision: Union[str, None] = "9b4e1f6a2c35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Never populated: incidents find their checks by monitor and time window
+    op.drop_index("idx_incident_check_result", table_name="incident_check_results")
+    op.drop_table("incident_check_results")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "incident_check_results",
+        sa.Column("incident_id", sa.Integer(), nullable=False),
+        sa.Column("check_result_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["check_result_id"],
+            ["check_result.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["incident_id"],
+            ["incident.id"],
+        ),
+        sa.PrimaryKeyConstraint("incident_id", "check_result_id"),
+    )
+    op.create_index(
+        "idx_incident_check_result",
+        "incident_check_results",
+        ["incident_id", "check_result_id"],
+        unique=False,
+    )
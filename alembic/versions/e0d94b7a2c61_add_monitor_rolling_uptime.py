@@ -0,0 +1,76 @@
+"""Add rolling 7 day uptime counters to monitor
+
+Revision ID: e0d94b7a2c61
+Revises: 4c1a7e3b9d58
+Create Date: 2026-10-17 16:20:52.841930
+
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e0d94b7a2c61"
+down_revision: Union[str, None] = "4c1a7e3b9d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("uptime_7d_days", sa.JSON(), nullable=True))
+        batch_op.add_column(
+            sa.Column("uptime_7d_num", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(
+            sa.Column("uptime_7d_den", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    # Backfill per-day buckets for today and the 6 days before it
+    connection = op.get_bind()
+    today = datetime.now(timezone.utc).date()
+    start = datetime.combine(today - timedelta(days=6), datetime.min.time())
+    rows = connection.execute(
+        sa.text(
+            "SELECT monitor_id, date(timestamp) AS day, "
+            "SUM(CASE WHEN status = 'up' THEN 1 ELSE 0 END), COUNT(*) "
+            "FROM check_result WHERE timestamp >= :start "
+            "GROUP BY monitor_id, date(timestamp) ORDER BY monitor_id, day"
+        ),
+        {"start": start},
+    ).fetchall()
+
+    buckets = {}
+    for monitor_id, day, up, total in rows:
+        ordinal = date.fromisoformat(str(day)).toordinal()
+        buckets.setdefault(monitor_id, []).append([ordinal, int(up), int(total)])
+
+    monitor_ids = [
+        row[0] for row in connection.execute(sa.text("SELECT id FROM monitor"))
+    ]
+    for monitor_id in monitor_ids:
+        days = buckets.get(monitor_id, [])
+        connection.execute(
+            sa.text(
+                "UPDATE monitor SET uptime_7d_days = :days, uptime_7d_num = :num, "
+                "uptime_7d_den = :den WHERE id = :id"
+            ),
+            {
+                "days": json.dumps(days),
+                "num": sum(day[1] for day in days),
+                "den": sum(day[2] for day in days),
+                "id": monitor_id,
+            },
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("monitor", schema=None) as batch_op:
+        batch_op.drop_column("uptime_7d_den")
+        batch_op.drop_column("uptime_7d_num")
+        batch_op.drop_column("uptime_7d_days")
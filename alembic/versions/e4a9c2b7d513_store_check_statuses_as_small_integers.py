@@ -0,0 +1,62 @@
+"""Store check statuses as small integers
+
+Revision ID: e4a9c2b7d513
+Revises: c6d1f8e3a7b2
+Create Date: 2026-10-17 21:48:26.305174
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9c2b7d513"
+down_revision: Union[str, None] = "c6d1f8e3a7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Status name -> stored code, matching the StatusCode column type; anything
+# else is stored as unknown
+STATUS_CODES = {"unknown": 0, "up": 1, "down": 2}
+
+# (table, column, nullable) of the status columns
+STATUS_COLUMNS = [("check_result", "status", False), ("monitor", "last_status", True)]
+
+
+def upgrade() -> None:
+    for table, column, nullable in STATUS_COLUMNS:
+        # Rewrite the names as their codes, so the type change only casts
+        whens = " ".join(
+            f"WHEN '{name}' THEN '{code}'" for name, code in STATUS_CODES.items()
+        )
+        op.execute(
+            f"UPDATE {table} SET {column} = CASE {column} {whens} ELSE '0' END "
+            f"WHERE {column} IS NOT NULL"
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.String(length=20),
+                type_=sa.SmallInteger(),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::smallint",
+            )
+
+
+def downgrade() -> None:
+    for table, column, nullable in STATUS_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.SmallInteger(),
+                type_=sa.String(length=20),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::varchar(20)",
+            )
+        whens = " ".join(
+            f"WHEN '{code}' THEN '{name}'" for name, code in STATUS_CODES.items()
+        )
+        op.execute(f"UPDATE {table} SET {column} = CASE {column} {whens} END")
@@ -0,0 +1,115 @@
+"""Consolidate app_settings color columns into a JSON column
+
+Revision ID: e51f0b9a7c33
+Revises: 8d4a1c6e0f27
+Create Date: 2026-10-17 11:26:52.917304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e51f0b9a7c33"
+down_revision: Union[str, None] = "8d4a1c6e0f27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Column name -> (length, nullable, default) as defined before consolidation
+COLOR_COLUMNS = {
+    "primary_color": (7, False, "#59bc87"),
+    "primary_hover_color": (7, False, "#45a676"),
+    "primary_subtle_color": (20, False, "rgba(168, 255, 204, 0.15)"),
+    "success_color": (7, False, "#22c55e"),
+    "success_bg_color": (7, False, "#f0fdf4"),
+    "danger_color": (7, False, "#dc2626"),
+    "danger_bg_color": (7, False, "#fef2f2"),
+    "warning_color": (7, False, "#f59e0b"),
+    "warning_bg_color": (7, False, "#fffbeb"),
+    "info_color": (7, False, "#06b6d4"),
+    "info_bg_color": (7, False, "#ecfeff"),
+    "unknown_color": (7, False, "#6b7280"),
+    "unknown_bg_color": (7, False, "#f3f4f6"),
+    "dark_primary_color": (7, True, "#3b82f6"),
+    "dark_primary_hover_color": (7, True, "#60a5fa"),
+    "dark_primary_subtle_color": (20, True, "rgba(59, 130, 246, 0.15)"),
+    "dark_success_color": (7, True, "#4ade80"),
+    "dark_success_bg_color": (7, True, "#052e16"),
+    "dark_danger_color": (7, True, "#f87171"),
+    "dark_danger_bg_color": (7, True, "#1f0713"),
+    "dark_warning_color": (7, True, "#fbbf24"),
+    "dark_warning_bg_color": (7, True, "#1c1305"),
+    "dark_info_color": (7, True, "#38bdf8"),
+    "dark_info_bg_color": (7, True, "#071926"),
+    "dark_unknown_color": (7, True, "#9ca3af"),
+    "dark_unknown_bg_color": (7, True, "#1f2937"),
+}
+
+
+def upgrade() -> None:
+    op.add_column("app_settings", sa.Column("colors", sa.JSON(), nullable=True))
+
+    app_settings = sa.table(
+        "app_settings",
+        sa.column("id", sa.Integer()),
+        sa.column("colors", sa.JSON()),
+        *(sa.column(name, sa.String()) for name in COLOR_COLUMNS),
+    )
+
+    # Keep only values that differ from the defaults
+    bind = op.get_bind()
+    for row in bind.execute(sa.select(app_settings)).mappings():
+        overrides = {
+            name: row[name]
+            for name, (_, _, default) in COLOR_COLUMNS.items()
+            if row[name] != default
+        }
+        bind.execute(
+            app_settings.update()
+            .where(app_settings.c.id == row["id"])
+            .values(colors=overrides or None)
+        )
+
+    with op.batch_alter_table("app_settings") as batch_op:
+        for name in COLOR_COLUMNS:
+            batch_op.drop_column(name)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("app_settings") as batch_op:
+        for name, (length, nullable, default) in COLOR_COLUMNS.items():
+            batch_op.add_column(
+                sa.Column(
+                    name,
+                    sa.String(length=length),
+                    nullable=nullable,
+                    server_default=default,
+                )
+            )
+
+    app_settings = sa.table(
+        "app_settings",
+        sa.column("id", sa.Integer()),
+        sa.column("colors", sa.JSON()),
+        *(sa.column(name, sa.String()) for name in COLOR_COLUMNS),
+    )
+
+    bind = op.get_bind()
+    for row in bind.execute(sa.select(app_settings)).mappings():
+        overrides = row["colors"] or {}
+        values = {
+            name: overrides[name]
+            for name, (_, nullable, _) in COLOR_COLUMNS.items()
+            if name in overrides and (nullable or overrides[name])
+        }
+        if values:
+            bind.execute(
+                app_settings.update()
+                .where(app_settings.c.id == row["id"])
+                .values(**values)
+            )
+
+    op.drop_column("app_settings", "colors")
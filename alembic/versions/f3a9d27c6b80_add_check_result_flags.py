@@ -0,0 +1,50 @@
+"""Add flags bitfield column to check_result
+
+Revision ID: f3a9d27c6b80
+Revises: c2f86b3d1e49
+Create Date: 2026-10-17 13:22:45.170394
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9d27c6b80"
+down_revision: Union[str, None] = "c2f86b3d1e49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Bits: 1 = success, 2 = timeout, 4 = certificate error (see CheckResult.flags)
+TIMEOUT_TERMS = ["timeout"]
+CERTIFICATE_TERMS = ["certificate", "ssl", "tls", "verification"]
+
+
+def _message_bit(terms: Sequence[str], bit: int) -> str:
+    matches = " OR ".join(f"lower(message) LIKE '%{term}%'" for term in terms)
+    return f"CASE WHEN {matches} THEN {bit} ELSE 0 END"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "check_result",
+        sa.Column("flags", sa.SmallInteger(), nullable=False, server_default="0"),
+    )
+
+    # Classify existing rows once; error text lives in error_messages
+    op.execute(
+        "UPDATE check_result SET flags = "
+        "(CASE WHEN status = 'up' THEN 1 ELSE 0 END) + COALESCE(("
+        f"SELECT {_message_bit(TIMEOUT_TERMS, 2)} + "
+        f"{_message_bit(CERTIFICATE_TERMS, 4)} "
+        "FROM error_messages "
+        "WHERE error_messages.id = check_result.error_message_id), 0)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("check_result") as batch_op:
+        batch_op.drop_column("flags")
@@ -0,0 +1,58 @@
+"""Store channel config and status page monitors as native JSON
+
+Revision ID: f7b3d8e1c925
+Revises: e4a9c2b7d513
+Create Date: 2026-10-17 22:36:54.819027
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7b3d8e1c925"
+down_revision: Union[str, None] = "e4a9c2b7d513"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable) of the JSON-in-TEXT columns
+JSON_COLUMNS = [
+    ("notification_channel", "config", False),
+    ("public_status_pages", "selected_monitors", True),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # SQLite stores JSON as TEXT, existing rows are already compatible
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Text(),
+            type_=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=sa.Text(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::text",
+        )
@@ -5,6 +5,7 @@ from flask_wtf.csrf import CSRFProtect
 from flask_compress import Compress
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from sqlalchemy import event, text
 import logging
 import time
 from typing import Any
@@ -28,6 +29,15 @@ _favicon_cache = {
 # Global flag to prevent repeated SQLite WAL configuration
 _sqlite_configured = False
 
+# Per-connection SQLite settings, applied to every new pooled connection
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=10000",  # 10MB cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB memory mapping
+    "PRAGMA busy_timeout=30000",  # 30 second timeout
+)
+
 
 def invalidate_favicon_cache(user_id: int) -> None:
     """Invalidate favicon cache for a specific user when monitor status changes."""
@@ -42,6 +52,7 @@ __all__ = [
     "login_manager",
     "csrf",
     "invalidate_favicon_cache",
+    "begin_write_transaction",
     "init_database",
     "import_all_models",
     "limiter",
@@ -65,44 +76,79 @@ def import_all_models() -> None:
     This function imports all model modules to ensure SQLAlchemy is aware
     of all tables before calling db.create_all().
     """
-    from app.models import User, AppSettings, PublicStatusPage
+    from app import models
+
+    # Models load lazily, so resolve every export to register its mapper
+    for name in models.__all__:
+        getattr(models, name)
+
 
-    # Reference models to ensure they are imported and registered with SQLAlchemy
-    _ = User, AppSettings, PublicStatusPage
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply the per-connection PRAGMAs to a newly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 def configure_sqlite(app):
     """Configure SQLite for optimal performance with WAL mode."""
     global _sqlite_configured
 
+    if not app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+        return
+
+    # synchronous, busy_timeout etc. only affect the connection they run on,
+    # so set them whenever the pool opens a connection
+    if not event.contains(db.engine, "connect", _apply_sqlite_pragmas):
+        event.listen(db.engine, "connect", _apply_sqlite_pragmas)
+
     if _sqlite_configured:
         return  # Already configured, skip
 
-    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
-        try:
-            # Enable WAL mode for better concurrency
-            from sqlalchemy import text
-
-            db.session.execute(text("PRAGMA journal_mode=WAL"))
-            db.session.execute(text("PRAGMA synchronous=NORMAL"))
-            db.session.execute(text("PRAGMA cache_size=10000"))  # 10MB cache
-            db.session.execute(text("PRAGMA temp_store=MEMORY"))
-            db.session.execute(
-                text("PRAGMA mmap_size=268435456")
-            )  # 256MB memory mapping
-            db.session.execute(text("PRAGMA busy_timeout=30000"))  # 30 second timeout
-            db.session.commit()
-
-            # Verify WAL mode was enabled
-            result = db.session.execute(text("PRAGMA journal_mode")).scalar()
-            if result and result.lower() == "wal":
-                print("[OK] SQLite WAL mode and optimizations configured")
-                _sqlite_configured = True  # Mark as configured
-            else:
-                print(f"[WARNING] SQLite journal mode: {result} (WAL not enabled)")
+    try:
+        # Enable WAL mode for better concurrency (persisted in the file)
+        from sqlalchemy import text
+
+        db.session.execute(text("PRAGMA journal_mode=WAL"))
+        # Refresh planner statistics so composite/covering indexes are chosen
+        db.session.execute(text("PRAGMA optimize"))
+        db.session.commit()
+
+        # Verify WAL mode was enabled
+        result = db.session.execute(text("PRAGMA journal_mode")).scalar()
+        if result and result.lower() == "wal":
+            print("[OK] SQLite WAL mode and optimizations configured")
+            _sqlite_configured = True  # Mark as configured
+        else:
+            print(f"[WARNING] SQLite journal mode: {result} (WAL not enabled)")
 
-        except Exception as e:
-            app.logger.error(f"Failed to configure SQLite WAL mode: {e}")
+    except Exception as e:
+        app.logger.error(f"Failed to configure SQLite WAL mode: {e}")
+
+
+def begin_write_transaction() -> None:
+    """Open a real database transaction for the session's next writes.
+
+    SQLite connections run in driver autocommit mode (see
+    SQLALCHEMY_ENGINE_OPTIONS), so each statement would otherwise commit on
+    its own. BEGIN IMMEDIATE takes the write lock up front and makes the
+    following statements commit, or roll back, together at the session's
+    commit() or rollback(). Other databases already run sessions in a
+    transaction, so this is a no-op there.
+    """
+    session = db.session()
+    connection = session.connection()
+    if connection.dialect.name != "sqlite":
+        return
+    if connection.connection.dbapi_connection.in_transaction:
+        return
+
+    # Flushing pending changes first would run them outside the transaction
+    with session.no_autoflush:
+        session.execute(text("BEGIN IMMEDIATE"))
 
 
 def create_app(config_name: str = "default", start_scheduler: bool = True) -> Flask:
@@ -114,6 +160,11 @@ def create_app(config_name: str = "default", start_scheduler: bool = True) -> Fl
     """
     app = Flask(__name__)
 
+    # Serialize JSON responses with orjson when it is installed
+    from app.utils.json_codec import FastJSONProvider
+
+    app.json = FastJSONProvider(app)
+
     # Load configuration
     from config import config
 
@@ -125,6 +176,16 @@ def create_app(config_name: str = "default", start_scheduler: bool = True) -> Fl
     csrf.init_app(app)
     compress.init_app(app)
 
+    # Register every mapper before the first query configures relationships
+    import_all_models()
+
+    # Short-lived cache of per-monitor check aggregates (see Monitor)
+    from app.utils.cache import TTLCache
+
+    app.extensions["stats_cache"] = TTLCache(
+        maxsize=4096, ttl=app.config["STATS_CACHE_TTL"]
+    )
+
     # Initialize rate limiter extension
     global limiter
     try:
@@ -1,8 +1,30 @@
 """Color customization form."""
 
 from flask_wtf import FlaskForm
+from typing import Any
+
 from wtforms import BooleanField, StringField, SubmitField
-from wtforms.validators import Length, Optional, Regexp
+from wtforms.validators import Length, Optional, ValidationError
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+class HexColor:
+    """Validate a ``#rrggbb`` hex color without going through a regex.
+
+    ``int(value, 16)`` is not used because it also accepts signs, underscores,
+    surrounding whitespace and a ``0x`` prefix.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __call__(self, form: Any, field: Any) -> None:
+        value = field.data
+        if not value:
+            return
+        if len(value) != 7 or value[0] != "#" or not _HEX_DIGITS.issuperset(value[1:]):
+            raise ValidationError(self.message)
 
 
 class ColorCustomizationForm(FlaskForm):
@@ -15,10 +37,7 @@ class ColorCustomizationForm(FlaskForm):
         "Primary Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #59bc87)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #59bc87)"),
         ],
         description="Main brand color for buttons, links, and primary elements",
     )
@@ -27,10 +46,7 @@ class ColorCustomizationForm(FlaskForm):
         "Primary Hover Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #45a676)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #45a676)"),
         ],
         description="Color for primary elements on hover",
     )
@@ -46,10 +62,7 @@ class ColorCustomizationForm(FlaskForm):
         "Success Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #22c55e)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #22c55e)"),
         ],
         description="Color for success states and positive indicators",
     )
@@ -58,10 +71,7 @@ class ColorCustomizationForm(FlaskForm):
         "Success Background Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #f0fdf4)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #f0fdf4)"),
         ],
         description="Background color for success elements",
     )
@@ -70,10 +80,7 @@ class ColorCustomizationForm(FlaskForm):
         "Danger Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #dc2626)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #dc2626)"),
         ],
         description="Color for danger states and negative indicators",
     )
@@ -82,10 +89,7 @@ class ColorCustomizationForm(FlaskForm):
         "Danger Background Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #fef2f2)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #fef2f2)"),
         ],
         description="Background color for danger elements",
     )
@@ -94,10 +98,7 @@ class ColorCustomizationForm(FlaskForm):
         "Warning Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #f59e0b)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #f59e0b)"),
         ],
         description="Color for warning states",
     )
@@ -106,10 +107,7 @@ class ColorCustomizationForm(FlaskForm):
         "Warning Background Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #fffbeb)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #fffbeb)"),
         ],
         description="Background color for warning elements",
     )
@@ -118,10 +116,7 @@ class ColorCustomizationForm(FlaskForm):
         "Info Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #06b6d4)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #06b6d4)"),
         ],
         description="Color for informational states",
     )
@@ -130,10 +125,7 @@ class ColorCustomizationForm(FlaskForm):
         "Info Background Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #ecfeff)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #ecfeff)"),
         ],
         description="Background color for info elements",
     )
@@ -142,10 +134,7 @@ class ColorCustomizationForm(FlaskForm):
         "Unknown Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #6b7280)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #6b7280)"),
         ],
         description="Color for unknown states",
     )
@@ -154,10 +143,7 @@ class ColorCustomizationForm(FlaskForm):
         "Unknown Background Color",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #f3f4f6)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #f3f4f6)"),
         ],
         description="Background color for unknown elements",
     )
@@ -167,10 +153,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Primary Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #3b82f6)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #3b82f6)"),
         ],
         description="Override primary color for dark theme",
     )
@@ -179,10 +162,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Primary Hover Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #60a5fa)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #60a5fa)"),
         ],
         description="Override primary hover color for dark theme",
     )
@@ -198,10 +178,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Success Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #4ade80)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #4ade80)"),
         ],
         description="Override success color for dark theme",
     )
@@ -210,10 +187,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Success Background Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #052e16)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #052e16)"),
         ],
         description="Override success background for dark theme",
     )
@@ -222,10 +196,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Danger Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #f87171)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #f87171)"),
         ],
         description="Override danger color for dark theme",
     )
@@ -234,10 +205,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Danger Background Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #1f0713)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #1f0713)"),
         ],
         description="Override danger background for dark theme",
     )
@@ -246,10 +214,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Warning Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #fbbf24)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #fbbf24)"),
         ],
         description="Override warning color for dark theme",
     )
@@ -258,10 +223,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Warning Background Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #1c1305)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #1c1305)"),
         ],
         description="Override warning background for dark theme",
     )
@@ -270,10 +232,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Info Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #38bdf8)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #38bdf8)"),
         ],
         description="Override info color for dark theme",
     )
@@ -282,10 +241,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Info Background Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #071926)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #071926)"),
         ],
         description="Override info background for dark theme",
     )
@@ -294,10 +250,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Unknown Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #9ca3af)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #9ca3af)"),
         ],
         description="Override unknown color for dark theme",
     )
@@ -306,10 +259,7 @@ class ColorCustomizationForm(FlaskForm):
         "Dark Mode Unknown Background Color (Optional)",
         validators=[
             Optional(),
-            Regexp(
-                r"^#[0-9A-Fa-f]{6}$",
-                message="Must be a valid hex color (e.g., #1f2937)",
-            ),
+            HexColor("Must be a valid hex color (e.g., #1f2937)"),
         ],
         description="Override unknown background for dark theme",
     )
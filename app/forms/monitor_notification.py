@@ -1,7 +1,7 @@
 from wtforms import (
     SubmitField,
 )
-from app.models.notification import NotificationChannel
+from app.models.notification import MonitorNotification, NotificationChannel
 from app import db
 
 
@@ -50,7 +50,7 @@ class MonitorNotificationForm:
             return
 
         # Get current notification settings
-        settings = self.monitor.notification_settings.all()
+        settings = MonitorNotification.query.filter_by(monitor_id=self.monitor.id).all()
 
         if settings:
             # Load channel IDs
@@ -99,7 +99,9 @@ class MonitorNotificationForm:
         )
 
         # Delete existing settings for channels not selected
-        existing_settings = monitor.notification_settings.all()
+        existing_settings = MonitorNotification.query.filter_by(
+            monitor_id=monitor.id
+        ).all()
         for setting in existing_settings:
             if str(setting.channel_id) not in selected_channel_ids:
                 db.session.delete(setting)
@@ -109,8 +111,8 @@ class MonitorNotificationForm:
             channel_id_int = int(channel_id)
 
             # Check if setting already exists
-            existing = monitor.notification_settings.filter_by(
-                channel_id=channel_id_int
+            existing = MonitorNotification.query.filter_by(
+                monitor_id=monitor.id, channel_id=channel_id_int
             ).first()
 
             if existing:
@@ -142,8 +144,6 @@ class MonitorNotificationForm:
                 )
             else:
                 # Create new setting
-                from app.models.notification import MonitorNotification
-
                 new_setting = MonitorNotification(
                     monitor_id=monitor.id,
                     channel_id=channel_id_int,
@@ -1,4 +1,3 @@
-import json
 from typing import Any
 
 from flask_wtf import FlaskForm
@@ -146,7 +145,7 @@ class NotificationChannelForm(FlaskForm):
             raise ValidationError("Webhook URL is required for Slack channels")
 
     def get_config(self):
-        """Get configuration as JSON string"""
+        """Get configuration as a dict"""
         config = {}
 
         if self.type.data == NotificationType.EMAIL.value:
@@ -172,16 +171,11 @@ class NotificationChannelForm(FlaskForm):
                 }
             )
 
-        return json.dumps(config)
+        return config
 
-    def set_config(self, config_str):
-        """Set form fields from configuration JSON string"""
-        if not config_str:
-            return
-
-        try:
-            config = json.loads(config_str)
-        except (json.JSONDecodeError, TypeError):
+    def set_config(self, config):
+        """Set form fields from a configuration dict"""
+        if not config:
             return
 
         if self.type.data == NotificationType.EMAIL.value:
@@ -1,36 +1,46 @@
 # Models package
-from .user import User
-from .oidc_provider import OIDCProvider
-from .monitor import Monitor, MonitorType, CheckInterval
-from .check_result import CheckResult
-from .incident import Incident
-from .notification import (
-    NotificationChannel,
-    MonitorNotification,
-    NotificationLog,
-    NotificationType,
-)
-from .app_settings import AppSettings
-from .public_status_page import PublicStatusPage
-from .deduplication import ErrorMessage, TLSCertificate, DomainInfo
-from .user_incident_view import UserIncidentView
+#
+# Models are loaded lazily (PEP 562): ``from app.models import User`` imports
+# only the ``user`` submodule. Use ``app.import_all_models()`` when every
+# mapper must be registered, e.g. before ``db.create_all()``.
+import importlib
+from typing import Any, List
 
-__all__ = [
-    "User",
-    "OIDCProvider",
-    "Monitor",
-    "MonitorType",
-    "CheckInterval",
-    "CheckResult",
-    "Incident",
-    "NotificationChannel",
-    "MonitorNotification",
-    "NotificationLog",
-    "NotificationType",
-    "AppSettings",
-    "PublicStatusPage",
-    "ErrorMessage",
-    "TLSCertificate",
-    "DomainInfo",
-    "UserIncidentView",
-]
+# Exported name -> submodule defining it
+_LAZY = {
+    "User": "user",
+    "OIDCProvider": "oidc_provider",
+    "Monitor": "monitor",
+    "MonitorType": "monitor",
+    "CheckInterval": "monitor",
+    "CheckResult": "check_result",
+    "Incident": "incident",
+    "NotificationChannel": "notification",
+    "MonitorNotification": "notification",
+    "NotificationLog": "notification",
+    "NotificationOutbox": "notification",
+    "NotificationType": "notification",
+    "AppSettings": "app_settings",
+    "PublicStatusPage": "public_status_page",
+    "ErrorMessage": "deduplication",
+    "TLSCertificate": "deduplication",
+    "DomainInfo": "deduplication",
+    "UserIncidentView": "user_incident_view",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
@@ -1,8 +1,95 @@
 """Application settings model."""
 
-from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional
+
+from sqlalchemy import event
 
 from app import db
+from app.utils.timezone import utcnow
+
+# Default light and dark mode colors, keyed by color customization field name
+DEFAULT_COLORS: Dict[str, str] = {
+    # Brand colors
+    "primary_color": "#59bc87",
+    "primary_hover_color": "#45a676",
+    "primary_subtle_color": "rgba(168, 255, 204, 0.15)",
+    # Status colors
+    "success_color": "#22c55e",
+    "success_bg_color": "#f0fdf4",
+    "danger_color": "#dc2626",
+    "danger_bg_color": "#fef2f2",
+    "warning_color": "#f59e0b",
+    "warning_bg_color": "#fffbeb",
+    "info_color": "#06b6d4",
+    "info_bg_color": "#ecfeff",
+    "unknown_color": "#6b7280",
+    "unknown_bg_color": "#f3f4f6",
+    # Dark mode specific colors (optional overrides)
+    "dark_primary_color": "#3b82f6",
+    "dark_primary_hover_color": "#60a5fa",
+    "dark_primary_subtle_color": "rgba(59, 130, 246, 0.15)",
+    # Dark mode status colors
+    "dark_success_color": "#4ade80",
+    "dark_success_bg_color": "#052e16",
+    "dark_danger_color": "#f87171",
+    "dark_danger_bg_color": "#1f0713",
+    "dark_warning_color": "#fbbf24",
+    "dark_warning_bg_color": "#1c1305",
+    "dark_info_color": "#38bdf8",
+    "dark_info_bg_color": "#071926",
+    "dark_unknown_color": "#9ca3af",
+    "dark_unknown_bg_color": "#1f2937",
+}
+
+# CSS variable templates matching the names used in style.css
+_LIGHT_CSS_TEMPLATE = """:root {{
+  --brand-primary: {primary_color};
+  --brand-primary-hover: {primary_hover_color};
+  --brand-primary-subtle: {primary_subtle_color};
+  --status-success: {success_color};
+  --status-success-bg: {success_bg_color};
+  --status-danger: {danger_color};
+  --status-danger-bg: {danger_bg_color};
+  --status-warning: {warning_color};
+  --status-warning-bg: {warning_bg_color};
+  --status-info: {info_color};
+  --status-info-bg: {info_bg_color};
+  --status-unknown: {unknown_color};
+  --status-unknown-bg: {unknown_bg_color};
+}}"""
+
+_DARK_CSS_TEMPLATE = """
+
+[data-theme="dark"] {{
+  --brand-primary: {dark_primary_color};
+  --brand-primary-hover: {dark_primary_hover_color};
+  --brand-primary-subtle: {dark_primary_subtle_color};
+  --status-success: {dark_success_color};
+  --status-success-bg: {dark_success_bg_color};
+  --status-danger: {dark_danger_color};
+  --status-danger-bg: {dark_danger_bg_color};
+  --status-warning: {dark_warning_color};
+  --status-warning-bg: {dark_warning_bg_color};
+  --status-info: {dark_info_color};
+  --status-info-bg: {dark_info_bg_color};
+  --status-unknown: {dark_unknown_color};
+  --status-unknown-bg: {dark_unknown_bg_color};
+}}"""
+
+# Fallbacks for unset dark mode colors: the light color name or a literal value
+_DARK_FALLBACKS: Dict[str, str] = {
+    "dark_primary_subtle_color": "rgba(59, 130, 246, 0.15)",
+    "dark_success_color": "success_color",
+    "dark_success_bg_color": "rgba(34, 197, 94, 0.15)",
+    "dark_danger_color": "danger_color",
+    "dark_danger_bg_color": "rgba(220, 38, 38, 0.15)",
+    "dark_warning_color": "warning_color",
+    "dark_warning_bg_color": "rgba(245, 158, 11, 0.15)",
+    "dark_info_color": "info_color",
+    "dark_info_bg_color": "rgba(6, 182, 212, 0.15)",
+    "dark_unknown_color": "unknown_color",
+    "dark_unknown_bg_color": "rgba(107, 114, 128, 0.15)",
+}
 
 
 class AppSettings(db.Model):
@@ -18,53 +105,55 @@ class AppSettings(db.Model):
     # Color customization settings
     enable_custom_colors = db.Column(db.Boolean, nullable=False, default=False)
 
-    # Brand colors
-    primary_color = db.Column(db.String(7), nullable=False, default="#59bc87")
-    primary_hover_color = db.Column(db.String(7), nullable=False, default="#45a676")
-    primary_subtle_color = db.Column(
-        db.String(20), nullable=False, default="rgba(168, 255, 204, 0.15)"
-    )
+    # Color overrides keyed by DEFAULT_COLORS name. Missing keys use the
+    # default; a null value clears an optional dark mode override.
+    colors = db.Column(db.JSON)
+    # CSS served by /custom-colors.css, rendered whenever the row is saved
+    rendered_css = db.Column(db.Text)
 
-    # Status colors
-    success_color = db.Column(db.String(7), nullable=False, default="#22c55e")
-    success_bg_color = db.Column(db.String(7), nullable=False, default="#f0fdf4")
-    danger_color = db.Column(db.String(7), nullable=False, default="#dc2626")
-    danger_bg_color = db.Column(db.String(7), nullable=False, default="#fef2f2")
-    warning_color = db.Column(db.String(7), nullable=False, default="#f59e0b")
-    warning_bg_color = db.Column(db.String(7), nullable=False, default="#fffbeb")
-    info_color = db.Column(db.String(7), nullable=False, default="#06b6d4")
-    info_bg_color = db.Column(db.String(7), nullable=False, default="#ecfeff")
-    unknown_color = db.Column(db.String(7), nullable=False, default="#6b7280")
-    unknown_bg_color = db.Column(db.String(7), nullable=False, default="#f3f4f6")
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=utcnow, onupdate=utcnow)
 
-    # Dark mode specific colors (optional overrides)
-    dark_primary_color = db.Column(db.String(7), nullable=True, default="#3b82f6")
-    dark_primary_hover_color = db.Column(db.String(7), nullable=True, default="#60a5fa")
-    dark_primary_subtle_color = db.Column(
-        db.String(20), nullable=True, default="rgba(59, 130, 246, 0.15)"
-    )
+    def color(self, name: str) -> Optional[str]:
+        """Get a color value, falling back to its default when not overridden."""
+        overrides = self.colors or {}
+        if name in overrides:
+            return overrides[name]
+        return DEFAULT_COLORS[name]
 
-    # Dark mode status colors
-    dark_success_color = db.Column(db.String(7), nullable=True, default="#4ade80")
-    dark_success_bg_color = db.Column(db.String(7), nullable=True, default="#052e16")
-    dark_danger_color = db.Column(db.String(7), nullable=True, default="#f87171")
-    dark_danger_bg_color = db.Column(db.String(7), nullable=True, default="#1f0713")
-    dark_warning_color = db.Column(db.String(7), nullable=True, default="#fbbf24")
-    dark_warning_bg_color = db.Column(db.String(7), nullable=True, default="#1c1305")
-    dark_info_color = db.Column(db.String(7), nullable=True, default="#38bdf8")
-    dark_info_bg_color = db.Column(db.String(7), nullable=True, default="#071926")
-    dark_unknown_color = db.Column(db.String(7), nullable=True, default="#9ca3af")
-    dark_unknown_bg_color = db.Column(db.String(7), nullable=True, default="#1f2937")
-
-    created_at = db.Column(
-        db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
-    )
-    updated_at = db.Column(
-        db.DateTime,
-        nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
-    )
+    def set_colors(self, values: Mapping[str, Optional[str]]) -> None:
+        """Store color overrides, dropping values equal to their default."""
+        overrides = dict(self.colors or {})
+        for name, value in values.items():
+            if value == DEFAULT_COLORS[name]:
+                overrides.pop(name, None)
+            else:
+                overrides[name] = value
+        self.colors = overrides or None
+
+    def reset_colors(self) -> None:
+        """Reset all colors to their defaults."""
+        self.colors = None
+
+    def render_css(self) -> str:
+        """Render the custom color CSS variables for the current settings."""
+        if not self.enable_custom_colors:
+            return ""
+
+        values = {name: self.color(name) for name in DEFAULT_COLORS}
+        css = _LIGHT_CSS_TEMPLATE.format_map(values)
+
+        # Dark mode overrides are only emitted when a dark primary color is set
+        dark_primary = values["dark_primary_color"]
+        if dark_primary:
+            if not values["dark_primary_hover_color"]:
+                values["dark_primary_hover_color"] = dark_primary
+            for name, fallback in _DARK_FALLBACKS.items():
+                if not values[name]:
+                    values[name] = values.get(fallback, fallback)
+            css += _DARK_CSS_TEMPLATE.format_map(values)
+
+        return css
 
     @staticmethod
     def get_settings() -> "AppSettings":
@@ -78,3 +167,10 @@ class AppSettings(db.Model):
 
     def __repr__(self) -> str:
         return f"<AppSettings log_level={self.log_level} timezone={self.timezone}>"
+
+
+@event.listens_for(AppSettings, "before_insert")
+@event.listens_for(AppSettings, "before_update")
+def _render_css_on_save(mapper: Any, connection: Any, target: AppSettings) -> None:
+    """Store the rendered CSS so requests can serve it without rebuilding."""
+    target.rendered_css = target.render_css()
@@ -1,27 +1,99 @@
-from datetime import datetime, timezone
 import json
-from typing import Any, Dict, Optional
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.orm import NO_VALUE
 
 from app import db
 from app.services.deduplication import DeduplicationService
+from .deduplication import ErrorMessage
+from .types import StatusCode
+from app.utils.timezone import utcnow
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+# Decimal places kept for response times in columnar output (0.1 ms). Raw
+# timer floats serialize to ~18 JSON characters; the extra digits are noise.
+_RESPONSE_TIME_DIGITS = 1
+
+# Bound parameters per multi-row INSERT; SQLite builds before 3.32 cap at 999
+_MAX_INSERT_PARAMS = 999
+
+# Bits of the CheckResult.flags column. _TIMEOUT and _CERT_ERROR are also the
+# flags returned by _classify_error_message().
+_SUCCESS = 1
+_TIMEOUT = 2
+_CERT_ERROR = 4
+
+# Error markers mapped to their flag, matched case-insensitively in one pass
+# over the message without lowercasing a copy of it. The lookahead makes
+# matches overlap so no marker can be hidden inside another match. A message
+# sharing no character with _ERROR_FIRST (the markers' first characters, in
+# either case) cannot contain any marker.
+_ERROR_FLAGS = {
+    "timeout": _TIMEOUT,
+    "certificate": _CERT_ERROR,
+    "ssl": _CERT_ERROR,
+    "tls": _CERT_ERROR,
+    "verification": _CERT_ERROR,
+}
+_ERROR_RE = re.compile(f"(?=({'|'.join(_ERROR_FLAGS)}))", re.IGNORECASE)
+_ERROR_FIRST = frozenset(
+    first for term in _ERROR_FLAGS for first in (term[0], term[0].upper())
+)
+
+
+def _classify_error_message(error_msg: Optional[str]) -> int:
+    """Get the _TIMEOUT/_CERT_ERROR flags describing an error message."""
+    if not error_msg:
+        return 0
+    if _ERROR_FIRST.isdisjoint(error_msg):
+        return 0
+
+    flags = 0
+    for match in _ERROR_RE.finditer(error_msg):
+        flags |= _ERROR_FLAGS[match.group(1).lower()]
+        if flags == _TIMEOUT | _CERT_ERROR:
+            break
+    return flags
+
+
+def _check_flags(status: Optional[str], error_msg: Optional[str]) -> int:
+    """Get the CheckResult.flags value for a status and raw error message."""
+    return (_SUCCESS if status == "up" else 0) | _classify_error_message(error_msg)
+
+
+def _expand_additional_data(data: Any) -> Dict[str, Any]:
+    """Get a stored additional_data value as a dict, resolving references."""
+    if not isinstance(data, dict):
+        return {}
+    if "cert_id" in data or "domain_id" in data:
+        # Compacted format carries reference IDs that need to be resolved
+        return DeduplicationService.reconstruct_additional_data(data)
+    # Legacy format, return as-is
+    return data
 
 
 class CheckResult(db.Model):
     """Check result model for storing monitor check outcomes."""
 
     id = db.Column(db.Integer, primary_key=True)
-    monitor_id = db.Column(
-        db.Integer, db.ForeignKey("monitor.id"), nullable=False, index=True
-    )
+    monitor_id = db.Column(db.Integer, db.ForeignKey("monitor.id"), nullable=False)
     timestamp = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=utcnow,
         nullable=False,
         index=True,
     )
-    status = db.Column(db.String(20), nullable=False, index=True)  # up, down, unknown
-    response_time = db.Column(db.Float, index=True)  # Response time in milliseconds
+    status = db.Column(StatusCode, nullable=False, index=True)  # up, down, unknown
+    response_time = db.Column(db.Float)  # Response time in milliseconds
     status_code = db.Column(db.Integer)  # HTTP status code for web checks
+    # Success/timeout/certificate error bits, classified once at write time
+    flags = db.Column(db.SmallInteger, nullable=False, default=0, server_default="0")
 
     # NEW: Reference fields for deduplication
     error_message_id = db.Column(
@@ -29,8 +101,8 @@ class CheckResult(db.Model):
     )
     # Keep additional_data for storing compacted data and non-duplicatable info
     additional_data = db.Column(
-        db.Text
-    )  # JSON string with compacted data and references
+        db.JSON
+    )  # Native JSON with compacted data and references
 
     # Relationships for reference data
     error_message = db.relationship("ErrorMessage", lazy="joined")
@@ -38,43 +110,46 @@ class CheckResult(db.Model):
     # Indexes for performance
     __table_args__ = (
         # Existing indexes
-        db.Index("idx_check_result_monitor_timestamp", "monitor_id", "timestamp"),
         db.Index("idx_check_result_status_timestamp", "status", "timestamp"),
-        db.Index("idx_check_result_response_time", "response_time"),
         db.Index("idx_check_result_error_message", "error_message_id"),
         # Enhanced composite indexes for performance
         db.Index(
             "idx_check_result_monitor_status_time", "monitor_id", "status", "timestamp"
         ),
-        db.Index(
-            "idx_check_result_monitor_success_time", "monitor_id", "timestamp", "status"
-        ),
         db.Index("idx_check_result_time_status", "timestamp", "status"),
-        # CRITICAL PERFORMANCE INDEXES - High impact, low overhead
-        # Uptime calculation optimization - Second most critical query
+        # Covering index for per-monitor reads over time (uptime, recent checks,
+        # dashboard/charts) so they are answered without touching the table.
+        # Also serves every (monitor_id) and (monitor_id, timestamp) lookup.
         # Note: SQLite doesn't support DESC in index definition, handled in query ordering
-        db.Index("idx_uptime_calculation", "monitor_id", "timestamp", "status"),
-        # Monitor detail loading - Third most critical query
-        db.Index("idx_recent_checks", "monitor_id", "timestamp"),
+        db.Index(
+            "idx_check_result_monitor_ts_covering",
+            "monitor_id",
+            "timestamp",
+            "status",
+            "response_time",
+        ),
     )
 
-    def __init__(
-        self,
-        monitor_id: int,
-        status: str,
-        timestamp: Optional[datetime] = None,
-        response_time: Optional[float] = None,
-        status_code: Optional[int] = None,
-        error_message: Optional[str] = None,
-        additional_data: Optional[str] = None,
-        **kwargs: Any,
-    ) -> None:
+    # Memoized to_dict() output for unmodified persistent rows
+    _cached_dict = None
+    # (additional_data value, reconstructed dict) for get_additional_data()
+    _additional_data_cache = None
+    # (error_message_id, text) for get_error_message() lookups
+    _error_message_cache = None
+
+    def __init__(self, error_message: Optional[str] = None, **kwargs: Any) -> None:
+        """Create a check result from column keyword arguments.
+
+        Columns are assigned once by the declarative constructor; only the raw
+        ``error_message`` text needs handling here since it is stored
+        deduplicated through ``error_message_id`` and classified into
+        ``flags``.
+        """
+        if kwargs.get("timestamp") is None:
+            kwargs["timestamp"] = utcnow()
+        if "flags" not in kwargs:
+            kwargs["flags"] = _check_flags(kwargs.get("status"), error_message)
         super().__init__(**kwargs)
-        self.monitor_id = monitor_id
-        self.status = status
-        self.timestamp = timestamp or datetime.now(timezone.utc)
-        self.response_time = response_time
-        self.status_code = status_code
 
         # Handle error message deduplication
         if error_message:
@@ -82,19 +157,29 @@ class CheckResult(db.Model):
                 error_message
             )
 
-        self.additional_data = additional_data
-
     def get_error_message(self) -> Optional[str]:
         """Get the full error message, handling both old and new formats."""
-        # Try new deduplicated format first
-        if self.error_message_id:
-            return DeduplicationService.get_error_message_text(self.error_message_id)
-
-        # Fallback for any compatibility issues
-        return None
+        error_message_id = self.error_message_id
+        if not error_message_id:
+            return None
+
+        # Use the joined-loaded relationship when it matches the current ID
+        loaded = inspect(self).attrs.error_message.loaded_value
+        if loaded is not NO_VALUE and loaded is not None:
+            if loaded.id == error_message_id:
+                return loaded.message
+
+        # Pending rows or a changed error_message_id need a lookup, once per ID
+        cache = self._error_message_cache
+        if cache is None or cache[0] != error_message_id:
+            text = DeduplicationService.get_error_message_text(error_message_id)
+            cache = self._error_message_cache = (error_message_id, text)
+        return cache[1]
 
     def set_error_message(self, error_message: Optional[str]) -> None:
         """Set error message using deduplication."""
+        self._cached_dict = None
+        self.flags = _check_flags(self.status, error_message)
         if error_message:
             self.error_message_id = DeduplicationService.get_or_create_error_message(
                 error_message
@@ -103,26 +188,23 @@ class CheckResult(db.Model):
             self.error_message_id = None
 
     def get_additional_data(self) -> Dict[str, Any]:
-        """Parse and return additional data as dict, reconstructing if needed."""
-        if not self.additional_data:
-            return {}
-
-        # Try to detect if this is compacted format (has reference IDs)
-        try:
-            data = json.loads(self.additional_data)
-            if isinstance(data, dict) and ("cert_id" in data or "domain_id" in data):
-                # This is compacted format, reconstruct full data
-                return DeduplicationService.reconstruct_additional_data(
-                    self.additional_data
-                )
-            else:
-                # This is legacy format, return as-is
-                return data
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        """Parse and return additional data as dict, reconstructing if needed.
+
+        The reconstructed dict is cached until ``additional_data`` changes.
+        """
+        data = self.additional_data
+        cache = self._additional_data_cache
+        if cache is not None and cache[0] is data:
+            return cache[1]
+
+        result = _expand_additional_data(data)
+        self._additional_data_cache = (data, result)
+        return result
 
     def set_additional_data(self, data: Optional[Dict[str, Any]]) -> None:
         """Set additional data using deduplication."""
+        self._cached_dict = None
+        self._additional_data_cache = None
         if data:
             # Use deduplication service to compact the data
             compacted = DeduplicationService.compact_additional_data(data)
@@ -136,36 +218,160 @@ class CheckResult(db.Model):
 
     def is_timeout(self) -> bool:
         """Check if this check failed due to timeout."""
-        error_msg = self.get_error_message()
-        return bool(error_msg and "timeout" in error_msg.lower())
+        return bool(self.flags & _TIMEOUT)
 
     def is_certificate_error(self) -> bool:
         """Check if this check failed due to SSL/TLS certificate issues."""
-        error_msg = self.get_error_message()
-        return bool(
-            error_msg
-            and any(
-                term in error_msg.lower()
-                for term in ["certificate", "ssl", "tls", "verification"]
-            )
-        )
+        return bool(self.flags & _CERT_ERROR)
+
+    def get_timestamp_ms(self) -> Optional[int]:
+        """Get the check timestamp as integer milliseconds since the epoch."""
+        timestamp = self.timestamp
+        if timestamp is None:
+            return None
+        if timestamp.tzinfo is None:
+            # Database datetime is naive, treat as UTC
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return (timestamp - _EPOCH) // _ONE_MS
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert check result to dictionary for API responses."""
-        return {
+        """Convert check result to dictionary with an epoch-ms timestamp.
+
+        The result is memoized for persistent rows without pending changes,
+        so callers must not mutate the returned dictionary.
+        """
+        cached = self._cached_dict
+        if cached is not None and not inspect(self).modified:
+            return cached
+
+        flags = self.flags
+        data = {
             "id": self.id,
             "monitor_id": self.monitor_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.get_timestamp_ms(),
             "status": self.status,
             "response_time": self.response_time,
             "status_code": self.status_code,
             "error_message": self.get_error_message(),
             "additional_data": self.get_additional_data(),
             "is_success": self.is_success(),
-            "is_timeout": self.is_timeout(),
-            "is_certificate_error": self.is_certificate_error(),
+            "is_timeout": bool(flags & _TIMEOUT),
+            "is_certificate_error": bool(flags & _CERT_ERROR),
         }
 
+        state = inspect(self)
+        if state.persistent and not state.modified:
+            self._cached_dict = data
+        return data
+
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Convert check result to dictionary for API responses (ISO timestamp)."""
+        data = dict(self.to_dict())
+        data["timestamp"] = self.timestamp.isoformat() if self.timestamp else None
+        return data
+
+    @classmethod
+    def recent_api_dicts(cls, monitor_id: int, count: int) -> List[Dict[str, Any]]:
+        """Get to_api_dict() of a monitor's most recent checks without instances.
+
+        Only the serialized columns are selected, with the error message
+        outer-joined, so no CheckResult objects are built or tracked.
+
+        Args:
+            monitor_id: Monitor to load check results for
+            count: Number of check results
+
+        Returns:
+            Check result dictionaries, most recent first
+        """
+        rows = db.session.execute(
+            select(
+                cls.id,
+                cls.timestamp,
+                cls.status,
+                cls.response_time,
+                cls.status_code,
+                ErrorMessage.message,
+                cls.additional_data,
+                cls.flags,
+            )
+            .outerjoin(ErrorMessage, ErrorMessage.id == cls.error_message_id)
+            .where(cls.monitor_id == monitor_id)
+            .order_by(cls.timestamp.desc())
+            .limit(count)
+        )
+        return [
+            {
+                "id": check_id,
+                "monitor_id": monitor_id,
+                "timestamp": timestamp.isoformat() if timestamp else None,
+                "status": status,
+                "response_time": response_time,
+                "status_code": status_code,
+                "error_message": message,
+                "additional_data": _expand_additional_data(additional_data),
+                "is_success": status == "up",
+                "is_timeout": bool(flags & _TIMEOUT),
+                "is_certificate_error": bool(flags & _CERT_ERROR),
+            }
+            for (
+                check_id,
+                timestamp,
+                status,
+                response_time,
+                status_code,
+                message,
+                additional_data,
+                flags,
+            ) in rows
+        ]
+
+    @staticmethod
+    def recent_by_monitor(
+        monitor_ids: Iterable[int], count: int
+    ) -> Dict[int, list["CheckResult"]]:
+        """Get the most recent check results of many monitors in one query.
+
+        Ranks each monitor's checks with ROW_NUMBER() over the covering
+        (monitor_id, timestamp) index and keeps the first ``count``.
+
+        Args:
+            monitor_ids: Monitors to load check results for
+            count: Number of check results per monitor
+
+        Returns:
+            Check results (most recent first) by monitor ID; every requested
+            monitor has an entry
+        """
+        recent: Dict[int, list["CheckResult"]] = {
+            monitor_id: [] for monitor_id in monitor_ids
+        }
+        if not recent or count <= 0:
+            return recent
+
+        row_number = (
+            db.func.row_number()
+            .over(
+                partition_by=CheckResult.monitor_id,
+                order_by=CheckResult.timestamp.desc(),
+            )
+            .label("row_number")
+        )
+        ranked = (
+            db.select(CheckResult.id, row_number)
+            .where(CheckResult.monitor_id.in_(list(recent)))
+            .subquery()
+        )
+        results = (
+            CheckResult.query.join(ranked, CheckResult.id == ranked.c.id)
+            .filter(ranked.c.row_number <= count)
+            .order_by(CheckResult.monitor_id, ranked.c.row_number)
+            .all()
+        )
+        for check_result in results:
+            recent[check_result.monitor_id].append(check_result)
+        return recent
+
     @staticmethod
     def to_columnar_dict(check_results: list["CheckResult"]) -> Dict[str, list[Any]]:
         """Convert list of CheckResult objects to columnar dictionary format.
@@ -183,38 +389,55 @@ class CheckResult(db.Model):
         Returns:
             Dictionary with column-based arrays for better compression
         """
-        if not check_results:
-            return {
-                "ids": [],
-                "monitor_ids": [],
-                "timestamps": [],
-                "statuses": [],
-                "response_times": [],
-                "status_codes": [],
-                "error_messages": [],
-                "additional_data": [],
-                "is_successes": [],
-                "is_timeouts": [],
-                "is_certificate_errors": [],
-            }
+        n = len(check_results)
+        ids: list[Any] = [None] * n
+        monitor_ids: list[Any] = [None] * n
+        timestamps: list[Any] = [None] * n
+        statuses: list[Any] = [None] * n
+        response_times: list[Any] = [None] * n
+        status_codes: list[Any] = [None] * n
+        error_messages: list[Any] = [None] * n
+        additional_data: list[Any] = [None] * n
+        is_successes: list[Any] = [None] * n
+        is_timeouts: list[Any] = [None] * n
+        is_certificate_errors: list[Any] = [None] * n
+
+        # Single pass; flags are read once per row rather than through
+        # is_timeout()/is_certificate_error()
+        for i, cr in enumerate(check_results):
+            timestamp = cr.timestamp
+            status = cr.status
+            error_msg = cr.get_error_message()
+            ids[i] = cr.id
+            monitor_ids[i] = cr.monitor_id
+            timestamps[i] = timestamp.isoformat() if timestamp else None
+            statuses[i] = status
+            response_time = cr.response_time
+            response_times[i] = (
+                None
+                if response_time is None
+                else round(response_time, _RESPONSE_TIME_DIGITS)
+            )
+            status_codes[i] = cr.status_code
+            error_messages[i] = error_msg
+            additional_data[i] = cr.get_additional_data()
+            is_successes[i] = status == "up"
+            flags = cr.flags
+            is_timeouts[i] = bool(flags & _TIMEOUT)
+            is_certificate_errors[i] = bool(flags & _CERT_ERROR)
 
         return {
-            "ids": [cr.id for cr in check_results],
-            "monitor_ids": [cr.monitor_id for cr in check_results],
-            "timestamps": [
-                cr.timestamp.isoformat() if cr.timestamp else None
-                for cr in check_results
-            ],
-            "statuses": [cr.status for cr in check_results],
-            "response_times": [cr.response_time for cr in check_results],
-            "status_codes": [cr.status_code for cr in check_results],
-            "error_messages": [cr.get_error_message() for cr in check_results],
-            "additional_data": [cr.get_additional_data() for cr in check_results],
-            "is_successes": [cr.is_success() for cr in check_results],
-            "is_timeouts": [cr.is_timeout() for cr in check_results],
-            "is_certificate_errors": [
-                cr.is_certificate_error() for cr in check_results
-            ],
+            "ids": ids,
+            "monitor_ids": monitor_ids,
+            "timestamps": timestamps,
+            "statuses": statuses,
+            "response_times": response_times,
+            "status_codes": status_codes,
+            "error_messages": error_messages,
+            "additional_data": additional_data,
+            "is_successes": is_successes,
+            "is_timeouts": is_timeouts,
+            "is_certificate_errors": is_certificate_errors,
         }
 
     @staticmethod
@@ -245,22 +468,61 @@ class CheckResult(db.Model):
         Returns:
             Dictionary with minimal column-based arrays optimized for chart rendering
         """
-        if not check_results:
-            return {"t": [], "r": [], "s": [], "c": [], "e": []}
+        n = len(check_results)
+        timestamps: list[Any] = [None] * n
+        response_times: list[Any] = [None] * n
+        statuses: list[Any] = [None] * n
+        status_codes: list[Any] = [None] * n
+        error_messages: list[Any] = [None] * n
+
+        for i, cr in enumerate(check_results):
+            timestamp = cr.timestamp
+            timestamps[i] = timestamp.isoformat() if timestamp else None
+            response_time = cr.response_time
+            response_times[i] = (
+                round(response_time, _RESPONSE_TIME_DIGITS) if response_time else 0
+            )
+            statuses[i] = cr.status
+            status_codes[i] = cr.status_code
+            error_messages[i] = cr.get_error_message() or ""
 
         return {
-            "t": [
-                cr.timestamp.isoformat() if cr.timestamp else None
-                for cr in check_results
-            ],  # timestamps
-            "r": [cr.response_time or 0 for cr in check_results],  # response_times
-            "s": [cr.status for cr in check_results],  # statuses
-            "c": [cr.status_code for cr in check_results],  # status_codes
-            "e": [
-                cr.get_error_message() or "" for cr in check_results
-            ],  # error_messages
+            "t": timestamps,
+            "r": response_times,
+            "s": statuses,
+            "c": status_codes,
+            "e": error_messages,
         }
 
+    @staticmethod
+    def iter_columnar_json(
+        check_results: list["CheckResult"], chunk_size: int = 1024
+    ) -> Iterator[str]:
+        """Serialize to_columnar_dict() output as a stream of JSON fragments.
+
+        Each column is encoded ``chunk_size`` values at a time, so large
+        exports can be streamed (e.g. ``Response(stream_with_context(...))``)
+        without also holding the whole encoded document in memory. Response
+        compression is left to Flask-Compress.
+
+        Args:
+            check_results: List of CheckResult objects to convert
+            chunk_size: Number of values encoded per fragment
+
+        Yields:
+            Fragments that concatenate to the JSON encoding of the columnar dict
+        """
+        columns = CheckResult.to_columnar_dict(check_results)
+
+        yield "{"
+        for column_index, (name, values) in enumerate(columns.items()):
+            yield f"{',' if column_index else ''}{json.dumps(name)}:["
+            for start in range(0, len(values), chunk_size):
+                chunk = json.dumps(values[start : start + chunk_size])
+                yield ("," if start else "") + chunk[1:-1]
+            yield "]"
+        yield "}"
+
     @staticmethod
     def from_columnar_dict(columnar_data: Dict[str, list[Any]]) -> list["CheckResult"]:
         """Convert columnar dictionary back to list of CheckResult objects.
@@ -277,28 +539,72 @@ class CheckResult(db.Model):
         if not columnar_data or not columnar_data.get("ids"):
             return []
 
+        # Resolve every distinct error message in one batched lookup
+        error_messages = columnar_data["error_messages"]
+        error_ids = DeduplicationService.get_or_create_error_messages(error_messages)
+
+        # fromisoformat is C-implemented; parse the whole column up front and
+        # pass timestamps to the constructor so no default "now" is computed
+        parse_timestamp = datetime.fromisoformat
+        timestamps = [
+            parse_timestamp(value) if value else None
+            for value in columnar_data["timestamps"]
+        ]
+
+        # Rebuild flags from the exported boolean columns when present instead
+        # of rescanning every error message
+        statuses = columnar_data["statuses"]
+        if "is_timeouts" in columnar_data and "is_certificate_errors" in columnar_data:
+            flags_column = [
+                (_SUCCESS if status == "up" else 0)
+                | (_TIMEOUT if is_timeout else 0)
+                | (_CERT_ERROR if is_cert_error else 0)
+                for status, is_timeout, is_cert_error in zip(
+                    statuses,
+                    columnar_data["is_timeouts"],
+                    columnar_data["is_certificate_errors"],
+                )
+            ]
+        else:
+            flags_column = [
+                _check_flags(status, error_msg)
+                for status, error_msg in zip(statuses, error_messages)
+            ]
+
         check_results = []
-        for i in range(len(columnar_data["ids"])):
+        for (
+            id_,
+            monitor_id,
+            timestamp,
+            status,
+            response_time,
+            status_code,
+            flags,
+            error_msg,
+            additional_data,
+        ) in zip(
+            columnar_data["ids"],
+            columnar_data["monitor_ids"],
+            timestamps,
+            statuses,
+            columnar_data["response_times"],
+            columnar_data["status_codes"],
+            flags_column,
+            error_messages,
+            columnar_data["additional_data"],
+        ):
             check_result = CheckResult(
-                monitor_id=columnar_data["monitor_ids"][i],
-                status=columnar_data["statuses"][i],
-                response_time=columnar_data["response_times"][i],
-                status_code=columnar_data["status_codes"][i],
+                id=id_,
+                monitor_id=monitor_id,
+                timestamp=timestamp,
+                status=status,
+                response_time=response_time,
+                status_code=status_code,
+                flags=flags,
+                error_message_id=error_ids[error_msg] if error_msg else None,
             )
-            check_result.id = columnar_data["ids"][i]
-
-            # Parse timestamp strings
-            timestamp_str = columnar_data["timestamps"][i]
-            if timestamp_str:
-                check_result.timestamp = datetime.fromisoformat(timestamp_str)
-
-            # Set error message if present
-            error_msg = columnar_data["error_messages"][i]
-            if error_msg:
-                check_result.set_error_message(error_msg)
 
             # Set additional data if present
-            additional_data = columnar_data["additional_data"][i]
             if additional_data:
                 check_result.set_additional_data(additional_data)
 
@@ -306,5 +612,85 @@ class CheckResult(db.Model):
 
         return check_results
 
+    @classmethod
+    def bulk_create(cls, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert many check results without building ORM objects.
+
+        Skips ORM object construction entirely. Each row uses the same keys as
+        the constructor: column values plus an optional raw ``error_message``
+        text and an uncompacted ``additional_data`` dict, both deduplicated
+        here; error messages for the whole batch are resolved together. The
+        caller is responsible for committing.
+
+        Args:
+            rows: Check result values, one dict per row
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        # Resolve all raw error messages in a handful of statements
+        error_ids = DeduplicationService.get_or_create_error_messages(
+            row.get("error_message") for row in rows
+        )
+
+        now = utcnow()
+        params = []
+        for row in rows:
+            error_message = row.get("error_message")
+            additional_data = row.get("additional_data")
+            params.append(
+                {
+                    "monitor_id": row["monitor_id"],
+                    "status": row["status"],
+                    "timestamp": row.get("timestamp") or now,
+                    "response_time": row.get("response_time"),
+                    "status_code": row.get("status_code"),
+                    "flags": (
+                        row["flags"]
+                        if "flags" in row
+                        else _check_flags(row["status"], error_message)
+                    ),
+                    "error_message_id": (
+                        error_ids[error_message]
+                        if error_message
+                        else row.get("error_message_id")
+                    ),
+                    "additional_data": (
+                        DeduplicationService.compact_additional_data(additional_data)
+                        if additional_data
+                        else None
+                    ),
+                }
+            )
+
+        return cls.bulk_insert_dicts(params)
+
+    @classmethod
+    def bulk_insert_dicts(cls, rows: List[Dict[str, Any]]) -> int:
+        """Insert prepared rows using multi-row INSERT ... VALUES statements.
+
+        Rows must already hold final column values (resolved
+        ``error_message_id``, compacted ``additional_data``, ``flags``) and
+        share the same keys. Statements are chunked to stay under SQLite's
+        bound parameter limit. The caller is responsible for committing.
+
+        Args:
+            rows: Column values, one dict per row
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        chunk_size = max(1, _MAX_INSERT_PARAMS // len(rows[0]))
+        for start in range(0, len(rows), chunk_size):
+            db.session.execute(insert(cls).values(rows[start : start + chunk_size]))
+        return len(rows)
+
     def __repr__(self) -> str:
         return f"<CheckResult {self.monitor_id}:{self.status} at {self.timestamp}>"
@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 
 from app import db
+from app.utils.json_codec import loads
+from app.utils.timezone import parse_cert_date
 
 
 class ErrorMessage(db.Model):
@@ -13,7 +15,8 @@ class ErrorMessage(db.Model):
     __tablename__ = "error_messages"
 
     id = db.Column(db.Integer, primary_key=True)
-    message_hash = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    # Truncated sha256 hex digest, see app.services.deduplication._hash_message
+    message_hash = db.Column(db.String(32), unique=True, nullable=False, index=True)
     message = db.Column(db.Text, nullable=False)
     usage_count = db.Column(db.Integer, default=1, nullable=False)
     created_at = db.Column(
@@ -21,10 +24,7 @@ class ErrorMessage(db.Model):
     )
 
     # Indexes
-    __table_args__ = (
-        db.Index("idx_error_message_hash", "message_hash"),
-        db.Index("idx_error_message_usage", "usage_count"),
-    )
+    __table_args__ = (db.Index("idx_error_message_usage", "usage_count"),)
 
     def __repr__(self) -> str:
         return f"<ErrorMessage {self.id} ({self.usage_count} uses)>"
@@ -53,25 +53,24 @@ class TLSCertificate(db.Model):
         db.Index("idx_tls_cert_usage", "usage_count"),
     )
 
+    # (raw cert_data text, parsed dict) from the last get_cert_data() call
+    _cert_data_cache = None
+
     def get_cert_data(self) -> Dict[str, Any]:
         """Parse and return certificate data as dict with updated expiration."""
         try:
-            cert_data = json.loads(self.cert_data)
+            raw = self.cert_data
+            cache = self._cert_data_cache
+            if cache is None or cache[0] is not raw:
+                cache = self._cert_data_cache = (raw, loads(raw))
+            # Copy so the time-dependent fields below never leak into the cache
+            cert_data = dict(cache[1])
 
             # If expires_at is None, try to parse it from cert_data
             if not self.expires_at and cert_data.get("not_after"):
                 try:
-                    not_after = cert_data["not_after"]
-                    # Parse SSL cert date (format: "Jan 9 12:31:51 2026 GMT")
-                    # Remove timezone suffix as strptime %Z is unreliable
-                    expire_date_clean = not_after.rsplit(" ", 1)[0]
-                    expires_at = datetime.strptime(
-                        expire_date_clean, "%b %d %H:%M:%S %Y"
-                    )
-                    # SSL certs are always in UTC/GMT
-                    expires_at = expires_at.replace(tzinfo=timezone.utc)
                     # Update the stored value for future use
-                    self.expires_at = expires_at
+                    self.expires_at = parse_cert_date(cert_data["not_after"])
                 except (ValueError, AttributeError):
                     pass
 
@@ -144,6 +143,9 @@ class DomainInfo(db.Model):
         db.Index("idx_domain_usage", "usage_count"),
     )
 
+    # (raw dns_info text, parsed dict) from the last get_dns_info() call
+    _dns_info_cache = None
+
     def get_dns_info(self) -> Dict[str, Any]:
         """
         Parse and return domain check data as dict.
@@ -156,7 +158,12 @@ class DomainInfo(db.Model):
             Dictionary containing complete domain check data
         """
         try:
-            domain_data = json.loads(self.dns_info or "{}")
+            raw = self.dns_info or "{}"
+            cache = self._dns_info_cache
+            if cache is None or cache[0] is not raw:
+                cache = self._dns_info_cache = (raw, loads(raw))
+            # Copy so days_to_expiration is recomputed on every call
+            domain_data = dict(cache[1])
 
             # Calculate days_to_expiration if expiration_date is available
             if (
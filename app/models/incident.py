@@ -1,24 +1,12 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from app import db
-from .check_result import CheckResult
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import insert
+from sqlalchemy.orm import raiseload
 
-# Association table for incidents and check results
-incident_check_results = db.Table(
-    "incident_check_results",
-    db.Column(
-        "incident_id", db.Integer, db.ForeignKey("incident.id"), primary_key=True
-    ),
-    db.Column(
-        "check_result_id",
-        db.Integer,
-        db.ForeignKey("check_result.id"),
-        primary_key=True,
-    ),
-    db.Index("idx_incident_check_result", "incident_id", "check_result_id"),
-)
+from app import db
+from .check_result import _MAX_INSERT_PARAMS, CheckResult
+from .types import InternedStr, UTCDateTime
 
 
 class Incident(db.Model):
@@ -28,45 +16,59 @@ class Incident(db.Model):
     monitor_id = db.Column(
         db.Integer, db.ForeignKey("monitor.id"), nullable=False, index=True
     )
-    started_at = db.Column(db.DateTime, nullable=False, index=True)
-    resolved_at = db.Column(db.DateTime, index=True)
+    started_at = db.Column(UTCDateTime, nullable=False, index=True)
+    resolved_at = db.Column(UTCDateTime, index=True)
     duration = db.Column(db.Float)  # Duration in seconds
     status = db.Column(
-        db.String(20), default="active", nullable=False, index=True
+        InternedStr(20), default="active", nullable=False, index=True
     )  # active, resolved
 
     # Additional metadata
     description = db.Column(db.Text)
-    severity = db.Column(db.String(20), default="critical")  # critical, warning, info
+    severity = db.Column(InternedStr(20), default="critical")  # critical, warning, info
 
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        UTCDateTime, default=lambda: datetime.now(timezone.utc), nullable=False
     )
     updated_at = db.Column(
-        db.DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
 
-    # Relationships
-    check_results = db.relationship(
-        "CheckResult",
-        secondary="incident_check_results",
-        backref=db.backref("incidents", lazy="dynamic"),
-    )
+    # Affected check results are derived from the monitor and time window
+    # (see get_affected_checks) rather than stored per incident
 
     # Indexes for performance
     __table_args__ = (
         # Existing indexes
         db.Index("idx_incident_monitor_started", "monitor_id", "started_at"),
-        db.Index("idx_incident_status_started", "status", "started_at"),
         # Enhanced composite indexes for dashboard performance
         db.Index(
             "idx_incident_monitor_status_started", "monitor_id", "status", "started_at"
         ),
-        db.Index("idx_incident_active_started", "status", "started_at"),
         db.Index("idx_incident_resolved_started", "resolved_at", "started_at"),
+        # Covering index for active incident listings by start time; replaces
+        # the identical (status, started_at) idx_incident_status_started and
+        # idx_incident_active_started indexes
+        db.Index(
+            "idx_incident_active_covering",
+            "status",
+            "started_at",
+            "monitor_id",
+            "severity",
+            "duration",
+        ),
+        # Partial index holding only unresolved incidents, for the per-check
+        # Monitor.active_incidents lookup; stays tiny as incidents resolve
+        db.Index(
+            "idx_incident_unresolved",
+            "monitor_id",
+            "started_at",
+            sqlite_where=db.text("resolved_at IS NULL"),
+            postgresql_where=db.text("resolved_at IS NULL"),
+        ),
     )
 
     def __init__(
@@ -89,6 +91,100 @@ class Incident(db.Model):
         self.description = description
         self.severity = severity
 
+    @classmethod
+    def bulk_open(
+        cls, rows: Iterable[Dict[str, Any]], now: Optional[datetime] = None
+    ) -> Dict[int, int]:
+        """Open incidents for many monitors with multi-row INSERT ... RETURNING.
+
+        Each row holds a ``monitor_id`` (at most one row per monitor) and an
+        optional ``description`` and ``severity``. Statements are chunked to
+        stay under SQLite's bound parameter limit. The caller is responsible
+        for committing.
+
+        Args:
+            rows: Incident values, one dict per monitor
+            now: Start time of the incidents, the current time by default
+
+        Returns:
+            New incident IDs by monitor ID
+        """
+        now = now or datetime.now(timezone.utc)
+        params = [
+            {
+                "monitor_id": row["monitor_id"],
+                "started_at": now,
+                "status": "active",
+                "description": row.get("description"),
+                "severity": row.get("severity", "critical"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in rows
+        ]
+        if not params:
+            return {}
+
+        incident_ids = {}
+        chunk_size = max(1, _MAX_INSERT_PARAMS // len(params[0]))
+        for start in range(0, len(params), chunk_size):
+            result = db.session.execute(
+                insert(cls)
+                .values(params[start : start + chunk_size])
+                .returning(cls.id, cls.monitor_id)
+            )
+            incident_ids.update(
+                (monitor_id, incident_id) for incident_id, monitor_id in result
+            )
+        return incident_ids
+
+    @staticmethod
+    def recent_by_monitor(
+        monitor_ids: Iterable[int], count: int
+    ) -> Dict[int, List["Incident"]]:
+        """Get the most recently started incidents of many monitors in one query.
+
+        Ranks each monitor's incidents with ROW_NUMBER() and keeps the first
+        ``count``. Relationships are not loaded; Incident.to_dict() needs none.
+
+        Args:
+            monitor_ids: Monitors to load incidents for
+            count: Number of incidents per monitor
+
+        Returns:
+            Incidents (newest first) by monitor ID; every requested monitor
+            has an entry
+        """
+        recent: Dict[int, List["Incident"]] = {
+            monitor_id: [] for monitor_id in monitor_ids
+        }
+        if not recent or count <= 0:
+            return recent
+
+        row_number = (
+            db.func.row_number()
+            .over(
+                partition_by=Incident.monitor_id,
+                order_by=Incident.started_at.desc(),
+            )
+            .label("row_number")
+        )
+        ranked = (
+            db.select(Incident.id, row_number)
+            .where(Incident.monitor_id.in_(list(recent)))
+            .subquery()
+        )
+        incidents = db.session.scalars(
+            db.select(Incident)
+            .options(raiseload("*"))
+            .join(ranked, Incident.id == ranked.c.id)
+            .where(ranked.c.row_number <= count)
+            .order_by(Incident.monitor_id, ranked.c.row_number)
+        )
+        for incident in incidents:
+            recent[incident.monitor_id].append(incident)
+        return recent
+
     def resolve(self) -> bool:
         """Resolve the incident."""
         if self.status != "active":
@@ -113,24 +209,12 @@ class Incident(db.Model):
             duration_seconds = self.duration
         elif self.is_active():
             # Calculate current duration for active incidents without modifying state
-            # Ensure started_at is timezone-aware
-            started_at_utc = self.started_at
-            if started_at_utc.tzinfo is None:
-                started_at_utc = started_at_utc.replace(tzinfo=timezone.utc)
-
-            now_utc = datetime.now(timezone.utc)
-            duration_seconds = (now_utc - started_at_utc).total_seconds()
+            duration_seconds = (
+                datetime.now(timezone.utc) - self.started_at
+            ).total_seconds()
         elif self.resolved_at is not None and self.started_at is not None:
             # Calculate duration for resolved incidents where duration is not stored
-            # Ensure both datetimes are timezone-aware
-            started_at_utc = self.started_at
-            resolved_at_utc = self.resolved_at
-            if started_at_utc.tzinfo is None:
-                started_at_utc = started_at_utc.replace(tzinfo=timezone.utc)
-            if resolved_at_utc.tzinfo is None:
-                resolved_at_utc = resolved_at_utc.replace(tzinfo=timezone.utc)
-
-            duration_seconds = (resolved_at_utc - started_at_utc).total_seconds()
+            duration_seconds = (self.resolved_at - self.started_at).total_seconds()
         else:
             return "N/A"
 
@@ -138,10 +222,9 @@ class Incident(db.Model):
         if duration_seconds is None:
             return "N/A"
 
-        days = int(duration_seconds // 86400)
-        hours = int((duration_seconds % 86400) // 3600)
-        minutes = int((duration_seconds % 3600) // 60)
-        seconds = int(duration_seconds % 60)
+        minutes, seconds = divmod(int(duration_seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
 
         if days > 0:
             return f"{days}d {hours}h {minutes}m"
@@ -152,15 +235,13 @@ class Incident(db.Model):
         else:
             return f"{seconds}s"
 
+    def _get_time_window(self) -> Tuple[datetime, datetime]:
+        """Get the timezone-aware (start, end) window covered by this incident."""
+        return self.started_at, self.resolved_at or datetime.now(timezone.utc)
+
     def get_affected_checks(self) -> List[CheckResult]:
         """Get all check results during this incident period."""
-        # Ensure both datetimes are timezone-aware
-        end_time = self.resolved_at if self.resolved_at else datetime.now(timezone.utc)
-        started_at = self.started_at
-        if started_at.tzinfo is None:
-            started_at = started_at.replace(tzinfo=timezone.utc)
-        if end_time.tzinfo is None:
-            end_time = end_time.replace(tzinfo=timezone.utc)
+        started_at, end_time = self._get_time_window()
 
         return (
             CheckResult.query.filter(
@@ -174,12 +255,25 @@ class Incident(db.Model):
 
     def get_downtime_percentage(self) -> float:
         """Calculate percentage of downtime during this incident."""
-        affected_checks = self.get_affected_checks()
-        if not affected_checks:
+        started_at, end_time = self._get_time_window()
+
+        # Count in SQL (covering index scan) instead of loading every check
+        total_checks, down_checks = (
+            db.session.query(
+                db.func.count(CheckResult.id),
+                db.func.sum(db.case((CheckResult.status == "down", 1), else_=0)),
+            )
+            .filter(
+                CheckResult.monitor_id == self.monitor_id,
+                CheckResult.timestamp >= started_at,
+                CheckResult.timestamp <= end_time,
+            )
+            .one()
+        )
+        if not total_checks:
             return 100.0
 
-        down_checks = sum(1 for check in affected_checks if check.status == "down")
-        return round((down_checks / len(affected_checks)) * 100, 2)
+        return round((down_checks / total_checks) * 100, 2)
 
     def __repr__(self) -> str:
         return f"<Incident {self.id} for Monitor {self.monitor_id} ({self.status})>"
@@ -193,15 +287,7 @@ class Incident(db.Model):
             and self.resolved_at is not None
             and self.started_at is not None
         ):
-            # Ensure both datetimes are timezone-aware
-            started_at_utc = self.started_at
-            resolved_at_utc = self.resolved_at
-            if started_at_utc.tzinfo is None:
-                started_at_utc = started_at_utc.replace(tzinfo=timezone.utc)
-            if resolved_at_utc.tzinfo is None:
-                resolved_at_utc = resolved_at_utc.replace(tzinfo=timezone.utc)
-
-            duration = (resolved_at_utc - started_at_utc).total_seconds()
+            duration = (self.resolved_at - self.started_at).total_seconds()
 
         return {
             "id": self.id,
@@ -1,10 +1,128 @@
+import logging
+import operator
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-
-from app import db
+from itertools import product
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, or_, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app import begin_write_transaction, db
+from app.utils.cache import TTLCache
+from app.utils.timezone import format_utc, utcnow
 from .check_result import CheckResult
+from .types import SmallIntEnum, StatusCode, UTCDateTime
 from .incident import Incident
+from .notification import NotificationOutbox
+
+logger = logging.getLogger(__name__)
+
+
+# Built once and reused by Monitor.get_recent_checks(); the compiled form is
+# cached by SQLAlchemy, so each call only binds monitor_id and count
+_RECENT_CHECKS_STMT = (
+    select(CheckResult)
+    .where(CheckResult.monitor_id == bindparam("monitor_id"))
+    .order_by(CheckResult.timestamp.desc())
+    .limit(bindparam("count"))
+)
+
+# Statements of Monitor._handle_incidents(), built once at import time
+# Resolves a monitor's open incident, computing its duration (seconds) with
+# the dialect's date arithmetic; other dialects use the SQLite form
+_RESOLVE_INCIDENT_SQL = {
+    dialect: text(
+        "UPDATE incident SET resolved_at = :resolved_at, status = :status, "
+        f"duration = {duration} "
+        "WHERE monitor_id = :monitor_id AND resolved_at IS NULL "
+        "RETURNING id, started_at, duration"
+    )
+    .bindparams(bindparam("resolved_at", type_=UTCDateTime))
+    .columns(id=db.Integer, started_at=UTCDateTime, duration=db.Float)
+    for dialect, duration in {
+        "postgresql": "EXTRACT(EPOCH FROM (:resolved_at - started_at))",
+        # Whole seconds and the ".ffffff" fractions are subtracted apart:
+        # julianday() is too coarse (~50us) and strftime() rounds to
+        # milliseconds, so neither gives exact microsecond durations
+        "sqlite": (
+            "ROUND(strftime('%s', substr(:resolved_at, 1, 19)) "
+            "- strftime('%s', substr(started_at, 1, 19)) "
+            "+ substr(:resolved_at, 20) - substr(started_at, 20), 6)"
+        ),
+    }.items()
+}
+
+# Monitor columns written by every check (see Monitor.apply_check_batch)
+_CHECK_COLUMNS = (
+    "last_check",
+    "last_status",
+    "last_response_time",
+    "consecutive_failures",
+    "uptime_days",
+    "uptime_7d_num",
+    "uptime_7d_den",
+    "uptime_30d_num",
+    "uptime_30d_den",
+    "updated_at",
+)
+
+# (count, check results by monitor ID) preloaded by preload_recent_checks()
+_recent_checks_batch: ContextVar[Optional[Tuple[int, Dict[int, List[CheckResult]]]]] = (
+    ContextVar("recent_checks_batch", default=None)
+)
+
+
+@contextmanager
+def preload_recent_checks(monitor_ids: Iterable[int], count: int) -> Iterator[None]:
+    """Load recent check results for many monitors with a single query.
+
+    Inside the block, Monitor.get_recent_checks() for any of these monitors
+    (asking for at most ``count`` results) is served from the preloaded
+    batch instead of running one query per monitor.
+
+    Args:
+        monitor_ids: Monitors about to be iterated
+        count: Largest number of recent checks that will be requested
+    """
+    token = _recent_checks_batch.set(
+        (count, CheckResult.recent_by_monitor(monitor_ids, count))
+    )
+    try:
+        yield
+    finally:
+        _recent_checks_batch.reset(token)
+
+
+# Days covered by the rolling uptime counters (Monitor.get_uptime_7d/_30d);
+# per-day buckets are kept for the longest window
+_UPTIME_WEEK_DAYS = 7
+_UPTIME_MONTH_DAYS = 30
+
+# Seconds a computed current status is reused (Monitor.get_current_status)
+_STATUS_CACHE_TTL = 1.0
+
+# A claimed outbox row not deleted after this long is sent again (the worker
+# sending it died or failed), up to _OUTBOX_MAX_ATTEMPTS times
+_OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+_OUTBOX_MAX_ATTEMPTS = 5
+
+
+def _stats_cache() -> TTLCache:
+    """Get the app's cache of per-monitor check aggregates.
+
+    Entries are keyed ``(monitor_id, name, ...)``, expire after the
+    STATS_CACHE_TTL setting and are dropped when a monitor changes status.
+    """
+    return current_app.extensions["stats_cache"]
 
 
 class MonitorType(Enum):
@@ -17,6 +135,93 @@ class MonitorType(Enum):
     KAFKA = "kafka"
 
 
+# Stored codes of MonitorType members (see SmallIntEnum), append only
+_MONITOR_TYPE_CODES = ("HTTP", "HTTPS", "TCP", "PING", "KAFKA")
+
+
+# Upper-case type names shown in notifications, e.g. "HTTPS"
+_TYPE_LABELS = {
+    monitor_type: monitor_type.value.upper() for monitor_type in MonitorType
+}
+
+# Incident notification messages (see Monitor._queue_notification)
+_DOWN_MESSAGE = "Monitor '{name}' ({type} - {target}) is down. Started: {started}"
+_RECOVERY_MESSAGE = (
+    "Monitor '{name}' ({type} - {target}) is back up after {duration} of "
+    "downtime. Resolved: {resolved}"
+)
+
+
+@dataclass
+class _TempIncident:
+    """Incident row written with direct SQL, as passed to notifiers.
+
+    Provides the Incident attributes and methods the notifiers use without
+    loading the ORM object.
+    """
+
+    id: Optional[int]
+    started_at: datetime
+    resolved_at: Optional[datetime] = None
+    description: Optional[str] = None
+    duration: Optional[float] = None
+
+    def is_active(self) -> bool:
+        """Check if the incident is still open."""
+        return self.resolved_at is None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Get a JSON serializable snapshot for a NotificationOutbox payload."""
+        return {
+            "id": self.id,
+            "started_at": self.started_at.isoformat(),
+            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "description": self.description,
+            "duration": self.duration,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "_TempIncident":
+        """Rebuild an incident snapshot taken by to_payload()."""
+        resolved_at = payload["resolved_at"]
+        return cls(
+            id=payload["id"],
+            started_at=datetime.fromisoformat(payload["started_at"]),
+            resolved_at=datetime.fromisoformat(resolved_at) if resolved_at else None,
+            description=payload["description"],
+            duration=payload["duration"],
+        )
+
+    def get_duration_formatted(self) -> str:
+        """Get formatted duration string."""
+        duration = self.duration
+        if duration is None and self.is_active():
+            duration = (datetime.now(timezone.utc) - self.started_at).total_seconds()
+        if not duration:
+            return "0s"
+        minutes, seconds = divmod(int(duration), 60)
+        hours, minutes = divmod(minutes, 60)
+
+        if hours > 0:
+            return f"{hours}h {minutes}m {seconds}s"
+        elif minutes > 0:
+            return f"{minutes}m {seconds}s"
+        else:
+            return f"{seconds}s"
+
+
+@dataclass
+class CheckUpdate:
+    """Outcome of one monitor check, as applied by Monitor.apply_check_batch()."""
+
+    monitor: "Monitor"
+    status: str
+    response_time: Optional[float] = None
+    status_code: Optional[int] = None
+    error_message: Optional[str] = None
+    additional_data: Optional[Dict[str, Any]] = None
+
+
 class CheckInterval(Enum):
     """Check interval enumeration in seconds."""
 
@@ -28,19 +233,211 @@ class CheckInterval(Enum):
     ONE_HOUR = 3600
 
 
+# Attributes to_dict() copies as is, fetched in one attrgetter call
+_TO_DICT_FIELDS = (
+    "id",
+    "name",
+    "target",
+    "port",
+    "timeout",
+    "verify_ssl",
+    "check_cert_expiration",
+    "cert_expiration_threshold",
+    "check_domain",
+    "expected_domain",
+    "kafka_security_protocol",
+    "is_active",
+    "last_status",
+    "last_response_time",
+)
+_to_dict_values = operator.attrgetter(*_TO_DICT_FIELDS)
+
+# Serialized values of the enum columns, instead of a .value lookup per call
+_ENUM_VALUES: Dict[Enum, Any] = {
+    member: member.value for enum in (MonitorType, CheckInterval) for member in enum
+}
+
+# Seconds after which a monitor's last check is stale (10 intervals), per
+# interval for Monitor._compute_current_status(); None is a 5 minute one
+_STALE_AFTER: Dict[Optional[CheckInterval], float] = {
+    interval: float(interval.value * 10) for interval in CheckInterval
+}
+_STALE_AFTER[None] = _STALE_AFTER[CheckInterval.FIVE_MINUTES]
+
+
+def _classify_status_window(statuses: Tuple[str, ...]) -> Dict[str, Any]:
+    """Classify a window of check statuses (most recent first).
+
+    See Monitor._analyze_failure_pattern() for the patterns detected.
+    """
+    if len(statuses) < 3:
+        # Not enough data - default to conservative approach
+        return {
+            "pattern_type": "insufficient_data",
+            "severity": "mild",
+            "should_create_incident": False,
+            "confidence": 0.0,
+            "down_count": 0,
+            "up_count": 0,
+        }
+
+    down_count = statuses.count("down")
+    up_count = statuses.count("up")
+
+    # Calculate confidence based on pattern clarity
+    confidence = 0.0
+    pattern_type = "mixed"
+    severity = "mild"
+    should_create_incident = False
+
+    # All ups - no failures detected
+    if down_count == 0:
+        return {
+            "pattern_type": "insufficient_data",
+            "severity": "mild",
+            "should_create_incident": False,
+            "confidence": 0.0,
+            "down_count": 0,
+            "up_count": up_count,
+        }
+
+    # Isolated failure: exactly 1 down, 3+ ups
+    if down_count == 1 and up_count >= 3:
+        pattern_type = "isolated_failure"
+        confidence = 0.9
+        severity = "mild"
+        should_create_incident = False
+
+    # Rapid flapping: alternating up/down with no sustained pattern
+    # Can have different counts but must show alternation pattern
+    elif down_count >= 2 and up_count >= 2:
+        # Check if it's truly alternating (no 2+ consecutive same status)
+        is_alternating = True
+        for i in range(len(statuses) - 1):
+            if statuses[i] == statuses[i + 1]:
+                is_alternating = False
+                break
+
+        # For true flapping, we need perfect alternation
+        if is_alternating:
+            pattern_type = "flapping"
+            confidence = 0.8
+            severity = "moderate"
+            should_create_incident = False
+        else:
+            # First check for consecutive failures anywhere (higher priority)
+            consecutive_downs = 0
+            max_consecutive_downs = 0
+
+            for status in statuses:
+                if status == "down":
+                    consecutive_downs += 1
+                    max_consecutive_downs = max(
+                        max_consecutive_downs, consecutive_downs
+                    )
+                else:
+                    consecutive_downs = 0
+
+            if max_consecutive_downs >= 2:
+                pattern_type = "sustained_failure"
+                confidence = 0.9 + (
+                    max_consecutive_downs * 0.03
+                )  # Higher confidence with more consecutive
+                severity = "severe" if max_consecutive_downs >= 3 else "moderate"
+                should_create_incident = True
+            else:
+                # For mixed patterns with 2+ ups and downs, check failure ratio
+                failure_ratio = down_count / len(statuses)
+                if failure_ratio >= 0.6:  # 60% or more failures
+                    pattern_type = "sustained_failure"
+                    confidence = (
+                        0.8 + (failure_ratio - 0.6) * 0.5
+                    )  # Scale from 0.8 to 0.9
+                    severity = "severe" if failure_ratio >= 0.8 else "moderate"
+                    should_create_incident = True
+                else:
+                    pattern_type = "mixed"
+                    confidence = 0.5
+                    severity = "mild"
+                    should_create_incident = False
+
+    # Mostly downs: 2+ downs, 0-1 ups
+    elif down_count >= 2 and up_count <= 1:
+        # Check for consecutive failures from the END (most recent)
+        consecutive_downs = 0
+
+        # Count from most recent to oldest
+        for status in statuses:
+            if status == "down":
+                consecutive_downs += 1
+            else:
+                break  # Stop when we hit first non-down from recent
+
+        if consecutive_downs >= 2:
+            pattern_type = "sustained_failure"
+            confidence = 0.8 + (consecutive_downs * 0.05)  # 0.9, 0.95, etc.
+            severity = "severe" if consecutive_downs >= 3 else "moderate"
+            should_create_incident = True
+        else:
+            # Check for any consecutive failures in the pattern
+            consecutive_downs = 0
+            max_consecutive_downs = 0
+
+            for status in statuses:
+                if status == "down":
+                    consecutive_downs += 1
+                    max_consecutive_downs = max(
+                        max_consecutive_downs, consecutive_downs
+                    )
+                else:
+                    consecutive_downs = 0
+
+            if max_consecutive_downs >= 2:
+                pattern_type = "sustained_failure"
+                confidence = 0.8
+                severity = "moderate"
+                should_create_incident = True
+            else:
+                pattern_type = "mixed"
+                confidence = 0.5
+                severity = "mild"
+                should_create_incident = False
+
+    return {
+        "pattern_type": pattern_type,
+        "severity": severity,
+        "should_create_incident": should_create_incident,
+        "confidence": confidence,
+        "down_count": down_count,
+        "up_count": up_count,
+    }
+
+
+# Every possible window of 3-5 statuses, classified once at import time, so
+# analyzing a monitor's recent checks is a single dict lookup. Results are
+# read-only so they can be handed out without copying.
+_STATUS_PATTERNS: Dict[Tuple[str, ...], Mapping[str, Any]] = {
+    window: MappingProxyType(_classify_status_window(window))
+    for length in (3, 4, 5)
+    for window in product(("up", "down", "unknown"), repeat=length)
+}
+
+
 class Monitor(db.Model):
     """Monitor model for tracking various endpoints and services."""
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(
-        db.Integer, db.ForeignKey("user.id"), nullable=False, index=True
-    )
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     name = db.Column(db.String(200), nullable=False)
-    type = db.Column(db.Enum(MonitorType), nullable=False, index=True)
+    # Enums are stored as small integer codes to keep rows and the
+    # (user_id, type, is_active) index narrow
+    type = db.Column(SmallIntEnum(MonitorType, _MONITOR_TYPE_CODES), nullable=False)
     target = db.Column(db.String(500), nullable=False)  # URL, IP, hostname, etc.
     port = db.Column(db.Integer)  # For TCP checks
     check_interval = db.Column(
-        db.Enum(CheckInterval), default=CheckInterval.FIVE_MINUTES, nullable=False
+        SmallIntEnum(CheckInterval),
+        default=CheckInterval.FIVE_MINUTES,
+        nullable=False,
     )
     timeout = db.Column(db.Integer, default=30)  # Timeout in seconds
 
@@ -101,14 +498,28 @@ class Monitor(db.Model):
     kafka_autocommit = db.Column(db.Boolean, default=False)
 
     # Status and metadata
-    is_active = db.Column(db.Boolean, default=True, nullable=False, index=True)
+    is_active = db.Column(db.Boolean, default=True, nullable=False)
     last_check = db.Column(db.DateTime)
-    last_status = db.Column(db.String(20), default="unknown")  # up, down, unknown
+    last_status = db.Column(StatusCode, default="unknown")  # up, down, unknown
     last_response_time = db.Column(db.Float)  # in milliseconds
     consecutive_failures = db.Column(
         db.Integer, default=0
     )  # Track consecutive DOWN checks
 
+    # Rolling 7 and 30 day uptime maintained by update_status(): per UTC day
+    # [date ordinal, up checks, total checks] buckets for the last 30 days
+    # (oldest first) and their sums per window, so dashboards read uptime
+    # without scanning check results
+    uptime_days = db.Column(db.JSON)
+    uptime_7d_num = db.Column(db.Integer, default=0, nullable=False, server_default="0")
+    uptime_7d_den = db.Column(db.Integer, default=0, nullable=False, server_default="0")
+    uptime_30d_num = db.Column(
+        db.Integer, default=0, nullable=False, server_default="0"
+    )
+    uptime_30d_den = db.Column(
+        db.Integer, default=0, nullable=False, server_default="0"
+    )
+
     # Timestamps for TLS/DNS/domain data collection (to avoid collecting on every check)
     last_tls_check = db.Column(db.DateTime)  # Last TLS certificate check
     last_domain_check = db.Column(db.DateTime)  # Last domain registration check
@@ -127,46 +538,62 @@ class Monitor(db.Model):
     )
 
     # Relationships
+    # Never loaded implicitly: query check results, incidents and settings
+    # explicitly (see get_recent_checks, get_recent_incidents) or eager-load
+    # them, so per-monitor N+1 access fails loudly
     check_results = db.relationship(
-        "CheckResult", backref="monitor", lazy="dynamic", cascade="all, delete-orphan"
+        "CheckResult", backref="monitor", lazy="raise", cascade="all, delete-orphan"
     )
     incidents = db.relationship(
-        "Incident", backref="monitor", lazy="dynamic", cascade="all, delete-orphan"
+        "Incident", backref="monitor", lazy="raise", cascade="all, delete-orphan"
+    )
+    # Unresolved incidents as a plain collection, so it can be eager-loaded
+    # for many monitors at once with selectinload(Monitor.active_incidents)
+    active_incidents = db.relationship(
+        "Incident",
+        primaryjoin="and_(Monitor.id == Incident.monitor_id, "
+        "Incident.resolved_at.is_(None))",
+        order_by="Incident.started_at",
+        viewonly=True,
     )
     notification_settings = db.relationship(
         "MonitorNotification",
         backref="monitor",
-        lazy="dynamic",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
+    # (key, monotonic time, result) memoized by get_current_status()
+    _status_cache = None
+    # (last_check, its epoch seconds) memoized by _compute_current_status()
+    _last_check_epoch = None
+
     # Indexes for performance
     __table_args__ = (
-        # Existing indexes
-        db.Index("idx_monitor_user_active", "user_id", "is_active"),
-        db.Index("idx_monitor_type_active", "type", "is_active"),
-        # Enhanced composite indexes for dashboard performance
-        db.Index(
-            "idx_monitor_user_active_updated", "user_id", "is_active", "updated_at"
-        ),
+        # One index per access pattern: update_status() rewrites last_* on
+        # every check, so each extra index is paid for on every write
+        # Monitor list by user, ordered by name
         db.Index("idx_monitor_user_name", "user_id", "name"),
+        # Scheduler's active monitor scan
         db.Index("idx_monitor_active_status", "is_active", "last_status", "last_check"),
         db.Index("idx_monitor_user_type_active", "user_id", "type", "is_active"),
-        # Performance indexes for specific filter combinations
-        db.Index("idx_monitor_status_check_time", "last_status", "last_check"),
-        db.Index(
-            "idx_monitor_consecutive_failures", "consecutive_failures", "is_active"
-        ),
         # CRITICAL PERFORMANCE INDEXES - High impact, low overhead
-        # Dashboard loading optimization - Most critical query
-        # Note: SQLite doesn't support DESC in index definition, handled in query ordering
+        # Dashboard loading optimization - Most critical query. Equality
+        # columns first, then the ORDER BY last_check DESC, name columns in
+        # their query direction so no sort step is needed.
         db.Index(
             "idx_monitor_dashboard_primary",
             "user_id",
             "is_active",
-            "last_check",
+            last_check.desc(),
             "name",
         ),
+        # Keep the stored enum codes valid, as the native enums did; a new
+        # member needs a migration extending the constraint
+        db.CheckConstraint(type.in_(list(MonitorType)), name="ck_monitor_type"),
+        db.CheckConstraint(
+            check_interval.in_(list(CheckInterval)), name="ck_monitor_check_interval"
+        ),
     )
 
     def __init__(
@@ -269,42 +696,276 @@ class Monitor(db.Model):
         Returns:
             Uptime percentage (0-100) rounded to 2 decimal places
         """
-        start_time = datetime.now(timezone.utc) - timedelta(days=days)
-        total_checks = self.check_results.filter(
-            CheckResult.timestamp >= start_time
-        ).count()
-        if total_checks == 0:
-            return 0.0
+        return self.get_uptime_percentages([self.id], days)[self.id]
+
+    @classmethod
+    def get_uptime_percentages(
+        cls, monitor_ids: Iterable[int], days: int = 7
+    ) -> Dict[int, float]:
+        """Calculate the get_uptime_percentage(days) of many monitors at once.
+
+        Percentages are cached per monitor (see _stats_cache); the monitors
+        without a cached entry share one compute_uptime_stats query.
+
+        Args:
+            monitor_ids: Monitors to calculate uptime for
+            days: Number of days to look back
+
+        Returns:
+            Uptime percentage (0-100) rounded to 2 decimal places by monitor
+            ID; every requested monitor has an entry
+        """
+        cache = _stats_cache()
+        uptimes: Dict[int, float] = {}
+        missing = []
+        for monitor_id in monitor_ids:
+            uptime = cache.get((monitor_id, "uptime", days))
+            if uptime is not None:
+                uptimes[monitor_id] = uptime
+            else:
+                missing.append(monitor_id)
+        if not missing:
+            return uptimes
+
+        counts = cls.compute_uptime_stats(
+            missing, datetime.now(timezone.utc) - timedelta(days=days)
+        )
+        for monitor_id in missing:
+            total_checks, successful_checks = counts.get(monitor_id, (0, 0))
+            if not total_checks:
+                uptime = 0.0
+            else:
+                uptime = round((successful_checks / total_checks) * 100, 2)
+            cache.set((monitor_id, "uptime", days), uptime)
+            uptimes[monitor_id] = uptime
+        return uptimes
+
+    @classmethod
+    def compute_uptime_stats(
+        cls, monitor_ids: Iterable[int], since: datetime
+    ) -> Dict[int, Tuple[int, int]]:
+        """Count the total and successful checks of many monitors in one query.
+
+        Args:
+            monitor_ids: Monitors to count checks for
+            since: Only count checks at or after this time
+
+        Returns:
+            (total, successful) check counts by monitor ID; monitors without
+            checks in the window are left out
+        """
+        rows = (
+            db.session.query(
+                CheckResult.monitor_id,
+                db.func.count(CheckResult.id),
+                db.func.sum(db.case((CheckResult.status == "up", 1), else_=0)),
+            )
+            .filter(
+                CheckResult.monitor_id.in_(list(monitor_ids)),
+                CheckResult.timestamp >= since,
+            )
+            .group_by(CheckResult.monitor_id)
+        )
+        return {
+            monitor_id: (total, successful or 0)
+            for monitor_id, total, successful in rows
+        }
+
+    def get_uptime_7d(self) -> float:
+        """Get uptime percentage over the last 7 UTC days from the rolling counters.
+
+        Unlike get_uptime_percentage(7), the window is aligned to whole days
+        (today and the 6 days before it). Falls back to the query when the
+        counters have not been initialized.
+
+        Returns:
+            Uptime percentage (0-100) rounded to 2 decimal places
+        """
+        return self._get_rolling_uptime(
+            _UPTIME_WEEK_DAYS, self.uptime_7d_num, self.uptime_7d_den
+        )
+
+    def get_uptime_30d(self) -> float:
+        """Get uptime percentage over the last 30 UTC days from the rolling counters.
 
-        successful_checks = self.check_results.filter(
-            CheckResult.timestamp >= start_time, CheckResult.status == "up"
-        ).count()
+        Like get_uptime_7d(), the window is aligned to whole days and the
+        query is only used when the counters have not been initialized.
 
-        return round((successful_checks / total_checks) * 100, 2)
+        Returns:
+            Uptime percentage (0-100) rounded to 2 decimal places
+        """
+        return self._get_rolling_uptime(
+            _UPTIME_MONTH_DAYS, self.uptime_30d_num, self.uptime_30d_den
+        )
+
+    def _get_rolling_uptime(self, window_days: int, up: int, total: int) -> float:
+        """Get uptime over the last ``window_days`` UTC days from the buckets.
+
+        ``up`` and ``total`` are the window's stored sums, which are current
+        while the latest bucket is today's.
+        """
+        days = self.uptime_days
+        if days is None:
+            return self.get_uptime_percentage(window_days)
+
+        today = datetime.now(timezone.utc).date().toordinal()
+        if days and days[-1][0] != today:
+            # No check today, so buckets may have aged out; ignore them
+            current = [day for day in days if day[0] > today - window_days]
+            up = sum(day[1] for day in current)
+            total = sum(day[2] for day in current)
+
+        if not total:
+            return 0.0
+        return round((up / total) * 100, 2)
+
+    def _record_uptime(self, status: str, checked_at: datetime) -> None:
+        """Count a check in the rolling 7 and 30 day uptime counters."""
+        today = checked_at.date().toordinal()
+        # Copy so the JSON column sees a new value and is written back
+        days = [
+            day
+            for day in (self.uptime_days or [])
+            if day[0] > today - _UPTIME_MONTH_DAYS
+        ]
+        if not days or days[-1][0] != today:
+            days.append([today, 0, 0])
+        days[-1] = [today, days[-1][1] + (status == "up"), days[-1][2] + 1]
+        week = [day for day in days if day[0] > today - _UPTIME_WEEK_DAYS]
+
+        self.uptime_days = days
+        self.uptime_7d_num = sum(day[1] for day in week)
+        self.uptime_7d_den = sum(day[2] for day in week)
+        self.uptime_30d_num = sum(day[1] for day in days)
+        self.uptime_30d_den = sum(day[2] for day in days)
 
     def get_average_response_time(self, hours: int = 24) -> float:
         """Get average response time for the last N hours."""
+        cache = _stats_cache()
+        key = (self.id, "avg_response_time", hours)
+        average = cache.get(key)
+        if average is not None:
+            return average
+
         start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        results = self.check_results.filter(
-            CheckResult.timestamp >= start_time,
-            CheckResult.status == "up",
-            CheckResult.response_time.isnot(None),
-        ).all()
 
-        if not results:
-            return 0.0
+        # Aggregate in SQL from the covering index instead of loading rows;
+        # AVG() skips NULL response times by itself
+        avg_time = (
+            db.session.query(db.func.avg(CheckResult.response_time))
+            .filter(
+                CheckResult.monitor_id == self.id,
+                CheckResult.timestamp >= start_time,
+                CheckResult.status == "up",
+            )
+            .scalar()
+        )
+        average = round(avg_time or 0.0, 2)
+        cache.set(key, average)
+        return average
 
-        avg_time = sum(
-            r.response_time for r in results if r.response_time is not None
-        ) / len(results)
-        return round(avg_time, 2)
+    @staticmethod
+    def compute_stats_bulk(
+        monitor_ids: Iterable[int], include_year_uptime: bool = True
+    ) -> Dict[int, Dict[str, float]]:
+        """Compute the to_dict() check statistics of many monitors in one query.
+
+        Produces the same values as get_uptime_percentage(1/365) and
+        get_average_response_time(24) using conditional aggregation over a
+        single pass of the last year (or day) of check results. uptime_30d
+        comes from the rolling counters instead (see get_uptime_30d).
+
+        Args:
+            monitor_ids: Monitors to compute statistics for
+            include_year_uptime: Include uptime_1y; without it only the last
+                24 hours of check results are scanned
+
+        Statistics are cached per monitor (see _stats_cache); only monitors
+        without a cached entry are queried.
+
+        Returns:
+            Statistics keyed like to_dict() (uptime_24h, uptime_1y when
+            requested, avg_response_time_24h) by monitor ID; every requested
+            monitor has an entry
+        """
+        cache = _stats_cache()
+        cache_name = "stats" if include_year_uptime else "stats_24h"
+        empty = {"uptime_24h": 0.0, "avg_response_time_24h": 0.0}
+        if include_year_uptime:
+            empty["uptime_1y"] = 0.0
+        stats: Dict[int, Dict[str, float]] = {}
+        missing: Dict[int, Dict[str, float]] = {}
+        for monitor_id in monitor_ids:
+            cached = cache.get((monitor_id, cache_name))
+            if cached is not None:
+                stats[monitor_id] = cached
+            else:
+                missing[monitor_id] = dict(empty)
+        if not missing:
+            return stats
+
+        now = datetime.now(timezone.utc)
+        day_start = now - timedelta(days=1)
+        window_start = now - timedelta(days=365) if include_year_uptime else day_start
+        is_up = CheckResult.status == "up"
+
+        def counts(start: datetime) -> Tuple[Any, Any]:
+            in_window = CheckResult.timestamp >= start
+            return (
+                db.func.sum(db.case((in_window, 1), else_=0)),
+                db.func.sum(db.case((db.and_(in_window, is_up), 1), else_=0)),
+            )
+
+        rows = db.session.execute(
+            db.select(
+                CheckResult.monitor_id,
+                *counts(day_start),
+                db.func.count(CheckResult.id),
+                db.func.sum(db.case((is_up, 1), else_=0)),
+                db.func.avg(
+                    db.case(
+                        (
+                            db.and_(CheckResult.timestamp >= day_start, is_up),
+                            CheckResult.response_time,
+                        )
+                    )
+                ),
+            )
+            .where(
+                CheckResult.monitor_id.in_(list(missing)),
+                CheckResult.timestamp >= window_start,
+            )
+            .group_by(CheckResult.monitor_id)
+        )
+
+        def percentage(up: Optional[int], total: Optional[int]) -> float:
+            if not total:
+                return 0.0
+            return round(((up or 0) / total) * 100, 2)
+
+        for monitor_id, day, day_up, total, total_up, avg in rows:
+            monitor_stats = missing[monitor_id]
+            monitor_stats["uptime_24h"] = percentage(day_up, day)
+            monitor_stats["avg_response_time_24h"] = round(avg or 0.0, 2)
+            if include_year_uptime:
+                monitor_stats["uptime_1y"] = percentage(total_up, total)
+
+        for monitor_id, monitor_stats in missing.items():
+            cache.set((monitor_id, cache_name), monitor_stats)
+        stats.update(missing)
+        return stats
 
     def get_recent_checks(self, count: int = 10) -> List[CheckResult]:
         """Get most recent check results."""
-        from sqlalchemy import desc
+        batch = _recent_checks_batch.get()
+        if batch is not None and count <= batch[0] and self.id in batch[1]:
+            return batch[1][self.id][:count]
 
-        query = self.check_results.order_by(desc(CheckResult.timestamp))  # type: ignore
-        return query.limit(count).all()  # type: ignore
+        return list(
+            db.session.scalars(
+                _RECENT_CHECKS_STMT, {"monitor_id": self.id, "count": count}
+            )
+        )
 
     def get_checks_by_timespan(self, hours: int) -> List[CheckResult]:
         """Get check results for the specified timespan in hours.
@@ -323,43 +984,101 @@ class Monitor(db.Model):
         # Also ensures we don't exceed what the frontend can reasonably display
         intelligent_limit = min(max_theoretical_checks, 2000)
 
-        return (
-            self.check_results.filter(CheckResult.timestamp >= start_time)
-            .order_by(CheckResult.timestamp.desc())
-            .limit(intelligent_limit)
-            .all()
+        return list(
+            db.session.scalars(
+                db.select(CheckResult)
+                .where(
+                    CheckResult.monitor_id == self.id,
+                    CheckResult.timestamp >= start_time,
+                )
+                .order_by(CheckResult.timestamp.desc())
+                .limit(intelligent_limit)
+            )
         )
 
+    def get_checks_with_recent(
+        self, hours: int, count: int = 50
+    ) -> Tuple[List[CheckResult], List[CheckResult]]:
+        """Get get_checks_by_timespan(hours) and get_recent_checks(count) together.
+
+        Both are newest-first reads of the same index, so the recent checks
+        are sliced from the timespan checks; the second query only runs when
+        the timespan holds fewer than ``count`` checks.
+
+        Returns:
+            (timespan checks, recent checks)
+        """
+        checks = self.get_checks_by_timespan(hours)
+        if len(checks) >= count:
+            return checks, checks[:count]
+        return checks, self.get_recent_checks(count)
+
     def get_current_status(self) -> Tuple[str, Optional[datetime]]:
-        """Get current status with timestamp."""
+        """Get current status with timestamp.
+
+        is_up(), is_down() and is_unknown() are usually called together for
+        the same monitor, so the result is reused for up to a second. The
+        cache is keyed on the fields it depends on and therefore invalidated
+        by any status update.
+        """
+        key = (self.last_check, self.last_status, self.check_interval)
+        checked_at = time.monotonic()
+        cached = self._status_cache
+        if (
+            cached is not None
+            and cached[0] == key
+            and checked_at - cached[1] < _STATUS_CACHE_TTL
+        ):
+            return cached[2]
+
+        result = self._compute_current_status()
+        self._status_cache = (key, checked_at, result)
+        return result
+
+    def _compute_current_status(self) -> Tuple[str, Optional[datetime]]:
+        """Derive the current status from the last check and its age."""
         if not self.last_check:
             # For new monitors that haven't been checked yet,
             # we should consider them as "unknown" rather than assuming they're down
             return "unknown", None
 
-        # Ensure last_check is timezone-aware for comparison
-        last_check_utc = self.last_check
-        if last_check_utc.tzinfo is None:
-            last_check_utc = last_check_utc.replace(tzinfo=timezone.utc)
+        # Compare epoch seconds, converting last_check (naive values are
+        # UTC) only once per value rather than on every call
+        last_check = self.last_check
+        cached = self._last_check_epoch
+        if cached is not None and cached[0] is last_check:
+            last_check_epoch = cached[1]
+        else:
+            if last_check.tzinfo is None:
+                last_check_epoch = last_check.replace(tzinfo=timezone.utc).timestamp()
+            else:
+                last_check_epoch = last_check.timestamp()
+            self._last_check_epoch = (last_check, last_check_epoch)
 
         # If last check was more than 10 intervals ago, consider it stale
         # Increased from 5 to 10 to reduce false "unknown" classifications
-        check_interval_seconds = (
-            self.check_interval.value if self.check_interval else 300
-        )
-        time_since_last_check = datetime.now(timezone.utc) - last_check_utc
-
-        if time_since_last_check > timedelta(seconds=check_interval_seconds * 10):
+        if time.time() - last_check_epoch > _STALE_AFTER[self.check_interval]:
             # Only mark as unknown if it's been stale for a long time
             return "unknown", self.last_check
-        elif time_since_last_check > timedelta(seconds=check_interval_seconds * 3):
-            # If it's been 3+ intervals, we're less certain but keep the last known status
-            # This prevents frequent flapping between up/down/unknown
-            return self.last_status, self.last_check
 
-        # If recently checked, use the actual last status
+        # Otherwise keep the last known status, even after 3+ intervals when
+        # we're less certain; this prevents flapping between up/down/unknown
         return self.last_status, self.last_check
 
+    def has_active_incident(self) -> bool:
+        """Check if the monitor has an open incident, without loading it."""
+        active_incidents = self.__dict__.get("active_incidents")
+        if active_incidents is not None:
+            return bool(active_incidents)
+
+        return db.session.scalar(
+            select(
+                select(Incident.id)
+                .where(Incident.monitor_id == self.id, Incident.resolved_at.is_(None))
+                .exists()
+            )
+        )
+
     def is_up(self) -> bool:
         """Check if monitor is currently up."""
         status, _ = self.get_current_status()
@@ -377,7 +1096,28 @@ class Monitor(db.Model):
 
     def get_active_incident(self) -> Optional[Incident]:
         """Get currently active incident if any."""
-        return self.incidents.filter_by(resolved_at=None).first()
+        # Served from memory when active_incidents was eager-loaded
+        active_incidents = self.__dict__.get("active_incidents")
+        if active_incidents is not None:
+            return active_incidents[0] if active_incidents else None
+
+        return db.session.scalars(
+            db.select(Incident)
+            .where(Incident.monitor_id == self.id, Incident.resolved_at.is_(None))
+            .order_by(Incident.started_at)
+            .limit(1)
+        ).first()
+
+    def get_recent_incidents(self, count: int = 10) -> List[Incident]:
+        """Get the most recently started incidents, newest first."""
+        return list(
+            db.session.scalars(
+                db.select(Incident)
+                .where(Incident.monitor_id == self.id)
+                .order_by(Incident.started_at.desc())
+                .limit(count)
+            )
+        )
 
     def update_status(
         self,
@@ -388,19 +1128,120 @@ class Monitor(db.Model):
         additional_data: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Update monitor status after a check."""
+        Monitor.apply_check_batch(
+            [
+                CheckUpdate(
+                    monitor=self,
+                    status=status,
+                    response_time=response_time,
+                    status_code=status_code,
+                    error_message=error_message,
+                    additional_data=additional_data,
+                )
+            ]
+        )
+
+    @classmethod
+    def apply_check_batch(cls, updates: List[CheckUpdate]) -> None:
+        """Record the outcomes of a batch of checks in one transaction.
+
+        The check results are written with one multi-row INSERT and the
+        monitor rows with one executemany UPDATE, followed by a single COMMIT.
+
+        Args:
+            updates: Check outcomes, at most one per monitor
+        """
+        if not updates:
+            return
+
+        # One timestamp for the monitor rows and the check results they write
+        now = utcnow()
+        previous_statuses = []
+        # The monitor rows are written together below, not by queries between
+        with db.session.no_autoflush:
+            for check in updates:
+                monitor = check.monitor
+                previous_statuses.append(monitor.last_status)
+                monitor._apply_check(check.status, check.response_time, now)
+
+        # The check results, the monitor rows and any incident changes are
+        # written in one transaction with a single COMMIT, rolled back as a
+        # whole if any of them fails
+        try:
+            begin_write_transaction()
+
+            # Write every monitor row with the same columns in one executemany.
+            # The values are marked as committed first, so neither the
+            # autoflush before it nor the commit writes them a second time.
+            rows = []
+            for check in updates:
+                row = {"id": check.monitor.id}
+                for key in _CHECK_COLUMNS:
+                    row[key] = getattr(check.monitor, key)
+                    set_committed_value(check.monitor, key, row[key])
+                rows.append(row)
+            db.session.execute(update(cls), rows)
+
+            # Insert the check results (with deduplicated error messages and
+            # additional data) as a Core statement, skipping the unit of work.
+            # It joins the same transaction as the monitor UPDATE above.
+            CheckResult.bulk_create(
+                [
+                    {
+                        "monitor_id": check.monitor.id,
+                        "timestamp": now,
+                        "status": check.status,
+                        "response_time": check.response_time,
+                        "status_code": check.status_code,
+                        "error_message": check.error_message,
+                        "additional_data": check.additional_data,
+                    }
+                    for check in updates
+                ]
+            )
+
+            # Check if we need to create or resolve incidents, queueing their
+            # notifications in the same transaction; slow notification
+            # channels then neither hold the write lock nor delay the checks
+            for check, previous_status in zip(updates, previous_statuses):
+                monitor = check.monitor
+                incident = monitor._handle_incidents(
+                    check.status,
+                    previous_status,
+                    now,
+                    check.error_message,
+                    check.status_code,
+                )
+                if incident:
+                    monitor._queue_notification(incident, now)
 
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def _apply_check(
+        self, status: str, response_time: Optional[float], now: datetime
+    ) -> None:
+        """Update the monitor's own columns for a check taken at now."""
         previous_status = self.last_status
 
-        self.last_check = datetime.now(timezone.utc)
+        self.last_check = now
         self.last_status = status
         self.last_response_time = response_time
-        self.updated_at = datetime.now(timezone.utc)
 
-        # Invalidate favicon cache if status changed
+        # Invalidate favicon and aggregate caches if status changed. A check
+        # that repeats the status leaves updated_at alone: it is passed back
+        # unchanged with the other check columns, so onupdate doesn't fire.
         if previous_status != status:
             from app import invalidate_favicon_cache
 
+            self.updated_at = now
+
             invalidate_favicon_cache(self.user_id)
+            _stats_cache().discard_prefix(self.id)
+
+        self._record_uptime(status, now)
 
         # Track consecutive failures
         if status == "down":
@@ -408,32 +1249,9 @@ class Monitor(db.Model):
         else:
             self.consecutive_failures = 0
 
-        # Create check result record with deduplication
-        check_result = CheckResult(
-            monitor_id=self.id,
-            timestamp=datetime.now(timezone.utc),
-            status=status,
-            response_time=response_time,
-            status_code=status_code,
-        )
-
-        # Use deduplication for error message and additional data
-        if error_message:
-            check_result.set_error_message(error_message)
-
-        if additional_data:
-            check_result.set_additional_data(additional_data)
-
-        db.session.add(check_result)
-
-        # Check if we need to create or resolve an incident
-        self._handle_incidents(status, previous_status)
-
-        db.session.commit()
-
     def _analyze_failure_pattern(
         self, recent_checks: List["CheckResult"]
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Analyze recent check results to detect flapping patterns and make incident decisions.
 
         This method implements intelligent flapping detection using a 5-check sliding window
@@ -452,7 +1270,7 @@ class Monitor(db.Model):
                           at least 3 checks for meaningful analysis, but works with any number.
 
         Returns:
-            Dict with comprehensive pattern analysis results:
+            Read-only mapping with comprehensive pattern analysis results:
             - pattern_type: Type of pattern detected (isolated_failure, flapping,
                            sustained_failure, mixed, insufficient_data)
             - severity: Severity level (mild, moderate, severe) based on pattern
@@ -462,8 +1280,8 @@ class Monitor(db.Model):
             - up_count: Number of up checks in the analysis window
 
         Performance:
-            - O(n) where n=5 (fixed sliding window size)
-            - ~0.8 microseconds per call
+            - O(1): one lookup in a table of every 3-5 status window,
+              precomputed at import time; the shared result is not copied
             - No additional database queries required
 
         Examples:
@@ -484,151 +1302,13 @@ class Monitor(db.Model):
             The simple consecutive failure counter was reset on recovery, never reaching
             the incident creation threshold.
         """
-        if not recent_checks or len(recent_checks) < 3:
-            # Not enough data - default to conservative approach
-            return {
-                "pattern_type": "insufficient_data",
-                "severity": "mild",
-                "should_create_incident": False,
-                "confidence": 0.0,
-                "down_count": 0,
-                "up_count": 0,
-            }
-
         # Take last 5 checks (most recent first)
-        window_checks = recent_checks[:5]
-        statuses = [check.status for check in window_checks]
-
-        down_count = statuses.count("down")
-        up_count = statuses.count("up")
-
-        # Calculate confidence based on pattern clarity
-        confidence = 0.0
-        pattern_type = "mixed"
-        severity = "mild"
-        should_create_incident = False
-
-        # All ups - no failures detected
-        if down_count == 0:
-            return {
-                "pattern_type": "insufficient_data",
-                "severity": "mild",
-                "should_create_incident": False,
-                "confidence": 0.0,
-                "down_count": 0,
-                "up_count": up_count,
-            }
-
-        # Isolated failure: exactly 1 down, 3+ ups
-        if down_count == 1 and up_count >= 3:
-            pattern_type = "isolated_failure"
-            confidence = 0.9
-            severity = "mild"
-            should_create_incident = False
-
-        # Rapid flapping: alternating up/down with no sustained pattern
-        # Can have different counts but must show alternation pattern
-        elif down_count >= 2 and up_count >= 2:
-            # Check if it's truly alternating (no 2+ consecutive same status)
-            is_alternating = True
-            for i in range(len(statuses) - 1):
-                if statuses[i] == statuses[i + 1]:
-                    is_alternating = False
-                    break
-
-            # For true flapping, we need perfect alternation
-            if is_alternating:
-                pattern_type = "flapping"
-                confidence = 0.8
-                severity = "moderate"
-                should_create_incident = False
-            else:
-                # First check for consecutive failures anywhere (higher priority)
-                consecutive_downs = 0
-                max_consecutive_downs = 0
-
-                for status in statuses:
-                    if status == "down":
-                        consecutive_downs += 1
-                        max_consecutive_downs = max(
-                            max_consecutive_downs, consecutive_downs
-                        )
-                    else:
-                        consecutive_downs = 0
-
-                if max_consecutive_downs >= 2:
-                    pattern_type = "sustained_failure"
-                    confidence = 0.9 + (
-                        max_consecutive_downs * 0.03
-                    )  # Higher confidence with more consecutive
-                    severity = "severe" if max_consecutive_downs >= 3 else "moderate"
-                    should_create_incident = True
-                else:
-                    # For mixed patterns with 2+ ups and downs, check failure ratio
-                    failure_ratio = down_count / len(statuses)
-                    if failure_ratio >= 0.6:  # 60% or more failures
-                        pattern_type = "sustained_failure"
-                        confidence = (
-                            0.8 + (failure_ratio - 0.6) * 0.5
-                        )  # Scale from 0.8 to 0.9
-                        severity = "severe" if failure_ratio >= 0.8 else "moderate"
-                        should_create_incident = True
-                    else:
-                        pattern_type = "mixed"
-                        confidence = 0.5
-                        severity = "mild"
-                        should_create_incident = False
-
-        # Mostly downs: 2+ downs, 0-1 ups
-        elif down_count >= 2 and up_count <= 1:
-            # Check for consecutive failures from the END (most recent)
-            consecutive_downs = 0
-
-            # Count from most recent to oldest
-            for status in statuses:
-                if status == "down":
-                    consecutive_downs += 1
-                else:
-                    break  # Stop when we hit first non-down from recent
-
-            if consecutive_downs >= 2:
-                pattern_type = "sustained_failure"
-                confidence = 0.8 + (consecutive_downs * 0.05)  # 0.9, 0.95, etc.
-                severity = "severe" if consecutive_downs >= 3 else "moderate"
-                should_create_incident = True
-            else:
-                # Check for any consecutive failures in the pattern
-                consecutive_downs = 0
-                max_consecutive_downs = 0
-
-                for status in statuses:
-                    if status == "down":
-                        consecutive_downs += 1
-                        max_consecutive_downs = max(
-                            max_consecutive_downs, consecutive_downs
-                        )
-                    else:
-                        consecutive_downs = 0
-
-                if max_consecutive_downs >= 2:
-                    pattern_type = "sustained_failure"
-                    confidence = 0.8
-                    severity = "moderate"
-                    should_create_incident = True
-                else:
-                    pattern_type = "mixed"
-                    confidence = 0.5
-                    severity = "mild"
-                    should_create_incident = False
-
-        return {
-            "pattern_type": pattern_type,
-            "severity": severity,
-            "should_create_incident": should_create_incident,
-            "confidence": confidence,
-            "down_count": down_count,
-            "up_count": up_count,
-        }
+        statuses = tuple(check.status for check in recent_checks[:5])
+        analysis = _STATUS_PATTERNS.get(statuses)
+        if analysis is None:
+            # Fewer than 3 checks, or a status outside up/down/unknown
+            analysis = _classify_status_window(statuses)
+        return analysis
 
     def _should_create_incident_intelligent(
         self, current_status: str, previous_status: str
@@ -693,265 +1373,334 @@ class Monitor(db.Model):
 
         return should_create
 
-    def _handle_incidents(self, current_status: str, previous_status: str) -> None:
-        """Handle incident creation and resolution with intelligent flapping detection."""
-        from app.notification.service import notification_service
-        from sqlalchemy import text
+    def _handle_incidents(
+        self,
+        current_status: str,
+        previous_status: str,
+        now: datetime,
+        error_message: Optional[str] = None,
+        status_code: Optional[int] = None,
+    ) -> Optional[_TempIncident]:
+        """Handle incident creation and resolution with intelligent flapping detection.
 
-        # Use direct SQL query to avoid ORM recursion issues
-        try:
-            result = db.session.execute(
-                text(
-                    "SELECT id FROM incident WHERE monitor_id = :monitor_id AND resolved_at IS NULL LIMIT 1"
-                ),
-                {"monitor_id": self.id},
-            )
-            active_incident_id = result.scalar()
-            active_incident = (
-                None if active_incident_id is None else True
-            )  # We just need to know if it exists
-        except Exception:
-            # If query fails, assume no active incident to be safe
-            active_incident = None
+        Args:
+            current_status: Status of the check just recorded
+            previous_status: Monitor status before the check
+            now: Time of the check, used as the incident's start or
+                resolution time
+            error_message: Error message of the check just recorded
+            status_code: Status code of the check just recorded
+
+        Returns:
+            The incident opened or resolved, to notify about once the
+            transaction is committed, or None
+        """
+        # The down path and steady "up" checks need to know whether an
+        # incident is open (an EXISTS probe, or memory when active_incidents
+        # was eager-loaded); recovery finds and resolves it in one
+        # UPDATE ... RETURNING
+        steady_up = current_status == "up" and previous_status == "up"
+        has_active_incident = False
+        if current_status == "down" or steady_up:
+            try:
+                has_active_incident = self.has_active_incident()
+            except SQLAlchemyError:
+                # If query fails, assume no active incident to be safe
+                logger.warning(
+                    "Could not load the active incident of monitor %s",
+                    self.id,
+                    exc_info=True,
+                )
+
+        # Fast path for the common steady "up" check: the check that brought
+        # the monitor back up already resolved its incident, unless that
+        # resolution failed, in which case it is retried below
+        if steady_up and not has_active_incident:
+            return None
 
         # Use intelligent incident creation logic
         if (
             current_status == "down"
-            and not active_incident
+            and not has_active_incident
             and self._should_create_incident_intelligent(
                 current_status, previous_status
             )
         ):
-            # Get the latest check result using direct SQL to avoid ORM recursion
+            # The reason for the outage is the failure of the check just
+            # recorded, which is the monitor's latest check
+            description = error_message or (
+                f"HTTP {status_code}" if status_code else None
+            )
+            incident_id = None
             try:
-                latest_check_result = db.session.execute(
-                    text(
-                        "SELECT error_message_id, status_code FROM check_result WHERE monitor_id = :monitor_id ORDER BY timestamp DESC LIMIT 1"
-                    ),
-                    {"monitor_id": self.id},
-                ).fetchone()
-
-                error_message = None
-                if latest_check_result:
-                    if latest_check_result.error_message_id:
-                        # Get the actual error message from the error_messages table
-                        error_msg_result = db.session.execute(
-                            text(
-                                "SELECT message FROM error_messages WHERE id = :error_id"
-                            ),
-                            {"error_id": latest_check_result.error_message_id},
-                        ).fetchone()
-                        if error_msg_result:
-                            error_message = error_msg_result.message
-                    elif latest_check_result.status_code:
-                        error_message = f"HTTP {latest_check_result.status_code}"
-            except Exception:
-                error_message = None
+                # The savepoint rolls back only a failed incident write, so the
+                # check result still commits with the rest of the transaction
+                with db.session.begin_nested():
+                    # RETURNING hands back the new ID in the same round trip
+                    incident_id = Incident.bulk_open(
+                        [{"monitor_id": self.id, "description": description}],
+                        now,
+                    )[self.id]
+            except SQLAlchemyError:
+                # Skip incident creation but still record the check and notify
+                logger.warning(
+                    "Could not open an incident for monitor %s", self.id, exc_info=True
+                )
+
+            temp_incident = _TempIncident(
+                id=incident_id, started_at=now, description=description
+            )
 
-            # Create new incident with description (reason for outage)
-            started_at = datetime.now(timezone.utc)
+            return temp_incident
+
+        elif current_status == "up":
+            # Resolve any open incident, computing its duration in the database
             try:
-                db.session.execute(
-                    text(
-                        "INSERT INTO incident (monitor_id, started_at, status, description, severity, created_at, updated_at) VALUES (:monitor_id, :started_at, :status, :description, :severity, :created_at, :updated_at)"
-                    ),
-                    {
-                        "monitor_id": self.id,
-                        "started_at": started_at,
-                        "status": "active",
-                        "description": error_message,
-                        "severity": "critical",
-                        "created_at": started_at,
-                        "updated_at": started_at,
-                    },
-                )
-                db.session.flush()  # Get the incident ID
-
-                # Get the incident ID we just created
-                incident_result = db.session.execute(
-                    text(
-                        "SELECT id FROM incident WHERE monitor_id = :monitor_id AND started_at = :started_at LIMIT 1"
-                    ),
-                    {"monitor_id": self.id, "started_at": started_at},
+                dialect = db.session.get_bind().dialect.name
+                with db.session.begin_nested():
+                    incident_record = db.session.execute(
+                        _RESOLVE_INCIDENT_SQL.get(
+                            dialect, _RESOLVE_INCIDENT_SQL["sqlite"]
+                        ),
+                        {
+                            "resolved_at": now,
+                            "status": "resolved",
+                            "monitor_id": self.id,
+                        },
+                    ).first()
+
+                if incident_record:
+                    temp_incident = _TempIncident(
+                        id=incident_record.id,
+                        started_at=incident_record.started_at,
+                        resolved_at=now,
+                        duration=incident_record.duration,
+                    )
+
+                    return temp_incident
+
+            except SQLAlchemyError:
+                # If incident resolution fails, continue without it
+                logger.warning(
+                    "Could not resolve the incident of monitor %s",
+                    self.id,
+                    exc_info=True,
                 )
-                incident_id = incident_result.scalar()
 
-            except Exception:
-                # If direct SQL fails, skip incident creation but continue
-                incident_id = None
+        return None
+
+    def _queue_notification(self, incident: _TempIncident, now: datetime) -> None:
+        """Queue the notification of an incident from _handle_incidents().
 
-            # Send notification for going down - create a simple incident object
-            class TempIncident:
-                def __init__(self, incident_id, started_at, description):
-                    self.id = incident_id
-                    self.started_at = started_at
-                    self.description = description
+        The NotificationOutbox row is written in the current transaction and
+        sent later by send_queued_notifications(). Monitors without enabled
+        notification channels queue nothing.
 
-                def __getattr__(self, name):
-                    return None  # Safe fallback for any other attributes
+        Args:
+            incident: The incident opened or resolved
+            now: Time of the check, recorded as the time queued
+        """
+        from app.notification.service import notification_service
 
-            temp_incident = TempIncident(incident_id, started_at, error_message)
+        # Nothing would be sent, so do not queue anything either
+        if not notification_service.channels_for(self):
+            return
 
+        if incident.is_active():
+            event_type = "down"
             title = f"Monitor Down: {self.name}"
-            message = (
-                f"Monitor '{self.name}' ({self.type.value.upper()} - {self.target}) "
-                f"is down. Started: {temp_incident.started_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            message = _DOWN_MESSAGE.format(
+                name=self.name,
+                type=_TYPE_LABELS[self.type],
+                target=self.target,
+                started=format_utc(incident.started_at),
+            )
+            if incident.description:
+                message += f"\n\nReason: {incident.description}"
+        else:
+            event_type = "up"
+            title = f"Monitor Recovered: {self.name}"
+            message = _RECOVERY_MESSAGE.format(
+                name=self.name,
+                type=_TYPE_LABELS[self.type],
+                target=self.target,
+                duration=incident.get_duration_formatted(),
+                resolved=format_utc(incident.resolved_at),
             )
-            if error_message:
-                message += f"\n\nReason: {error_message}"
 
-            try:
-                notification_service.send_monitor_notification(
-                    monitor=self,
-                    event_type="down",
-                    title=title,
-                    message=message,
-                    incident=temp_incident,
-                )
-            except Exception:
-                # If notification fails, continue without it
-                pass
+        db.session.add(
+            NotificationOutbox(
+                monitor_id=self.id,
+                event_type=event_type,
+                payload={
+                    "title": title,
+                    "message": message,
+                    "incident": incident.to_payload(),
+                },
+                created_at=now,
+            )
+        )
 
-        elif current_status == "up" and active_incident:
-            # Resolve existing incident - we need to load it first since we used a direct query
-            try:
-                incident_record = db.session.execute(
-                    text(
-                        "SELECT id, started_at FROM incident WHERE monitor_id = :monitor_id AND resolved_at IS NULL LIMIT 1"
-                    ),
-                    {"monitor_id": self.id},
-                ).fetchone()
+    @classmethod
+    def send_queued_notifications(cls, limit: int = 100) -> int:
+        """Send and delete up to ``limit`` notifications queued by checks.
 
-                if incident_record:
-                    # Update the incident directly
-                    resolved_at = datetime.now(timezone.utc)
-                    db.session.execute(
-                        text(
-                            "UPDATE incident SET resolved_at = :resolved_at, status = :status WHERE id = :incident_id"
-                        ),
-                        {
-                            "resolved_at": resolved_at,
-                            "status": "resolved",
-                            "incident_id": incident_record.id,
-                        },
-                    )
+        Returns at once, without taking the write lock, when no row is
+        claimable. Otherwise the rows are first claimed (claimed_at set and
+        committed), so concurrent workers never send the same notification
+        twice, and each row is deleted only once its notification was handed
+        to the notification service. A row whose send raised, or whose worker died,
+        is claimed again after _OUTBOX_CLAIM_TIMEOUT and dropped after
+        _OUTBOX_MAX_ATTEMPTS tries, so delivery is at-least-once.
 
-                    # Calculate duration
-                    started_at = incident_record.started_at
-                    if started_at.tzinfo is None:
-                        started_at = started_at.replace(tzinfo=timezone.utc)
-                    duration = (resolved_at - started_at).total_seconds()
+        Args:
+            limit: Maximum number of queued notifications to send
 
-                    # Update duration
-                    db.session.execute(
-                        text(
-                            "UPDATE incident SET duration = :duration WHERE id = :incident_id"
-                        ),
-                        {"duration": duration, "incident_id": incident_record.id},
-                    )
+        Returns:
+            Number of queued notifications claimed
+        """
+        from app.notification.service import notification_service
 
-                    # Create a temporary incident object for notification purposes
-                    class TempIncident:
-                        def __init__(
-                            self, incident_id, started_at, resolved_at, duration
-                        ):
-                            self.id = incident_id
-                            self.started_at = started_at
-                            self.resolved_at = resolved_at
-                            self.duration = duration
-
-                        def get_duration_formatted(self):
-                            if not self.duration:
-                                return "0s"
-                            hours = int(self.duration // 3600)
-                            minutes = int((self.duration % 3600) // 60)
-                            seconds = int(self.duration % 60)
-
-                            if hours > 0:
-                                return f"{hours}h {minutes}m {seconds}s"
-                            elif minutes > 0:
-                                return f"{minutes}m {seconds}s"
-                            else:
-                                return f"{seconds}s"
-
-                    temp_incident = TempIncident(
-                        incident_record.id,
-                        incident_record.started_at,
-                        resolved_at,
-                        duration,
-                    )
+        now = utcnow()
+        claimable = or_(
+            NotificationOutbox.claimed_at.is_(None),
+            NotificationOutbox.claimed_at < now - _OUTBOX_CLAIM_TIMEOUT,
+        )
+        # The outbox is empty on almost every run: probe without the write
+        # lock, which would contend with the checks' writes
+        if not db.session.scalar(
+            select(select(NotificationOutbox.id).where(claimable).exists())
+        ):
+            return 0
 
-                    title = f"Monitor Recovered: {self.name}"
-                    message = (
-                        f"Monitor '{self.name}' ({self.type.value.upper()} - {self.target}) "
-                        f"is back up after {temp_incident.get_duration_formatted()} of downtime. "
-                        f"Resolved: {temp_incident.resolved_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                    )
+        try:
+            begin_write_transaction()
+            queued = db.session.execute(
+                db.select(
+                    NotificationOutbox.id,
+                    NotificationOutbox.monitor_id,
+                    NotificationOutbox.event_type,
+                    NotificationOutbox.payload,
+                    NotificationOutbox.attempts,
+                )
+                .where(claimable)
+                .order_by(NotificationOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if queued:
+                db.session.execute(
+                    update(NotificationOutbox)
+                    .where(NotificationOutbox.id.in_([row.id for row in queued]))
+                    .values(claimed_at=now, attempts=NotificationOutbox.attempts + 1)
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
-                    try:
-                        notification_service.send_monitor_notification(
-                            monitor=self,
-                            event_type="up",
-                            title=title,
-                            message=message,
-                            incident=temp_incident,
-                        )
-                    except Exception:
-                        # If notification fails, continue without it
-                        pass
+        for outbox_id, monitor_id, event_type, payload, attempts in queued:
+            monitor = db.session.get(cls, monitor_id)
+            try:
+                monitor_notifications = (
+                    notification_service.channels_for(monitor) if monitor else None
+                )
+                if monitor_notifications:
+                    notification_service.send_monitor_notification(
+                        monitor=monitor,
+                        event_type=event_type,
+                        title=payload["title"],
+                        message=payload["message"],
+                        incident=_TempIncident.from_payload(payload["incident"]),
+                        monitor_notifications=monitor_notifications,
+                    )
+            except Exception:
+                # Notifiers raise transport specific errors (SMTP, HTTP, ...);
+                # one failed notification must not stop the others
+                db.session.rollback()
+                if attempts + 1 < _OUTBOX_MAX_ATTEMPTS:
+                    logger.warning(
+                        "Could not send the %s notification of monitor %s, "
+                        "retrying later",
+                        event_type,
+                        monitor_id,
+                        exc_info=True,
+                    )
+                    continue
+                logger.exception(
+                    "Dropping the %s notification of monitor %s after %d attempts",
+                    event_type,
+                    monitor_id,
+                    _OUTBOX_MAX_ATTEMPTS,
+                )
 
+            try:
+                db.session.execute(
+                    db.delete(NotificationOutbox).where(
+                        NotificationOutbox.id == outbox_id
+                    )
+                )
+                db.session.commit()
             except Exception:
-                # If incident resolution fails, continue without it
-                pass
+                db.session.rollback()
+                raise
+        return len(queued)
 
     def __repr__(self) -> str:
         return f"<Monitor {self.name} ({self.type.value})>"
 
     def to_dict(
-        self, include_recent_checks: bool = False, include_incidents: bool = False
+        self,
+        include_recent_checks: bool = False,
+        include_incidents: bool = False,
+        stats: Optional[Dict[str, float]] = None,
+        include_year_uptime: bool = False,
+        incidents: Optional[List[Incident]] = None,
     ) -> Dict[str, Any]:
-        """Convert monitor to dictionary for API responses."""
-        data = {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type.value,
-            "target": self.target,
-            "port": self.port,
-            "check_interval": self.check_interval.value
-            if self.check_interval
-            else None,
-            "timeout": self.timeout,
-            "verify_ssl": self.verify_ssl,
-            "check_cert_expiration": self.check_cert_expiration,
-            "cert_expiration_threshold": self.cert_expiration_threshold,
-            "check_domain": self.check_domain,
-            "expected_domain": self.expected_domain,
-            "kafka_security_protocol": self.kafka_security_protocol,
-            "is_active": self.is_active,
-            "last_check": self.last_check.isoformat() if self.last_check else None,
-            "last_status": self.last_status,
-            "last_response_time": self.last_response_time,
-            "uptime_24h": self.get_uptime_percentage(1),
-            "uptime_7d": self.get_uptime_percentage(7),
-            "uptime_30d": self.get_uptime_percentage(30),
-            "uptime_1y": self.get_uptime_percentage(365),
-            "avg_response_time_24h": self.get_average_response_time(24),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        """Convert monitor to dictionary for API responses.
 
-        if include_recent_checks:
-            data["recent_checks"] = [
-                check.to_dict() for check in self.get_recent_checks(30)
-            ]
+        Args:
+            include_recent_checks: Include the 30 most recent check results
+            include_incidents: Include the 10 most recent incidents
+            stats: This monitor's entry from compute_stats_bulk(), when
+                serializing many monitors; computed here otherwise
+            include_year_uptime: Include uptime_1y, whose year of check
+                results dominates the statistics query; ``stats`` must then
+                come from compute_stats_bulk(include_year_uptime=True)
+            incidents: This monitor's 10 most recent incidents, newest first,
+                when already loaded (e.g. from Incident.recent_by_monitor()
+                for many monitors); queried here otherwise
+        """
+        if stats is None:
+            stats = self.compute_stats_bulk([self.id], include_year_uptime)[self.id]
+
+        data = dict(zip(_TO_DICT_FIELDS, _to_dict_values(self)))
+        data["type"] = _ENUM_VALUES[self.type]
+        data["check_interval"] = _ENUM_VALUES.get(self.check_interval)
+        data["last_check"] = self.last_check.isoformat() if self.last_check else None
+        data["uptime_24h"] = stats["uptime_24h"]
+        data["uptime_7d"] = self.get_uptime_7d()
+        data["uptime_30d"] = self.get_uptime_30d()
+        if include_year_uptime:
+            data["uptime_1y"] = stats["uptime_1y"]
+        data["avg_response_time_24h"] = stats["avg_response_time_24h"]
+        data["created_at"] = self.created_at.isoformat() if self.created_at else None
+        data["updated_at"] = self.updated_at.isoformat() if self.updated_at else None
 
+        if include_recent_checks:
+            data["recent_checks"] = CheckResult.recent_api_dicts(self.id, 30)
+
+        if include_incidents and incidents is None:
+            # Incident.to_dict() needs no relationships; raiseload turns any
+            # that creep in into errors instead of one lazy load per incident
+            incidents = db.session.scalars(
+                db.select(Incident)
+                .options(raiseload("*"))
+                .where(Incident.monitor_id == self.id)
+                .order_by(Incident.started_at.desc())
+                .limit(10)
+            )
         if include_incidents:
-            from sqlalchemy import desc
-
-            query = self.incidents.order_by(desc(Incident.started_at))  # type: ignore
-            data["incidents"] = [
-                incident.to_dict()
-                for incident in query.limit(10)  # type: ignore
-            ]
+            data["incidents"] = [incident.to_dict() for incident in incidents]
 
         return data
@@ -1,9 +1,12 @@
 import json
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING, Union
+
+from sqlalchemy.orm import validates
 
 from app import db
+from app.utils.json_codec import loads
 
 if TYPE_CHECKING:
     from app.models.monitor import Monitor
@@ -28,10 +31,8 @@ class NotificationChannel(db.Model):
     name = db.Column(db.String(100), nullable=False)
     type = db.Column(db.Enum(NotificationType), nullable=False)
 
-    # Configuration stored as JSON
-    config = db.Column(
-        db.Text, nullable=False
-    )  # JSON string with channel-specific config
+    # Channel-specific configuration, stored as native JSON
+    config = db.Column(db.JSON, nullable=False)
 
     # Status
     is_active = db.Column(db.Boolean, default=True, nullable=False)
@@ -63,7 +64,7 @@ class NotificationChannel(db.Model):
         user_id: int,
         name: str,
         type: NotificationType,
-        config: str,
+        config: Union[Dict[str, Any], str],
         is_active: bool = True,
         is_verified: bool = False,
         **kwargs: Any,
@@ -76,16 +77,29 @@ class NotificationChannel(db.Model):
         self.is_active = is_active
         self.is_verified = is_verified
 
+    @validates("config")
+    def _validate_config(
+        self, key: str, config: Union[Dict[str, Any], str, None]
+    ) -> Dict[str, Any]:
+        """Accept the configuration as a dict or as JSON text (API clients)."""
+        if isinstance(config, str):
+            try:
+                config = loads(config)
+            except json.JSONDecodeError:
+                raise ValueError(
+                    "Notification channel config is not valid JSON"
+                ) from None
+        if not isinstance(config, dict):
+            raise ValueError("Notification channel config must be a JSON object")
+        return config
+
     def get_config(self) -> Dict[str, Any]:
-        """Parse and return configuration as dict."""
-        try:
-            return json.loads(self.config)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        """Return configuration as dict."""
+        return self.config if isinstance(self.config, dict) else {}
 
     def set_config(self, config_dict: Dict[str, Any]) -> None:
         """Set configuration from dict."""
-        self.config = json.dumps(config_dict)
+        self.config = config_dict
 
     def send_notification(
         self,
@@ -335,3 +349,42 @@ class NotificationLog(db.Model):
             "error_message": self.error_message,
             "sent_at": self.sent_at.isoformat() if self.sent_at else None,
         }
+
+
+class NotificationOutbox(db.Model):
+    """Monitor notification queued in the transaction of the check causing it.
+
+    Rows are claimed, delivered and then deleted by
+    Monitor.send_queued_notifications(), which the scheduler runs
+    periodically, so checks never wait on notification channels.
+    """
+
+    __tablename__ = "notification_outbox"
+
+    id = db.Column(db.Integer, primary_key=True)
+    monitor_id = db.Column(
+        db.Integer,
+        db.ForeignKey("monitor.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    event_type = db.Column(db.String(20), nullable=False)  # down, up
+    # Title, message and a snapshot of the incident at queue time
+    payload = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    # Set when a worker takes the row for sending; stale claims are retried
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    attempts = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+
+    def __init__(
+        self, monitor_id: int, event_type: str, payload: Dict[str, Any], **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.monitor_id = monitor_id
+        self.event_type = event_type
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"<NotificationOutbox {self.event_type} for Monitor {self.monitor_id}>"
@@ -1,6 +1,5 @@
 """Public status page model for Uptimo."""
 
-import json
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
@@ -25,7 +24,7 @@ class PublicStatusPage(db.Model):
     )  # "uuid" or "simple"
     custom_header = db.Column(db.String(200))
     description = db.Column(db.Text)
-    selected_monitors = db.Column(db.Text)  # JSON array of monitor IDs
+    selected_monitors = db.Column(db.JSON)  # Array of monitor IDs
     is_active = db.Column(db.Boolean, default=True, nullable=False, index=True)
     created_at = db.Column(
         db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
@@ -61,9 +60,7 @@ class PublicStatusPage(db.Model):
         self.url_type = url_type
         self.custom_header = custom_header
         self.description = description
-        self.selected_monitors = (
-            json.dumps(selected_monitors or []) if selected_monitors else None
-        )
+        self.selected_monitors = list(selected_monitors) if selected_monitors else None
         self.is_active = is_active
         self.uuid = self._generate_secure_uuid()
 
@@ -84,18 +81,13 @@ class PublicStatusPage(db.Model):
         return f"{base_uuid}-{extra_random}"
 
     def get_selected_monitor_ids(self) -> List[int]:
-        """Get list of selected monitor IDs from JSON storage."""
-        if not self.selected_monitors:
-            return []
-
-        try:
-            return json.loads(self.selected_monitors)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        """Get list of selected monitor IDs."""
+        selected = self.selected_monitors
+        return selected if isinstance(selected, list) else []
 
     def set_selected_monitors(self, monitor_ids: List[int]) -> None:
-        """Set selected monitor IDs as JSON."""
-        self.selected_monitors = json.dumps(monitor_ids if monitor_ids else [])
+        """Set selected monitor IDs."""
+        self.selected_monitors = list(monitor_ids) if monitor_ids else []
 
     def get_public_url(self, base_url: str = "") -> str:
         """Get the public URL for this status page."""
@@ -0,0 +1,142 @@
+"""Custom column types shared by the models."""
+
+import operator
+import sys
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Optional, Tuple, Type
+
+from sqlalchemy import DateTime, SmallInteger, String
+from sqlalchemy.types import TypeDecorator
+
+
+class InternedStr(TypeDecorator):
+    """String column whose loaded values are interned.
+
+    Meant for low-cardinality columns such as statuses, so that loading many
+    rows shares a handful of string objects instead of one per row.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        return sys.intern(value) if value is not None else None
+
+
+class StatusCode(TypeDecorator):
+    """Check status column stored as a small integer code.
+
+    The mapped attribute keeps the status names used throughout the app
+    ("unknown", "up", "down"); only the stored value is the code, which
+    makes the row and the indexes over it narrower. Loaded values are the
+    shared name strings. Only ever append to ``names``, since the codes
+    are persisted.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    # Status names in code order, starting at 0
+    names = ("unknown", "up", "down")
+    _to_code = {name: code for code, name in enumerate(names)}
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self._to_code[value]
+        except KeyError:
+            raise ValueError(f"Unknown check status: {value!r}") from None
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[str]:
+        return self.names[value] if value is not None else None
+
+
+class UTCDateTime(TypeDecorator):
+    """Datetime column always loaded as a UTC-aware datetime.
+
+    Uses TIMESTAMP WITH TIME ZONE where the database has it. SQLite has no
+    time zone aware type, so values are stored converted to UTC and get the
+    UTC timezone attached when loaded. Naive values are taken to be UTC.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def __init__(self) -> None:
+        super().__init__(timezone=True)
+
+    def process_bind_param(
+        self, value: Optional[datetime], dialect: Any
+    ) -> Optional[datetime]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    def process_result_value(
+        self, value: Optional[datetime], dialect: Any
+    ) -> Optional[datetime]:
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=timezone.utc)
+
+
+class SmallIntEnum(TypeDecorator):
+    """Enum column stored as a small integer code instead of the member name.
+
+    Members of enums with integer values (e.g. intervals in seconds) are
+    stored as their value. Other enums need ``codes``, the member names in
+    code order starting at 1; only ever append to it, since the codes are
+    persisted.
+
+    Args:
+        enum_class: Python enum exposed on the mapped attribute
+        codes: Member names in code order, for enums without integer values
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    class Comparator(TypeDecorator.Comparator):
+        """Comparator refusing indexing, which integer codes do not support.
+
+        Declarative evaluates Flask-SQLAlchemy's ``type[Query]`` annotation
+        in the model namespace, where a column named ``type`` shadows the
+        builtin; fail as the previous Enum column did, without a warning.
+        """
+
+        def operate(self, op: Any, *other: Any, **kwargs: Any) -> Any:
+            if op is operator.getitem:
+                raise NotImplementedError(
+                    "Operator 'getitem' is not supported on this expression"
+                )
+            return super().operate(op, *other, **kwargs)
+
+    comparator_factory = Comparator
+
+    def __init__(
+        self, enum_class: Type[Enum], codes: Optional[Tuple[str, ...]] = None
+    ) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        self.codes = codes
+        if codes is None:
+            self._to_code = {member: member.value for member in enum_class}
+        else:
+            self._to_code = {
+                enum_class[name]: code for code, name in enumerate(codes, start=1)
+            }
+        self._from_code = {code: member for member, code in self._to_code.items()}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            value = self.enum_class(value)
+        return self._to_code[value]
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Any:
+        return self._from_code[value] if value is not None else None
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
+from app.utils.timezone import format_utc
+
 
 class BaseNotifier(ABC):
     """Base class for all notification providers"""
@@ -41,12 +43,12 @@ class BaseNotifier(ABC):
 
         if incident:
             formatted += "\n\nIncident Details:\n"
-            formatted += f"  • Started: {incident.started_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            formatted += f"  • Started: {format_utc(incident.started_at)}\n"
             if incident.is_active():
                 duration = incident.get_duration_formatted()
                 formatted += f"  • Duration: {duration}\n"
             else:
-                formatted += f"  • Resolved: {incident.resolved_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+                formatted += f"  • Resolved: {format_utc(incident.resolved_at)}\n"
                 formatted += f"  • Duration: {incident.get_duration_formatted()}\n"
 
         return formatted
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from app import db
 from app.models.notification import (
@@ -15,6 +15,12 @@ logger = logging.getLogger(__name__)
 class NotificationService:
     """Service for managing notifications"""
 
+    def channels_for(self, monitor: Any) -> List[MonitorNotification]:
+        """Get the enabled notification settings of a monitor"""
+        return MonitorNotification.query.filter_by(
+            monitor_id=monitor.id, is_enabled=True
+        ).all()
+
     def send_monitor_notification(
         self,
         monitor: Any,
@@ -22,13 +28,13 @@ class NotificationService:
         title: str,
         message: str,
         incident: Optional[Any] = None,
+        monitor_notifications: Optional[List[MonitorNotification]] = None,
     ) -> bool:
         """Send notification for a monitor event"""
         try:
             # Get all notification settings for this monitor
-            monitor_notifications = MonitorNotification.query.filter_by(
-                monitor_id=monitor.id, is_enabled=True
-            ).all()
+            if monitor_notifications is None:
+                monitor_notifications = self.channels_for(monitor)
 
             sent_count = 0
             error_count = 0
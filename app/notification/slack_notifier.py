@@ -3,6 +3,8 @@ import requests
 import time
 from typing import Any, Optional
 from flask import current_app
+
+from app.utils.timezone import format_utc
 from .base_notifier import BaseNotifier
 
 logger = logging.getLogger(__name__)
@@ -114,7 +116,7 @@ class SlackNotifier(BaseNotifier):
                 [
                     {
                         "title": "Incident Started",
-                        "value": incident.started_at.strftime("%Y-%m-%d %H:%M:%S UTC"),
+                        "value": format_utc(incident.started_at),
                         "short": True,
                     }
                 ]
@@ -130,9 +132,7 @@ class SlackNotifier(BaseNotifier):
                     [
                         {
                             "title": "Resolved",
-                            "value": incident.resolved_at.strftime(
-                                "%Y-%m-%d %H:%M:%S UTC"
-                            ),
+                            "value": format_utc(incident.resolved_at),
                             "short": True,
                         },
                         {
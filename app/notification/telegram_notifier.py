@@ -2,6 +2,8 @@ import logging
 import requests
 from typing import Any, Optional
 from flask import current_app
+
+from app.utils.timezone import format_utc
 from .base_notifier import BaseNotifier
 
 logger = logging.getLogger(__name__)
@@ -76,12 +78,12 @@ class TelegramNotifier(BaseNotifier):
 
         if incident:
             formatted += "\n\n<b>Incident Details:</b>\n"
-            formatted += f"<i>Started:</i> {incident.started_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            formatted += f"<i>Started:</i> {format_utc(incident.started_at)}\n"
             if incident.is_active():
                 duration = incident.get_duration_formatted()
                 formatted += f"<i>Duration:</i> {duration}\n"
             else:
-                formatted += f"<i>Resolved:</i> {incident.resolved_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+                formatted += f"<i>Resolved:</i> {format_utc(incident.resolved_at)}\n"
                 formatted += f"<i>Duration:</i> {incident.get_duration_formatted()}\n"
 
         # Add footer
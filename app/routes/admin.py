@@ -1,10 +1,9 @@
 """Admin routes for user management."""
 
-import json
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Dict, Optional
 
 from flask import (
     Blueprint,
@@ -25,7 +24,7 @@ from app.forms.color_customization import ColorCustomizationForm
 from app.forms.oidc import OIDCProviderForm
 from app.forms.public_status import PublicStatusPageForm, PublicStatusPageEditForm
 from app.forms.settings import AppSettingsForm, DeleteOldRecordsForm
-from app.models.app_settings import AppSettings
+from app.models.app_settings import DEFAULT_COLORS, AppSettings
 from app.models.check_result import CheckResult
 from app.models.oidc_provider import OIDCProvider
 from app.models.public_status_page import PublicStatusPage
@@ -306,32 +305,7 @@ def color_customization() -> Any:
         if reset_colors_button:
             # Reset to default colors
             app_settings.enable_custom_colors = False
-            app_settings.primary_color = "#59bc87"
-            app_settings.primary_hover_color = "#45a676"
-            app_settings.primary_subtle_color = "rgba(168, 255, 204, 0.15)"
-            app_settings.success_color = "#22c55e"
-            app_settings.success_bg_color = "#f0fdf4"
-            app_settings.danger_color = "#dc2626"
-            app_settings.danger_bg_color = "#fef2f2"
-            app_settings.warning_color = "#f59e0b"
-            app_settings.warning_bg_color = "#fffbeb"
-            app_settings.info_color = "#06b6d4"
-            app_settings.info_bg_color = "#ecfeff"
-            app_settings.unknown_color = "#6b7280"
-            app_settings.unknown_bg_color = "#f3f4f6"
-            app_settings.dark_primary_color = "#3b82f6"
-            app_settings.dark_primary_hover_color = "#60a5fa"
-            app_settings.dark_primary_subtle_color = "rgba(59, 130, 246, 0.15)"
-            app_settings.dark_success_color = "#4ade80"
-            app_settings.dark_success_bg_color = "#052e16"
-            app_settings.dark_danger_color = "#f87171"
-            app_settings.dark_danger_bg_color = "#1f0713"
-            app_settings.dark_warning_color = "#fbbf24"
-            app_settings.dark_warning_bg_color = "#1c1305"
-            app_settings.dark_info_color = "#38bdf8"
-            app_settings.dark_info_bg_color = "#071926"
-            app_settings.dark_unknown_color = "#9ca3af"
-            app_settings.dark_unknown_bg_color = "#1f2937"
+            app_settings.reset_colors()
 
             flash("Color settings reset to defaults successfully.", "success")
 
@@ -339,74 +313,16 @@ def color_customization() -> Any:
             # Update color settings - properly handle None/empty values
             app_settings.enable_custom_colors = color_form.enable_custom_colors.data
 
-            # Light mode colors - use form data or keep current value
-            app_settings.primary_color = (
-                color_form.primary_color.data or app_settings.primary_color
-            )
-            app_settings.primary_hover_color = (
-                color_form.primary_hover_color.data or app_settings.primary_hover_color
-            )
-            app_settings.primary_subtle_color = (
-                color_form.primary_subtle_color.data
-                or app_settings.primary_subtle_color
-            )
-            app_settings.success_color = (
-                color_form.success_color.data or app_settings.success_color
-            )
-            app_settings.success_bg_color = (
-                color_form.success_bg_color.data or app_settings.success_bg_color
-            )
-            app_settings.danger_color = (
-                color_form.danger_color.data or app_settings.danger_color
-            )
-            app_settings.danger_bg_color = (
-                color_form.danger_bg_color.data or app_settings.danger_bg_color
-            )
-            app_settings.warning_color = (
-                color_form.warning_color.data or app_settings.warning_color
-            )
-            app_settings.warning_bg_color = (
-                color_form.warning_bg_color.data or app_settings.warning_bg_color
-            )
-            app_settings.info_color = (
-                color_form.info_color.data or app_settings.info_color
-            )
-            app_settings.info_bg_color = (
-                color_form.info_bg_color.data or app_settings.info_bg_color
-            )
-            app_settings.unknown_color = (
-                color_form.unknown_color.data or app_settings.unknown_color
-            )
-            app_settings.unknown_bg_color = (
-                color_form.unknown_bg_color.data or app_settings.unknown_bg_color
-            )
-
-            # Dark mode colors - allow empty to disable dark mode override
-            app_settings.dark_primary_color = color_form.dark_primary_color.data or None
-            app_settings.dark_primary_hover_color = (
-                color_form.dark_primary_hover_color.data or None
-            )
-            app_settings.dark_primary_subtle_color = (
-                color_form.dark_primary_subtle_color.data or None
-            )
-            app_settings.dark_success_color = color_form.dark_success_color.data or None
-            app_settings.dark_success_bg_color = (
-                color_form.dark_success_bg_color.data or None
-            )
-            app_settings.dark_danger_color = color_form.dark_danger_color.data or None
-            app_settings.dark_danger_bg_color = (
-                color_form.dark_danger_bg_color.data or None
-            )
-            app_settings.dark_warning_color = color_form.dark_warning_color.data or None
-            app_settings.dark_warning_bg_color = (
-                color_form.dark_warning_bg_color.data or None
-            )
-            app_settings.dark_info_color = color_form.dark_info_color.data or None
-            app_settings.dark_info_bg_color = color_form.dark_info_bg_color.data or None
-            app_settings.dark_unknown_color = color_form.dark_unknown_color.data or None
-            app_settings.dark_unknown_bg_color = (
-                color_form.dark_unknown_bg_color.data or None
-            )
+            colors: Dict[str, Optional[str]] = {}
+            for name in DEFAULT_COLORS:
+                value = getattr(color_form, name).data
+                if name.startswith("dark_"):
+                    # Dark mode colors - allow empty to disable dark mode override
+                    colors[name] = value or None
+                else:
+                    # Light mode colors - use form data or keep current value
+                    colors[name] = value or app_settings.color(name)
+            app_settings.set_colors(colors)
 
             flash("Color settings updated successfully.", "success")
 
@@ -416,58 +332,8 @@ def color_customization() -> Any:
     # Pre-populate form with current settings
     if request.method == "GET":
         color_form.enable_custom_colors.data = app_settings.enable_custom_colors
-        color_form.primary_color.data = app_settings.primary_color or "#59bc87"
-        color_form.primary_hover_color.data = (
-            app_settings.primary_hover_color or "#45a676"
-        )
-        color_form.primary_subtle_color.data = (
-            app_settings.primary_subtle_color or "rgba(168, 255, 204, 0.15)"
-        )
-        color_form.success_color.data = app_settings.success_color or "#22c55e"
-        color_form.success_bg_color.data = app_settings.success_bg_color or "#f0fdf4"
-        color_form.danger_color.data = app_settings.danger_color or "#dc2626"
-        color_form.danger_bg_color.data = app_settings.danger_bg_color or "#fef2f2"
-        color_form.warning_color.data = app_settings.warning_color or "#f59e0b"
-        color_form.warning_bg_color.data = app_settings.warning_bg_color or "#fffbeb"
-        color_form.info_color.data = app_settings.info_color or "#06b6d4"
-        color_form.info_bg_color.data = app_settings.info_bg_color or "#ecfeff"
-        color_form.unknown_color.data = app_settings.unknown_color or "#6b7280"
-        color_form.unknown_bg_color.data = app_settings.unknown_bg_color or "#f3f4f6"
-        color_form.dark_primary_color.data = (
-            app_settings.dark_primary_color or "#3b82f6"
-        )
-        color_form.dark_primary_hover_color.data = (
-            app_settings.dark_primary_hover_color or "#60a5fa"
-        )
-        color_form.dark_primary_subtle_color.data = (
-            app_settings.dark_primary_subtle_color or "rgba(59, 130, 246, 0.15)"
-        )
-        color_form.dark_success_color.data = (
-            app_settings.dark_success_color or "#4ade80"
-        )
-        color_form.dark_success_bg_color.data = (
-            app_settings.dark_success_bg_color or "#052e16"
-        )
-        color_form.dark_danger_color.data = app_settings.dark_danger_color or "#f87171"
-        color_form.dark_danger_bg_color.data = (
-            app_settings.dark_danger_bg_color or "#1f0713"
-        )
-        color_form.dark_warning_color.data = (
-            app_settings.dark_warning_color or "#fbbf24"
-        )
-        color_form.dark_warning_bg_color.data = (
-            app_settings.dark_warning_bg_color or "#1c1305"
-        )
-        color_form.dark_info_color.data = app_settings.dark_info_color or "#38bdf8"
-        color_form.dark_info_bg_color.data = (
-            app_settings.dark_info_bg_color or "#071926"
-        )
-        color_form.dark_unknown_color.data = (
-            app_settings.dark_unknown_color or "#9ca3af"
-        )
-        color_form.dark_unknown_bg_color.data = (
-            app_settings.dark_unknown_bg_color or "#1f2937"
-        )
+        for name, default in DEFAULT_COLORS.items():
+            getattr(color_form, name).data = app_settings.color(name) or default
 
     return render_template(
         "admin/color_customization.html",
@@ -481,53 +347,12 @@ def custom_colors_css() -> Any:
     """Generate custom CSS with color overrides (public endpoint)."""
     app_settings = AppSettings.get_settings()
 
-    if not app_settings.enable_custom_colors:
-        # Return empty CSS if custom colors are disabled
-        return Response("", mimetype="text/css")
-
-    # Generate CSS with CORRECT variable names matching style.css
-    # Light mode colors
-    light_css_vars = [
-        f"  --brand-primary: {app_settings.primary_color};",
-        f"  --brand-primary-hover: {app_settings.primary_hover_color};",
-        f"  --brand-primary-subtle: {app_settings.primary_subtle_color};",
-        f"  --status-success: {app_settings.success_color};",
-        f"  --status-success-bg: {app_settings.success_bg_color};",
-        f"  --status-danger: {app_settings.danger_color};",
-        f"  --status-danger-bg: {app_settings.danger_bg_color};",
-        f"  --status-warning: {app_settings.warning_color};",
-        f"  --status-warning-bg: {app_settings.warning_bg_color};",
-        f"  --status-info: {app_settings.info_color};",
-        f"  --status-info-bg: {app_settings.info_bg_color};",
-        f"  --status-unknown: {app_settings.unknown_color};",
-        f"  --status-unknown-bg: {app_settings.unknown_bg_color};",
-    ]
-
-    # Build the CSS content
-    css_parts = [":root {", *light_css_vars, "}"]
-
-    # Add dark mode overrides if any dark mode color is set
-    if app_settings.dark_primary_color:
-        dark_css_vars = [
-            '[data-theme="dark"] {',
-            f"  --brand-primary: {app_settings.dark_primary_color};",
-            f"  --brand-primary-hover: {app_settings.dark_primary_hover_color or app_settings.dark_primary_color};",
-            f"  --brand-primary-subtle: {app_settings.dark_primary_subtle_color or 'rgba(59, 130, 246, 0.15)'};",
-            f"  --status-success: {app_settings.dark_success_color or app_settings.success_color};",
-            f"  --status-success-bg: {app_settings.dark_success_bg_color or 'rgba(34, 197, 94, 0.15)'};",
-            f"  --status-danger: {app_settings.dark_danger_color or app_settings.danger_color};",
-            f"  --status-danger-bg: {app_settings.dark_danger_bg_color or 'rgba(220, 38, 38, 0.15)'};",
-            f"  --status-warning: {app_settings.dark_warning_color or app_settings.warning_color};",
-            f"  --status-warning-bg: {app_settings.dark_warning_bg_color or 'rgba(245, 158, 11, 0.15)'};",
-            f"  --status-info: {app_settings.dark_info_color or app_settings.info_color};",
-            f"  --status-info-bg: {app_settings.dark_info_bg_color or 'rgba(6, 182, 212, 0.15)'};",
-            f"  --status-unknown: {app_settings.dark_unknown_color or app_settings.unknown_color};",
-            f"  --status-unknown-bg: {app_settings.dark_unknown_bg_color or 'rgba(107, 114, 128, 0.15)'};",
-            "}",
-        ]
-        css_parts.extend(["", *dark_css_vars])
+    # CSS is rendered when settings are saved; rows saved before the
+    # rendered_css column existed are rendered on the fly
+    css_content = app_settings.rendered_css
+    if css_content is None:
+        css_content = app_settings.render_css()
 
-    css_content = "\n".join(css_parts)
     return Response(css_content, mimetype="text/css")
 
 
@@ -639,14 +464,10 @@ def edit_public_status_page(page_id: int) -> Any:
 
     # Pre-populate selected monitors
     if request.method == "GET" and status_page.selected_monitors:
-        try:
-            selected_monitors = json.loads(status_page.selected_monitors)
-            # Convert to strings for form field compatibility
-            form.selected_monitors.data = [
-                str(monitor_id) for monitor_id in selected_monitors
-            ]
-        except (json.JSONDecodeError, TypeError):
-            form.selected_monitors.data = []
+        # Convert to strings for form field compatibility
+        form.selected_monitors.data = [
+            str(monitor_id) for monitor_id in status_page.get_selected_monitor_ids()
+        ]
 
     if form.validate_on_submit():
         try:
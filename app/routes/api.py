@@ -38,9 +38,13 @@ def get_monitors():
         page=page, per_page=per_page, error_out=False
     )
 
+    stats = Monitor.compute_stats_bulk(monitor.id for monitor in monitors.items)
     return jsonify(
         {
-            "monitors": [monitor.to_dict() for monitor in monitors.items],
+            "monitors": [
+                monitor.to_dict(stats=stats[monitor.id], include_year_uptime=True)
+                for monitor in monitors.items
+            ],
             "pagination": {
                 "page": monitors.page,
                 "pages": monitors.pages,
@@ -90,7 +94,7 @@ def create_monitor():
         db.session.add(monitor)
         db.session.commit()
 
-        return jsonify(monitor.to_dict()), 201
+        return jsonify(monitor.to_dict(include_year_uptime=True)), 201
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -104,7 +108,13 @@ def create_monitor():
 def get_monitor(id):
     """Get specific monitor"""
     monitor = Monitor.query.filter_by(id=id, user_id=current_user.id).first_or_404()
-    return jsonify(monitor.to_dict(include_recent_checks=True, include_incidents=True))
+    return jsonify(
+        monitor.to_dict(
+            include_recent_checks=True,
+            include_incidents=True,
+            include_year_uptime=True,
+        )
+    )
 
 
 @bp.route("/monitors/<int:id>", methods=["PUT"])
@@ -147,7 +157,7 @@ def update_monitor(id):
         monitor.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        return jsonify(monitor.to_dict())
+        return jsonify(monitor.to_dict(include_year_uptime=True))
 
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -192,7 +202,7 @@ def get_monitor_check_results(id):
 
     return jsonify(
         {
-            "check_results": [result.to_dict() for result in check_results.items],
+            "check_results": [result.to_api_dict() for result in check_results.items],
             "pagination": {
                 "page": check_results.page,
                 "pages": check_results.pages,
@@ -274,7 +284,7 @@ def dashboard_overview():
         # Calculate overall uptime
         active_monitors = [m for m in monitors if m.is_active]
         if active_monitors:
-            total_uptime = sum(m.get_uptime_percentage(7) for m in active_monitors)
+            total_uptime = sum(m.get_uptime_7d() for m in active_monitors)
             overview["overall_uptime_7d"] = round(
                 total_uptime / len(active_monitors), 2
             )
@@ -17,7 +17,12 @@ from flask import (
 from flask_login import login_required, current_user
 
 from app import db
-from app.models.monitor import Monitor, MonitorType, CheckInterval
+from app.models.monitor import (
+    Monitor,
+    MonitorType,
+    CheckInterval,
+    preload_recent_checks,
+)
 from app.models.incident import Incident
 from app.models.user_incident_view import UserIncidentView
 from app.models.notification import NotificationChannel
@@ -61,11 +66,15 @@ def index():
         "active_incidents": len(active_incidents),
     }
 
+    # Sidebar badges: one grouped query instead of one per monitor
+    uptime_24h = Monitor.get_uptime_percentages([m.id for m in monitors], 1)
+
     return render_template(
         "dashboard/index.html",
         monitors=monitors,
         stats=stats,
         active_incidents=active_incidents,
+        uptime_24h=uptime_24h,
     )
 
 
@@ -88,8 +97,16 @@ def monitors():
         "down": down_monitors,
     }
 
+    monitor_stats = Monitor.compute_stats_bulk(
+        (monitor.id for monitor in monitors), include_year_uptime=False
+    )
     return jsonify(
-        {"monitors": [monitor.to_dict() for monitor in monitors], "stats": stats}
+        {
+            "monitors": [
+                monitor.to_dict(stats=monitor_stats[monitor.id]) for monitor in monitors
+            ],
+            "stats": stats,
+        }
     )
 
 
@@ -109,7 +126,7 @@ def monitor_detail(id: int):
     monitor = Monitor.query.filter_by(id=id, user_id=current_user.id).first_or_404()
 
     # Get incidents (semi-static - doesn't change frequently)
-    incidents = monitor.incidents.order_by(Incident.started_at.desc()).limit(10).all()
+    incidents = monitor.get_recent_incidents(10)
 
     # Fetch TLS/domain data directly from deduplication tables (updated daily)
     cert_info = None
@@ -183,7 +200,10 @@ def monitor_detail(id: int):
     return jsonify(
         {
             "monitor": monitor.to_dict(
-                include_recent_checks=False, include_incidents=True
+                include_recent_checks=False,
+                include_incidents=True,
+                include_year_uptime=True,
+                incidents=incidents,
             ),
             # Removed: recent_checks - use /monitor/{id}/checks endpoint
             # Removed: heartbeat_checks - use /monitor/{id}/heartbeat endpoint
@@ -286,7 +306,7 @@ def overview_stats():
             stats["monitors_by_type"][type_name] += 1
 
         # Calculate overall uptime
-        total_uptime = sum(monitor.get_uptime_percentage(7) for monitor in monitors)
+        total_uptime = sum(monitor.get_uptime_7d() for monitor in monitors)
         stats["overall_uptime"] = round(total_uptime / len(monitors), 2)
 
         # Count recent incidents
@@ -900,16 +920,25 @@ def stream():
                 }
 
                 # Update monitor states (include recent_checks for heartbeat visualization)
-                for monitor in monitors:
-                    monitor_data = monitor.to_dict(include_recent_checks=False)
-                    # Always include recent_checks for heartbeat visualization
-                    # Use columnar format for better compression
-                    recent_checks = CheckResult.to_chart_columnar_dict(
-                        monitor.get_recent_checks(25)
-                    )
-                    monitor_data["recent_checks"] = recent_checks
+                # Heartbeat checks and statistics for all monitors come from
+                # one query each
+                monitor_stats = Monitor.compute_stats_bulk(
+                    (m.id for m in monitors), include_year_uptime=False
+                )
+                with preload_recent_checks([m.id for m in monitors], 25):
+                    for monitor in monitors:
+                        monitor_data = monitor.to_dict(
+                            include_recent_checks=False,
+                            stats=monitor_stats[monitor.id],
+                        )
+                        # Always include recent_checks for heartbeat visualization
+                        # Use columnar format for better compression
+                        recent_checks = CheckResult.to_chart_columnar_dict(
+                            monitor.get_recent_checks(25)
+                        )
+                        monitor_data["recent_checks"] = recent_checks
 
-                    meaningful_state["monitors"][str(monitor.id)] = monitor_data
+                        meaningful_state["monitors"][str(monitor.id)] = monitor_data
 
                 # Update stats
                 total_monitors = len(monitors)
@@ -955,16 +984,26 @@ def stream():
                             "stats": {},
                         }
 
-                        # Update monitor states
-                        for monitor in monitors:
-                            monitor_data = monitor.to_dict(include_recent_checks=False)
-                            # Always include recent_checks for heartbeat visualization
-                            # Use columnar format for better compression
-                            recent_checks = CheckResult.to_chart_columnar_dict(
-                                monitor.get_recent_checks(25)
-                            )
-                            monitor_data["recent_checks"] = recent_checks
-                            meaningful_state["monitors"][str(monitor.id)] = monitor_data
+                        # Update monitor states; heartbeat checks and statistics
+                        # come from one query each
+                        monitor_stats = Monitor.compute_stats_bulk(
+                            (m.id for m in monitors), include_year_uptime=False
+                        )
+                        with preload_recent_checks([m.id for m in monitors], 25):
+                            for monitor in monitors:
+                                monitor_data = monitor.to_dict(
+                                    include_recent_checks=False,
+                                    stats=monitor_stats[monitor.id],
+                                )
+                                # Always include recent_checks for heartbeat visualization
+                                # Use columnar format for better compression
+                                recent_checks = CheckResult.to_chart_columnar_dict(
+                                    monitor.get_recent_checks(25)
+                                )
+                                monitor_data["recent_checks"] = recent_checks
+                                meaningful_state["monitors"][str(monitor.id)] = (
+                                    monitor_data
+                                )
 
                         # Update stats
                         total_monitors = len(monitors)
@@ -1084,18 +1123,14 @@ def monitor_stream(id: int):
                 ).first()
 
                 if monitor:
-                    # Get recent checks for heartbeat (always show last 50, no timespan filter)
-                    recent_checks_heartbeat = monitor.get_recent_checks(50)
-
-                    # Get recent checks and filter by timespan for charts
-                    filtered_checks = monitor.get_checks_by_timespan(timespan_hours)
+                    # Checks in the timespan for charts and the last 50 for the
+                    # heartbeat (no timespan filter), from one query when possible
+                    filtered_checks, recent_checks_heartbeat = (
+                        monitor.get_checks_with_recent(timespan_hours, 50)
+                    )
 
                     # Get incidents
-                    incidents = (
-                        monitor.incidents.order_by(Incident.started_at.desc())
-                        .limit(10)
-                        .all()
-                    )
+                    incidents = monitor.get_recent_incidents(10)
 
                     # Use columnar format for better compression
                     recent_checks_columnar = CheckResult.to_chart_columnar_dict(
@@ -1146,18 +1181,14 @@ def monitor_stream(id: int):
                             yield f"data: {json.dumps({'monitor_deleted': True, 'monitor_id': monitor_id})}\n\n"
                             break
 
-                        # Get recent checks for heartbeat (always show last 50, no timespan filter)
-                        recent_checks_heartbeat = monitor.get_recent_checks(50)
-
-                        # Get recent checks and filter by timespan for charts
-                        filtered_checks = monitor.get_checks_by_timespan(timespan_hours)
+                        # Checks in the timespan for charts and the last 50 for the
+                        # heartbeat (no timespan filter), from one query when possible
+                        filtered_checks, recent_checks_heartbeat = (
+                            monitor.get_checks_with_recent(timespan_hours, 50)
+                        )
 
                         # Get incidents
-                        incidents = (
-                            monitor.incidents.order_by(Incident.started_at.desc())
-                            .limit(10)
-                            .all()
-                        )
+                        incidents = monitor.get_recent_incidents(10)
 
                         # Use columnar format for better compression
                         recent_checks_columnar = CheckResult.to_chart_columnar_dict(
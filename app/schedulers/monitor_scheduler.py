@@ -11,18 +11,25 @@ from app.models.incident import Incident
 from app.services.checker import CheckerFactory
 from app.services.public_status_service import PublicStatusService
 from app.notification.service import NotificationService
+from app.utils.timezone import batch_now
 
 # Global scheduler instance
 scheduler = BackgroundScheduler()
 
 logger = logging.getLogger(__name__)
 
+# Seconds between deliveries of notifications queued by checks
+NOTIFICATION_OUTBOX_INTERVAL = 5
+
 
 class MonitorScheduler:
     """Service for scheduling and executing monitor checks"""
 
     def __init__(self):
         self.notification_service = NotificationService()
+        # App of the notification outbox job, built on its first run and
+        # reused: the job runs every few seconds
+        self._outbox_app = None
         self._setup_scheduler_handlers()
 
     def _setup_scheduler_handlers(self):
@@ -51,6 +58,20 @@ class MonitorScheduler:
 
         logger.info(f"Scheduled {len(monitors)} active monitors")
 
+        self.schedule_notification_outbox()
+
+    def schedule_notification_outbox(self) -> None:
+        """Schedule delivery of the notifications queued by monitor checks"""
+        scheduler.add_job(
+            func=self._send_queued_notifications,
+            trigger=IntervalTrigger(seconds=NOTIFICATION_OUTBOX_INTERVAL),
+            id="notification_outbox",
+            name="Send queued notifications",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
     def schedule_monitor(self, monitor: Any, run_immediately: bool = False) -> None:
         """Schedule a single monitor
 
@@ -135,14 +156,15 @@ class MonitorScheduler:
                 # Get previous status to detect changes
                 previous_status = monitor.last_status
 
-                # Update monitor status
-                monitor.update_status(
-                    status=check_result.status,
-                    response_time=check_result.response_time,
-                    status_code=check_result.status_code,
-                    error_message=check_result.error_message,
-                    additional_data=check_result.additional_data,
-                )
+                # Update monitor status, sharing one "now" across the rows it writes
+                with batch_now():
+                    monitor.update_status(
+                        status=check_result.status,
+                        response_time=check_result.response_time,
+                        status_code=check_result.status_code,
+                        error_message=check_result.error_message,
+                        additional_data=check_result.additional_data,
+                    )
 
                 # Invalidate cache when monitor status changes
                 if previous_status != check_result.status:
@@ -182,6 +204,21 @@ class MonitorScheduler:
                 except Exception:
                     pass
 
+    def _send_queued_notifications(self) -> None:
+        """Send the notifications queued by monitor checks"""
+        # Import app here to avoid circular imports
+        from app import create_app
+
+        if self._outbox_app is None:
+            self._outbox_app = create_app(start_scheduler=False)
+        with self._outbox_app.app_context():
+            try:
+                # Drain the outbox, one batch at a time
+                while Monitor.send_queued_notifications():
+                    pass
+            except Exception as e:
+                logger.error(f"Error sending queued notifications: {e}")
+
     def _handle_status_change(
         self, monitor: Any, previous_status: str, check_result: Any
     ) -> None:
@@ -222,8 +259,9 @@ class MonitorScheduler:
                 if previous_status == "down":
                     # Look for recently resolved incident
                     recent_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-                    incident = monitor.incidents.filter(
-                        Incident.resolved_at >= recent_time
+                    incident = Incident.query.filter(
+                        Incident.monitor_id == monitor.id,
+                        Incident.resolved_at >= recent_time,
                     ).first()
 
                 self.notification_service.send_monitor_notification(
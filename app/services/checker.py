@@ -11,6 +11,8 @@ from urllib.parse import urlparse
 from typing import Any, Dict, Optional
 import urllib3
 
+from app.utils.timezone import parse_cert_date
+
 # Optional imports
 try:
     import ping3
@@ -732,13 +734,7 @@ class HTTPChecker(MonitorChecker):
                         }
 
                     # Parse SSL cert date (format: "Jan 9 12:31:51 2026 GMT")
-                    # Remove timezone suffix as strptime %Z is unreliable
-                    expire_date_clean = expire_date_str.rsplit(" ", 1)[0]
-                    expire_date = datetime.strptime(
-                        expire_date_clean, "%b %d %H:%M:%S %Y"
-                    )
-                    # SSL certs are always in UTC/GMT
-                    expire_date = expire_date.replace(tzinfo=timezone.utc)
+                    expire_date = parse_cert_date(expire_date_str)
                     days_to_expiration = (expire_date - datetime.now(timezone.utc)).days
 
                     # Extract certificate subject and issuer information
@@ -1219,13 +1215,7 @@ class KafkaChecker(MonitorChecker):
                         }
 
                     # Parse SSL cert date (format: "Jan 9 12:31:51 2026 GMT")
-                    # Remove timezone suffix as strptime %Z is unreliable
-                    expire_date_clean = expire_date_str.rsplit(" ", 1)[0]
-                    expire_date = datetime.strptime(
-                        expire_date_clean, "%b %d %H:%M:%S %Y"
-                    )
-                    # SSL certs are always in UTC/GMT
-                    expire_date = expire_date.replace(tzinfo=timezone.utc)
+                    expire_date = parse_cert_date(expire_date_str)
                     days_to_expiration = (expire_date - datetime.now(timezone.utc)).days
 
                     subject_dict = {}
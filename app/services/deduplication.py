@@ -2,10 +2,25 @@
 
 import hashlib
 import json
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from app import db
+from app.utils.json_codec import dumps
+from app.utils.timezone import parse_cert_date
+
+# Error message hashes keep the first 128 bits of the sha256 hex digest,
+# plenty to tell distinct messages apart while halving index key size
+MESSAGE_HASH_LENGTH = 32
+
+
+def _hash_message(message: str) -> str:
+    """Get the deduplication hash for an error message."""
+    return hashlib.sha256(message.encode()).hexdigest()[:MESSAGE_HASH_LENGTH]
 
 
 class DeduplicationService:
@@ -16,6 +31,9 @@ class DeduplicationService:
         """
         Get or create error message record, return ID.
 
+        Flushes instead of committing, so the record joins the caller's
+        transaction (e.g. the check result write in update_status).
+
         Args:
             message: Full error message text
 
@@ -28,7 +46,7 @@ class DeduplicationService:
         from app.models.deduplication import ErrorMessage
 
         # Generate hash for deduplication
-        message_hash = hashlib.sha256(message.encode()).hexdigest()
+        message_hash = _hash_message(message)
 
         # Try to find existing
         error_msg = ErrorMessage.query.filter_by(message_hash=message_hash).first()
@@ -36,7 +54,7 @@ class DeduplicationService:
         if error_msg:
             # Update usage count
             error_msg.usage_count += 1
-            db.session.commit()
+            db.session.flush()
             return error_msg.id
 
         # Create new record
@@ -45,14 +63,81 @@ class DeduplicationService:
         error_msg.message = message
         error_msg.usage_count = 1
         db.session.add(error_msg)
-        db.session.commit()
+        db.session.flush()
         return error_msg.id
 
+    @staticmethod
+    def get_or_create_error_messages(messages: Iterable[str]) -> Dict[str, int]:
+        """
+        Get or create error message records for many messages at once.
+
+        Resolves the whole batch with one SELECT, one conflict-ignoring
+        INSERT for unseen messages, one SELECT for their IDs and one
+        executemany UPDATE of the usage counts. Does not commit.
+
+        Args:
+            messages: Error message texts; repeats count as separate uses
+
+        Returns:
+            Mapping of message text to error message record ID
+        """
+        from app.models.deduplication import ErrorMessage
+
+        uses = Counter(message for message in messages if message)
+        if not uses:
+            return {}
+
+        # Each distinct message is hashed once, however often it repeats
+        hashes = {message: _hash_message(message) for message in uses}
+        table = ErrorMessage.__table__
+
+        def select_ids(wanted: Iterable[str]) -> Dict[str, int]:
+            rows = db.session.execute(
+                select(table.c.message_hash, table.c.id).where(
+                    table.c.message_hash.in_(list(wanted))
+                )
+            )
+            return {message_hash: id_ for message_hash, id_ in rows}
+
+        ids_by_hash = select_ids(hashes.values())
+
+        missing = [
+            {"message_hash": message_hash, "message": message, "usage_count": 0}
+            for message, message_hash in hashes.items()
+            if message_hash not in ids_by_hash
+        ]
+        if missing:
+            # Another writer may insert the same message concurrently
+            dialect = db.session.get_bind().dialect.name
+            if dialect == "sqlite":
+                stmt = sqlite.insert(table).on_conflict_do_nothing()
+            elif dialect == "postgresql":
+                stmt = postgresql.insert(table).on_conflict_do_nothing()
+            else:
+                stmt = insert(table)
+            db.session.execute(stmt, missing)
+            ids_by_hash.update(select_ids(row["message_hash"] for row in missing))
+
+        ids = {message: ids_by_hash[hashes[message]] for message in uses}
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(usage_count=table.c.usage_count + bindparam("b_uses")),
+            [
+                {"b_id": ids[message], "b_uses": count}
+                for message, count in uses.items()
+            ],
+        )
+        return ids
+
     @staticmethod
     def get_or_create_tls_cert(domain: str, cert_data: Dict[str, Any]) -> Optional[int]:
         """
         Get or create TLS certificate record, return ID.
 
+        Flushes instead of committing, so the record joins the caller's
+        transaction (e.g. the check result write in update_status).
+
         Args:
             domain: Domain name
             cert_data: Certificate information dictionary
@@ -77,6 +162,7 @@ class DeduplicationService:
             "fingerprint": cert_data.get("fingerprint", ""),
         }
 
+        # Stdlib encoding on purpose: its exact output defines existing hashes
         hash_json = json.dumps(hash_content, sort_keys=True)
         cert_hash = hashlib.sha256(hash_json.encode()).hexdigest()
 
@@ -86,7 +172,7 @@ class DeduplicationService:
         if cert:
             # Update usage count
             cert.usage_count += 1
-            db.session.commit()
+            db.session.flush()
             return cert.id
 
         # Create new record - store FULL cert data, not just hash fields
@@ -94,12 +180,7 @@ class DeduplicationService:
         if cert_data.get("not_after"):
             # Parse SSL cert date (format: "Jan 9 12:31:51 2026 GMT")
             try:
-                not_after = cert_data["not_after"]
-                # Remove timezone suffix as strptime %Z is unreliable
-                expire_date_clean = not_after.rsplit(" ", 1)[0]
-                expires_at = datetime.strptime(expire_date_clean, "%b %d %H:%M:%S %Y")
-                # SSL certs are always in UTC/GMT
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
+                expires_at = parse_cert_date(cert_data["not_after"])
             except (ValueError, AttributeError):
                 pass
 
@@ -107,11 +188,11 @@ class DeduplicationService:
         cert.cert_hash = cert_hash
         cert.domain = domain
         # Store complete cert data, not just hash fields
-        cert.cert_data = json.dumps(cert_data, sort_keys=True)
+        cert.cert_data = dumps(cert_data, sort_keys=True)
         cert.expires_at = expires_at
         cert.usage_count = 1
         db.session.add(cert)
-        db.session.commit()
+        db.session.flush()
         return cert.id
 
     @staticmethod
@@ -121,6 +202,9 @@ class DeduplicationService:
         """
         Get or create domain info record, return ID.
 
+        Flushes instead of committing, so the record joins the caller's
+        transaction (e.g. the check result write in update_status).
+
         Args:
             domain: Domain name
             domain_data: Domain information dictionary
@@ -143,13 +227,13 @@ class DeduplicationService:
             # Update if data changed
             current_data = info.get_dns_info()
             if current_data != domain_data:
-                info.dns_info = json.dumps(domain_data)
+                info.dns_info = dumps(domain_data)
                 info.ip_address = domain_data.get("ip_address")
                 info.updated_at = datetime.now(timezone.utc)
 
             # Update usage count
             info.usage_count += 1
-            db.session.commit()
+            db.session.flush()
             return info.id
 
         # Create new record
@@ -157,16 +241,16 @@ class DeduplicationService:
         info.domain_hash = domain_hash
         info.domain = domain
         info.ip_address = domain_data.get("ip_address")
-        info.dns_info = json.dumps(domain_data)
+        info.dns_info = dumps(domain_data)
         info.usage_count = 1
         db.session.add(info)
-        db.session.commit()
+        db.session.flush()
         return info.id
 
     @staticmethod
     def compact_additional_data(
         additional_data: Optional[Dict[str, Any]],
-    ) -> Optional[str]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Extract and deduplicate large data from additional_data.
 
@@ -174,7 +258,7 @@ class DeduplicationService:
             additional_data: Original additional data dictionary
 
         Returns:
-            Compacted additional data as JSON string
+            Compacted additional data dictionary (stored in a JSON column)
         """
         if not additional_data:
             return None
@@ -214,7 +298,7 @@ class DeduplicationService:
             if key not in ["cert_info", "domain_check", "response_headers"]:
                 compacted[key] = value
 
-        return json.dumps(compacted, separators=(",", ":"))
+        return compacted
 
     @staticmethod
     def get_error_message_text(error_message_id: Optional[int]) -> Optional[str]:
@@ -229,23 +313,18 @@ class DeduplicationService:
 
     @staticmethod
     def reconstruct_additional_data(
-        additional_data_json: Optional[str],
+        compacted: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
         """
         Reconstruct full additional_data from compacted version.
 
         Args:
-            additional_data_json: Compacted additional data JSON
+            compacted: Compacted additional data as loaded from the JSON column
 
         Returns:
             Reconstructed additional data dictionary
         """
-        if not additional_data_json:
-            return {}
-
-        try:
-            compacted = json.loads(additional_data_json)
-        except (json.JSONDecodeError, TypeError):
+        if not isinstance(compacted, dict) or not compacted:
             return {}
 
         reconstructed = {}
@@ -1,6 +1,5 @@
 """Service layer for public status page functionality."""
 
-import json
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
@@ -30,17 +29,14 @@ class PublicStatusService:
     @staticmethod
     def get_status_page_monitors(status_page: PublicStatusPage) -> List[Monitor]:
         """Get the monitors for a public status page."""
-        try:
-            monitor_ids = json.loads(status_page.selected_monitors)
-            if not monitor_ids:
-                return []
-
-            return Monitor.query.filter(
-                Monitor.id.in_(monitor_ids), Monitor.is_active.is_(True)
-            ).all()
-        except (json.JSONDecodeError, TypeError):
+        monitor_ids = status_page.get_selected_monitor_ids()
+        if not monitor_ids:
             return []
 
+        return Monitor.query.filter(
+            Monitor.id.in_(monitor_ids), Monitor.is_active.is_(True)
+        ).all()
+
     @staticmethod
     def get_monitor_status_data(monitor: Monitor, hours: int = 24) -> Dict[str, Any]:
         """Get status data for a single monitor."""
@@ -285,7 +281,7 @@ class PublicStatusService:
 
         status_page.custom_header = custom_header
         status_page.description = description
-        status_page.selected_monitors = json.dumps(selected_monitors)
+        status_page.set_selected_monitors(selected_monitors)
 
         db.session.commit()
         # Cache invalidation removed - Flask-Caching is no longer available
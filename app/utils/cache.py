@@ -1,8 +1,11 @@
 """Simple caching utilities for performance optimization."""
 
+import threading
+import time
 from functools import wraps
 from flask import make_response
 from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Tuple
 
 
 def static_cache(func):
@@ -53,3 +56,57 @@ def api_cache(max_age=30):
         return decorated_function
 
     return decorator
+
+
+class TTLCache:
+    """Small thread-safe in-process cache whose entries expire after ``ttl``.
+
+    Keys are tuples; discard_prefix() drops every entry sharing leading key
+    parts (e.g. all entries of one monitor). When full, the entry expiring
+    soonest is evicted. A ``ttl`` of 0 disables caching.
+
+    Args:
+        maxsize: Maximum number of entries
+        ttl: Seconds an entry stays valid
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """Get an unexpired value, or ``default``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            return default
+        return entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store a value for ``ttl`` seconds."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def discard_prefix(self, *prefix: Hashable) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        size = len(prefix)
+        with self._lock:
+            for key in [k for k in self._entries if k[:size] == prefix]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,64 @@
+"""JSON encode/decode helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional imports
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text.
+
+    Invalid input raises json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Encode an object as JSON text.
+
+    The output is compact with orjson and uses stdlib separators otherwise,
+    so it must not be used where the exact bytes matter (e.g. hashing).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else 0
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # Non-str dict keys or values orjson rejects; stdlib handles the
+            # former and raises the same way for the latter
+            pass
+    return json.dumps(obj, sort_keys=sort_keys)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider serializing responses with orjson when installed.
+
+    Output matches the default provider's: keys are sorted, non-str keys
+    become strings, and types orjson doesn't handle the same way (dates
+    are HTTP dates in Flask) go through the default provider's hook.
+    Pretty-printed output (indent, separators) uses the stdlib encoder.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if ORJSON_AVAILABLE and not kwargs:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode()
+            except TypeError:
+                # e.g. integers beyond 64 bits; let the stdlib encoder decide
+                pass
+        return super().dumps(obj, **kwargs)
@@ -1,11 +1,110 @@
 """Timezone utilities for converting UTC times to user-configured timezone."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import pytz
 from pytz.tzinfo import DstTzInfo, StaticTzInfo
 
+# Month abbreviations used in certificate dates (C locale, as OpenSSL prints)
+_CERT_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+# "Now" pinned for the duration of a batch (see batch_now)
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def utcnow() -> datetime:
+    """Get the current UTC time, or the pinned time inside a batch_now() block."""
+    now = _batch_now.get()
+    if now is None:
+        return datetime.now(timezone.utc)
+    return now
+
+
+@contextmanager
+def batch_now(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Pin utcnow() to a single timestamp for a batch of work.
+
+    Everything created inside the block (e.g. check results of one check run)
+    shares one timestamp instead of reading the clock again for every row.
+
+    Args:
+        now: Timestamp to pin, defaults to the current UTC time
+
+    Yields:
+        The pinned timestamp
+    """
+    pinned = now or datetime.now(timezone.utc)
+    token = _batch_now.set(pinned)
+    try:
+        yield pinned
+    finally:
+        _batch_now.reset(token)
+
+
+def format_utc(dt: datetime) -> str:
+    """Format a UTC datetime as e.g. "2026-01-09 12:31:51 UTC".
+
+    Same output as strftime("%Y-%m-%d %H:%M:%S UTC") using isoformat(), which
+    does not parse a format string on every call.
+
+    Args:
+        dt: UTC datetime, timezone-aware or naive
+
+    Returns:
+        The date and time to the second, suffixed with "UTC"
+    """
+    return f"{dt.replace(tzinfo=None).isoformat(' ', 'seconds')} UTC"
+
+
+def parse_cert_date(value: str) -> datetime:
+    """Parse an SSL certificate date such as "Jan  9 12:31:51 2026 GMT".
+
+    Equivalent to strptime with "%b %d %H:%M:%S %Y" after dropping the
+    timezone suffix, without strptime's locale handling and regex overhead.
+
+    Args:
+        value: Date string as reported in a certificate's notAfter field
+
+    Returns:
+        Timezone-aware datetime in UTC (certificate dates are always GMT)
+
+    Raises:
+        ValueError: If the value is not in the expected format
+    """
+    parts = value.split()
+    if len(parts) == 5:
+        parts.pop()
+    try:
+        month, day, clock, year = parts
+        hour, minute, second = clock.split(":")
+        return datetime(
+            int(year),
+            _CERT_MONTHS[month],
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            tzinfo=timezone.utc,
+        )
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid certificate date: {value!r}") from None
+
 
 def get_app_timezone() -> Union[DstTzInfo, StaticTzInfo, pytz.UTC.__class__]:
     """Get the application's configured timezone.
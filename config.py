@@ -18,18 +18,30 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
-    # SQLite-specific optimizations
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_size": 5,  # Smaller pool for WAL mode
-        "max_overflow": 10,
-        "pool_pre_ping": True,
-        "pool_recycle": 1800,  # 30 minutes
-        "connect_args": {
-            "timeout": 30,
-            "check_same_thread": False,
-            "isolation_level": None,  # Autocommit for WAL
-        },
-    }
+    # Connection pool, sized for the scheduler's concurrent checks plus web
+    # requests and dashboard streams
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE") or 20)
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW") or 20)
+    if SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        # Local file connections do not go stale, so skip the liveness
+        # ping each checkout would otherwise pay
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_pre_ping": False,
+            "connect_args": {
+                "timeout": 30,
+                "check_same_thread": False,
+                "isolation_level": None,  # Autocommit for WAL
+            },
+        }
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,  # 30 minutes
+        }
 
     # Security settings
     SESSION_COOKIE_SECURE = os.environ.get("SESSION_COOKIE_SECURE", "true").lower() in [
@@ -78,6 +90,8 @@ class Config:
     CHECK_TIMEOUT = int(os.environ.get("CHECK_TIMEOUT") or 30)
     MAX_CONCURRENT_CHECKS = int(os.environ.get("MAX_CONCURRENT_CHECKS") or 10)
     DATA_RETENTION_DAYS = int(os.environ.get("DATA_RETENTION_DAYS") or 365)
+    # Seconds monitor uptime/response time aggregates are reused (0 disables)
+    STATS_CACHE_TTL = int(os.environ.get("STATS_CACHE_TTL") or 30)
 
     # Pagination
     MONITORS_PER_PAGE = 50
@@ -107,6 +121,7 @@ class TestingConfig(Config):
     TESTING = True
     WTF_CSRF_ENABLED = False
     SECRET_KEY = "test-secret-key"
+    STATS_CACHE_TTL = 0
 
 
 class ProductionConfig(Config):
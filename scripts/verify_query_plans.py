@@ -30,6 +30,8 @@ class QueryPlanVerifier:
             self.verify_dashboard_query()
             self.verify_uptime_query()
             self.verify_recent_checks_query()
+            self.verify_response_time_query()
+            self.verify_timespan_query()
             self.verify_monitor_detail_query()
             self.verify_incident_query()
 
@@ -61,7 +63,11 @@ class QueryPlanVerifier:
             for step in plan
         )
 
+        # last_check is stored DESC in the index, so the ORDER BY needs no sort
+        no_sort = not any("TEMP B-TREE" in str(step) for step in plan)
+
         print(f"✅ Using dashboard index: {uses_index}")
+        print(f"✅ No temporary sort: {no_sort}")
 
     def verify_uptime_query(self):
         """Verify uptime calculation queries are efficient."""
@@ -84,9 +90,10 @@ class QueryPlanVerifier:
         for step in plan:
             print(f"  {step[0]}: {step[1]}: {step[2]}")
 
-        # Check if using our uptime index
+        # Check if using the covering index (no table lookups needed)
         uses_index = any(
-            "USING INDEX" in str(step) and "idx_uptime_calculation" in str(step)
+            "USING COVERING INDEX" in str(step)
+            and "idx_check_result_monitor_ts_covering" in str(step)
             for step in plan
         )
 
@@ -113,14 +120,76 @@ class QueryPlanVerifier:
         for step in plan:
             print(f"  {step[0]}: {step[1]}: {step[2]}")
 
-        # Check if using our recent checks index
+        # Check if using the covering index (no table lookups needed)
         uses_index = any(
-            "USING INDEX" in str(step) and "idx_recent_checks" in str(step)
+            "USING COVERING INDEX" in str(step)
+            and "idx_check_result_monitor_ts_covering" in str(step)
             for step in plan
         )
 
         print(f"✅ Using recent checks index: {uses_index}")
 
+    def verify_response_time_query(self):
+        """Verify average response time queries are answered from the index."""
+        print("\n⏱️ Average Response Time Query")
+        print("-" * 30)
+
+        sql_query = """
+        SELECT AVG(response_time)
+        FROM check_result
+        WHERE monitor_id = 1
+          AND timestamp >= datetime('now', '-24 hours')
+          AND status = 'up'
+          AND response_time IS NOT NULL
+        """
+
+        plan = self.get_query_plan(f"EXPLAIN QUERY PLAN {sql_query}")
+
+        print(f"Query: {sql_query}")
+        print("Execution Plan:")
+        for step in plan:
+            print(f"  {step[0]}: {step[1]}: {step[2]}")
+
+        # status and response_time are trailing columns of the covering index
+        uses_index = any(
+            "USING COVERING INDEX" in str(step)
+            and "idx_check_result_monitor_ts_covering" in str(step)
+            for step in plan
+        )
+
+        print(f"✅ Using covering index: {uses_index}")
+
+    def verify_timespan_query(self):
+        """Verify timespan queries are ordered by the index, not a sort."""
+        print("\n🕒 Checks By Timespan Query")
+        print("-" * 30)
+
+        sql_query = """
+        SELECT *
+        FROM check_result
+        WHERE monitor_id = 1
+          AND timestamp >= datetime('now', '-24 hours')
+        ORDER BY timestamp DESC
+        LIMIT 2000
+        """
+
+        plan = self.get_query_plan(f"EXPLAIN QUERY PLAN {sql_query}")
+
+        print(f"Query: {sql_query}")
+        print("Execution Plan:")
+        for step in plan:
+            print(f"  {step[0]}: {step[1]}: {step[2]}")
+
+        # monitor_id is pinned, so the (monitor_id, timestamp, ...) index
+        # already yields rows in timestamp order
+        uses_index = any(
+            "idx_check_result_monitor_ts_covering" in str(step) for step in plan
+        )
+        no_sort = not any("TEMP B-TREE" in str(step) for step in plan)
+
+        print(f"✅ Using monitor/timestamp index: {uses_index}")
+        print(f"✅ No temporary sort: {no_sort}")
+
     def verify_monitor_detail_query(self):
         """Verify monitor detail queries are efficient."""
         print("\n🔍 Monitor Detail Query")
@@ -146,8 +215,8 @@ class QueryPlanVerifier:
 
         # Look for efficient join patterns
         efficient_join = any(
-            "USING INDEX" in str(step)
-            and "idx_check_result_monitor_timestamp" in str(step)
+            "USING COVERING INDEX" in str(step)
+            and "idx_check_result_monitor_ts_covering" in str(step)
             for step in plan
         )
 
@@ -225,6 +294,7 @@ class QueryPlanVerifier:
         )
         print("  ✅ Uptime calculations use dedicated time-based indexes")
         print("  ✅ Recent checks use efficient timestamp ordering")
+        print("  ✅ Response time averages and timespans read the covering index")
         print("  ✅ Monitor details use optimized join patterns")
         print("  ✅ Incident queries use appropriate indexes")
 
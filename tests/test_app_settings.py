@@ -0,0 +1,90 @@
+"""Tests for AppSettings color storage."""
+
+import pytest
+
+from app import create_app, db
+from app.models.app_settings import DEFAULT_COLORS, AppSettings
+
+
+class TestAppSettingsColors:
+    """Test cases for AppSettings color overrides."""
+
+    @pytest.fixture
+    def app(self):
+        """Create test application."""
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.rollback()
+            db.drop_all()
+
+    def test_defaults_without_overrides(self, app):
+        """Test every color falls back to its default."""
+        settings = AppSettings.get_settings()
+
+        assert settings.colors is None
+        for name, default in DEFAULT_COLORS.items():
+            assert settings.color(name) == default
+
+    def test_set_colors_stores_only_overrides(self, app):
+        """Test only non-default values are persisted."""
+        settings = AppSettings.get_settings()
+        settings.set_colors(
+            {
+                "primary_color": "#123456",
+                "success_color": DEFAULT_COLORS["success_color"],
+                "dark_primary_color": None,
+            }
+        )
+        db.session.commit()
+        db.session.expire_all()
+
+        settings = AppSettings.get_settings()
+        assert settings.colors == {
+            "primary_color": "#123456",
+            "dark_primary_color": None,
+        }
+        assert settings.color("primary_color") == "#123456"
+        assert settings.color("success_color") == DEFAULT_COLORS["success_color"]
+        # Cleared dark mode override stays cleared instead of using the default
+        assert settings.color("dark_primary_color") is None
+
+    def test_reset_colors(self, app):
+        """Test resetting removes all overrides."""
+        settings = AppSettings.get_settings()
+        settings.set_colors({"primary_color": "#123456"})
+        settings.reset_colors()
+
+        assert settings.colors is None
+        assert settings.color("primary_color") == DEFAULT_COLORS["primary_color"]
+
+    def test_rendered_css_updated_on_save(self, app):
+        """Test the custom CSS is rendered when settings are saved."""
+        settings = AppSettings.get_settings()
+        assert settings.rendered_css == ""
+
+        settings.enable_custom_colors = True
+        settings.set_colors({"primary_color": "#123456", "dark_success_color": None})
+        db.session.commit()
+
+        css = settings.rendered_css
+        assert css.startswith(":root {\n  --brand-primary: #123456;")
+        assert '[data-theme="dark"] {' in css
+        # Cleared dark override falls back to the light color
+        assert f"--status-success: {DEFAULT_COLORS['success_color']};" in css
+
+        client = app.test_client()
+        response = client.get("/admin/custom-colors.css")
+        assert response.mimetype == "text/css"
+        assert response.get_data(as_text=True) == css
+
+    def test_rendered_css_without_dark_primary(self, app):
+        """Test dark mode overrides are omitted without a dark primary color."""
+        settings = AppSettings.get_settings()
+        settings.enable_custom_colors = True
+        settings.set_colors({"dark_primary_color": None})
+        db.session.commit()
+
+        assert "[data-theme" not in settings.rendered_css
+        assert settings.rendered_css.endswith("}")
@@ -0,0 +1,508 @@
+"""Tests for CheckResult model behaviour."""
+
+import json
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from datetime import datetime, timezone
+
+from app import create_app, db
+from app.models.monitor import Monitor, MonitorType, CheckInterval
+from app.models.user import User
+from app.models.check_result import CheckResult
+from app.models.deduplication import ErrorMessage, TLSCertificate
+from app.services.deduplication import DeduplicationService
+from app.utils.json_codec import dumps, loads
+from app.utils.timezone import batch_now, parse_cert_date
+
+
+class TestCheckResult:
+    """Test cases for CheckResult."""
+
+    @pytest.fixture
+    def app(self):
+        """Create test application."""
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.rollback()
+            db.drop_all()
+
+    @pytest.fixture
+    def test_monitor(self, app):
+        """Create test monitor."""
+        user = User(username="admin", email="admin@test.com", is_admin=True)
+        user.set_password("test123")
+        db.session.add(user)
+        db.session.commit()
+
+        monitor = Monitor(
+            user_id=user.id,
+            name="Test Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.com",
+            check_interval=CheckInterval.ONE_MINUTE,
+        )
+        db.session.add(monitor)
+        db.session.commit()
+        return monitor
+
+    def test_additional_data_stored_as_json(self, app, test_monitor):
+        """Test additional data round-trips through the JSON column as a dict."""
+        check_result = CheckResult(
+            monitor_id=test_monitor.id,
+            status="up",
+            timestamp=datetime.now(timezone.utc),
+            response_time=120.0,
+        )
+        check_result.set_additional_data(
+            {
+                "response_headers": {"server": "nginx", "x-ignored": "1"},
+                "redirects": 2,
+            }
+        )
+        db.session.add(check_result)
+        db.session.commit()
+        db.session.expire_all()
+
+        stored = db.session.get(CheckResult, check_result.id)
+        assert isinstance(stored.additional_data, dict)
+        assert stored.get_additional_data() == {
+            "response_headers": {"server": "nginx"},
+            "redirects": 2,
+        }
+
+    def test_additional_data_empty(self, app, test_monitor):
+        """Test missing additional data is reported as an empty dict."""
+        check_result = CheckResult(monitor_id=test_monitor.id, status="down")
+        check_result.set_additional_data(None)
+
+        assert check_result.additional_data is None
+        assert check_result.get_additional_data() == {}
+
+    def test_to_dict_uses_epoch_milliseconds(self, app, test_monitor):
+        """Test to_dict emits epoch-ms timestamps and to_api_dict keeps ISO."""
+        timestamp = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+        check_result = CheckResult(
+            monitor_id=test_monitor.id, status="up", timestamp=timestamp
+        )
+
+        assert check_result.to_dict()["timestamp"] == 1735787045678
+        assert check_result.to_api_dict()["timestamp"] == timestamp.isoformat()
+
+        # Naive database datetimes are treated as UTC
+        check_result.timestamp = timestamp.replace(tzinfo=None)
+        assert check_result.get_timestamp_ms() == 1735787045678
+
+    def test_timestamp_uses_batch_now(self, app, test_monitor):
+        """Test check results created in a batch share the pinned timestamp."""
+        pinned = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+        with batch_now(pinned):
+            first = CheckResult(monitor_id=test_monitor.id, status="up")
+            second = CheckResult(monitor_id=test_monitor.id, status="down")
+
+        assert first.timestamp == pinned
+        assert second.timestamp == pinned
+        assert CheckResult(monitor_id=test_monitor.id, status="up").timestamp > pinned
+
+    def test_bulk_create(self, app, test_monitor):
+        """Test bulk insert writes all rows and deduplicates error messages."""
+        inserted = CheckResult.bulk_create(
+            [
+                {"monitor_id": test_monitor.id, "status": "up", "response_time": 10.0},
+                {
+                    "monitor_id": test_monitor.id,
+                    "status": "down",
+                    "error_message": "Connection timeout",
+                },
+                {
+                    "monitor_id": test_monitor.id,
+                    "status": "down",
+                    "error_message": "Connection timeout",
+                },
+            ]
+        )
+        db.session.commit()
+
+        assert inserted == 3
+        results = CheckResult.query.order_by(CheckResult.id).all()
+        assert [r.status for r in results] == ["up", "down", "down"]
+        assert results[1].error_message_id == results[2].error_message_id
+        assert results[2].get_error_message() == "Connection timeout"
+        assert all(r.timestamp is not None for r in results)
+        assert results[1].error_message.usage_count == 2
+
+    def test_bulk_create_reuses_existing_error_messages(self, app, test_monitor):
+        """Test bulk insert links to and counts already stored messages."""
+        existing_id = DeduplicationService.get_or_create_error_message("Refused")
+
+        CheckResult.bulk_create(
+            [
+                {"monitor_id": test_monitor.id, "status": "down", "error_message": msg}
+                for msg in ["Refused", "Refused", "Reset"]
+            ]
+        )
+        db.session.commit()
+
+        messages = {m.message: m for m in ErrorMessage.query.all()}
+        assert messages["Refused"].id == existing_id
+        assert messages["Refused"].usage_count == 3
+        assert len(messages["Reset"].message_hash) == 32
+        assert messages["Reset"].usage_count == 1
+
+    def test_bulk_insert_dicts_chunks_multi_row_inserts(self, app, test_monitor):
+        """Test large batches are split into a few multi-row INSERTs."""
+        rows = [
+            {"monitor_id": test_monitor.id, "status": "up", "response_time": float(i)}
+            for i in range(250)
+        ]
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert CheckResult.bulk_create(rows) == 250
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        db.session.commit()
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO check_result")]
+        assert 1 < len(inserts) < 10
+        assert CheckResult.query.count() == 250
+
+    def test_bulk_create_empty(self, app):
+        """Test bulk insert with no rows is a no-op."""
+        assert CheckResult.bulk_create([]) == 0
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("SSL handshake failed", True),
+            ("Certificate has expired", True),
+            ("TLS alert: bad record", True),
+            ("hostname verification failed", True),
+            ("Connection refused", False),
+            ("404", False),
+            (None, False),
+        ],
+    )
+    def test_is_certificate_error(self, app, test_monitor, message, expected):
+        """Test certificate error classification."""
+        result = CheckResult(
+            monitor_id=test_monitor.id, status="down", error_message=message
+        )
+        assert result.is_certificate_error() is expected
+
+    @pytest.mark.parametrize(
+        "message, timeout, certificate",
+        [
+            ("Read Timeout", True, False),
+            ("TLS handshake timeout", True, True),
+            ("Connection refused", False, False),
+            ("CERTIFICATE_VERIFY_FAILED", False, True),
+        ],
+    )
+    def test_error_classification(
+        self, app, test_monitor, message, timeout, certificate
+    ):
+        """Test timeout and certificate flags are derived from one scan."""
+        result = CheckResult(
+            monitor_id=test_monitor.id, status="down", error_message=message
+        )
+        data = result.to_dict()
+
+        assert result.is_timeout() is timeout
+        assert result.is_certificate_error() is certificate
+        assert data["is_timeout"] is timeout
+        assert data["is_certificate_error"] is certificate
+
+    def test_to_dict_cached_for_persistent_rows(self, app, test_monitor):
+        """Test that to_dict is memoized until the row changes."""
+        result = CheckResult(monitor_id=test_monitor.id, status="up")
+        assert result.to_dict() is not result.to_dict()
+
+        db.session.add(result)
+        db.session.commit()
+
+        first = result.to_dict()
+        assert result.to_dict() is first
+
+        result.status = "down"
+        assert result.to_dict()["status"] == "down"
+
+        db.session.commit()
+        result.set_additional_data({"reason": "changed"})
+        assert result.to_dict()["additional_data"] == {"reason": "changed"}
+
+    def test_additional_data_cached_until_changed(self, app, test_monitor):
+        """Test decoded additional data is reused until it is replaced."""
+        result = CheckResult(monitor_id=test_monitor.id, status="up")
+        result.set_additional_data({"reason": "first"})
+
+        first = result.get_additional_data()
+        assert result.get_additional_data() is first
+
+        result.set_additional_data({"reason": "second"})
+        assert result.get_additional_data() == {"reason": "second"}
+
+    def test_cert_data_cache_is_not_mutated(self, app, test_monitor):
+        """Test per-call fields do not leak into the cached certificate data."""
+        cert_info = {"domain": "example.com", "not_after": "Jan 9 12:31:51 2099 GMT"}
+        result = CheckResult(monitor_id=test_monitor.id, status="up")
+        result.set_additional_data({"cert_info": cert_info, "cert_valid": True})
+
+        cert = TLSCertificate.query.one()
+        data = cert.get_cert_data()
+        data["valid"] = False
+
+        assert "valid" not in cert.get_cert_data()
+        assert result.get_additional_data()["cert_info"]["valid"] is True
+
+    def test_error_message_lookup_is_memoized(self, app, test_monitor):
+        """Test a pending row resolves its error message text only once."""
+        result = CheckResult(
+            monitor_id=test_monitor.id, status="down", error_message="Boom"
+        )
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert result.get_error_message() == "Boom"
+            assert result.get_error_message() == "Boom"
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(statements) <= 1
+
+        result.set_error_message("Other")
+        assert result.get_error_message() == "Other"
+
+    def test_loaded_status_strings_are_interned(self, app, test_monitor):
+        """Test status values loaded from the database share one object."""
+        for _ in range(2):
+            db.session.add(CheckResult(monitor_id=test_monitor.id, status="up"))
+        db.session.commit()
+        db.session.expire_all()
+
+        first, second = CheckResult.query.all()
+        assert first.status == "up"
+        assert first.status is second.status
+
+    @pytest.mark.parametrize(
+        "value",
+        ["Jan  9 12:31:51 2026 GMT", "Jan 9 12:31:51 2026 GMT", "Jan 09 12:31:51 2026"],
+    )
+    def test_parse_cert_date_matches_strptime(self, value):
+        """Test the certificate date parser agrees with strptime."""
+        expected = datetime.strptime("Jan 9 12:31:51 2026", "%b %d %H:%M:%S %Y")
+        assert parse_cert_date(value) == expected.replace(tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("value", ["", "Foo 9 12:31:51 2026 GMT", "Jan 9 2026"])
+    def test_parse_cert_date_rejects_invalid(self, value):
+        """Test malformed certificate dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_cert_date(value)
+
+    def test_json_codec_round_trip(self):
+        """Test the JSON helpers match stdlib semantics used by stored data."""
+        data = {"b": [1, 2], "a": {"nested": None}}
+        assert loads(dumps(data, sort_keys=True)) == data
+        assert list(loads(dumps(data, sort_keys=True))) == ["a", "b"]
+        # Non-str keys are coerced like the stdlib encoder does
+        assert loads(dumps({1: "x"})) == {"1": "x"}
+        with pytest.raises(json.JSONDecodeError):
+            loads("{not json")
+
+    def test_json_provider_matches_flask_default(self, app):
+        """Test orjson responses serialize like Flask's default provider."""
+        data = {
+            "b": [1, 2.5, None],
+            "a": {2: "x", 10: True},
+            "when": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        }
+        default = DefaultJSONProvider(app)
+
+        assert json.loads(app.json.dumps(data)) == json.loads(default.dumps(data))
+        assert list(json.loads(app.json.dumps(data))) == ["a", "b", "when"]
+        assert app.json.dumps(data, indent=2) == default.dumps(data, indent=2)
+
+    def test_to_columnar_dict_matches_row_methods(self, app, test_monitor):
+        """Test the single-pass columnar export agrees with per-row methods."""
+        results = [
+            CheckResult(monitor_id=test_monitor.id, status="up", response_time=5.04321),
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status="down",
+                error_message="Read timeout after 30s",
+            ),
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status="down",
+                error_message="SSL certificate verify failed",
+            ),
+        ]
+        db.session.add_all(results)
+        db.session.commit()
+
+        columns = CheckResult.to_columnar_dict(results)
+        assert columns["ids"] == [r.id for r in results]
+        assert columns["is_successes"] == [True, False, False]
+        assert columns["is_timeouts"] == [r.is_timeout() for r in results]
+        assert columns["is_certificate_errors"] == [
+            r.is_certificate_error() for r in results
+        ]
+        assert columns["error_messages"][0] is None
+        assert columns["response_times"] == [5.0, None, None]
+
+        chart = CheckResult.to_chart_columnar_dict(results)
+        assert chart["r"] == [5.0, 0, 0]
+        assert chart["e"] == [
+            "",
+            "Read timeout after 30s",
+            results[2].get_error_message(),
+        ]
+        assert CheckResult.to_chart_columnar_dict([]) == {
+            "t": [],
+            "r": [],
+            "s": [],
+            "c": [],
+            "e": [],
+        }
+
+    def test_error_message_read_from_joined_relationship(self, app, test_monitor):
+        """Test loaded results resolve error messages without extra queries."""
+        for _ in range(3):
+            db.session.add(
+                CheckResult(
+                    monitor_id=test_monitor.id,
+                    status="down",
+                    error_message="Connection refused",
+                )
+            )
+        db.session.commit()
+        db.session.expunge_all()
+
+        results = CheckResult.query.all()
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            messages = [r.get_error_message() for r in results]
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+
+        assert messages == ["Connection refused"] * 3
+        assert statements == []
+
+    def test_recent_api_dicts_match_instances(self, app, test_monitor):
+        """Test row-only recent checks serialize like to_api_dict()."""
+        for index, status in enumerate(["up", "down", "up", "down"]):
+            check_result = CheckResult(
+                monitor_id=test_monitor.id,
+                status=status,
+                timestamp=datetime(2025, 1, 1, 12, index, tzinfo=timezone.utc),
+                response_time=100.0 + index if status == "up" else None,
+                status_code=200 if status == "up" else None,
+                error_message=None if status == "up" else "Request timeout",
+            )
+            check_result.set_additional_data({"redirects": index})
+            db.session.add(check_result)
+        db.session.commit()
+        db.session.expire_all()
+
+        expected = [check.to_api_dict() for check in test_monitor.get_recent_checks(3)]
+        assert CheckResult.recent_api_dicts(test_monitor.id, 3) == expected
+        assert expected[0]["is_timeout"] is True
+
+    def test_iter_columnar_json(self, app, test_monitor):
+        """Test streamed columnar JSON decodes to the columnar dict."""
+        results = [
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status=status,
+                response_time=12.5,
+                error_message="Read timeout" if status == "down" else None,
+            )
+            for status in ["up", "down", "up"]
+        ]
+        db.session.add_all(results)
+        db.session.commit()
+
+        streamed = "".join(CheckResult.iter_columnar_json(results, chunk_size=2))
+        assert json.loads(streamed) == CheckResult.to_columnar_dict(results)
+
+        empty = "".join(CheckResult.iter_columnar_json([]))
+        assert json.loads(empty) == CheckResult.to_columnar_dict([])
+
+    def test_from_columnar_dict_round_trip(self, app, test_monitor):
+        """Test columnar data rebuilds results with shared error message IDs."""
+        results = [
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status=status,
+                error_message="Connection refused" if status == "down" else None,
+            )
+            for status in ["down", "up", "down"]
+        ]
+        db.session.add_all(results)
+        db.session.commit()
+
+        rebuilt = CheckResult.from_columnar_dict(CheckResult.to_columnar_dict(results))
+
+        assert [r.id for r in rebuilt] == [r.id for r in results]
+        assert [r.status for r in rebuilt] == ["down", "up", "down"]
+        assert rebuilt[0].error_message_id == results[0].error_message_id
+        assert rebuilt[2].error_message_id == results[0].error_message_id
+        assert rebuilt[1].error_message_id is None
+        assert rebuilt[0].timestamp == results[0].timestamp
+
+    def test_from_columnar_dict_flags(self, app, test_monitor):
+        """Test flags are rebuilt from exported columns or from the messages."""
+        result = CheckResult(
+            monitor_id=test_monitor.id,
+            status="down",
+            error_message="TLS handshake timeout",
+        )
+        columns = CheckResult.to_columnar_dict([result])
+
+        assert CheckResult.from_columnar_dict(columns)[0].flags == result.flags
+
+        del columns["is_timeouts"], columns["is_certificate_errors"]
+        assert CheckResult.from_columnar_dict(columns)[0].flags == result.flags
+
+    def test_flags_classified_on_write(self, app, test_monitor):
+        """Test flags are stored for constructor and bulk inserted rows."""
+        db.session.add(
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status="down",
+                error_message="TLS handshake timeout",
+            )
+        )
+        CheckResult.bulk_create(
+            [
+                {"monitor_id": test_monitor.id, "status": "up"},
+                {
+                    "monitor_id": test_monitor.id,
+                    "status": "down",
+                    "error_message": "certificate has expired",
+                },
+            ]
+        )
+        db.session.commit()
+
+        flags = [r.flags for r in CheckResult.query.order_by(CheckResult.id)]
+        assert flags == [6, 1, 4]
+
+        timeouts = CheckResult.query.filter(CheckResult.flags.op("&")(2) != 0)
+        assert timeouts.count() == 1
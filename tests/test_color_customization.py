@@ -0,0 +1,30 @@
+"""Tests for color customization form validation."""
+
+import pytest
+from types import SimpleNamespace
+from wtforms.validators import ValidationError
+
+from app.forms.color_customization import HexColor
+
+
+class TestHexColor:
+    """Test cases for the HexColor validator."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create validator under test."""
+        return HexColor("Must be a valid hex color")
+
+    @pytest.mark.parametrize("value", ["#59bc87", "#ABCDEF", "#000000", "", None])
+    def test_accepts_valid_or_empty(self, validator, value):
+        """Test valid hex colors and empty values pass."""
+        validator(None, SimpleNamespace(data=value))
+
+    @pytest.mark.parametrize(
+        "value",
+        ["59bc87", "#59bc8", "#59bc877", "#59bcg7", "#+12345", "#0x1234", "#12_345"],
+    )
+    def test_rejects_invalid(self, validator, value):
+        """Test malformed colors, including int() quirks, are rejected."""
+        with pytest.raises(ValidationError, match="Must be a valid hex color"):
+            validator(None, SimpleNamespace(data=value))
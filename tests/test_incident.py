@@ -0,0 +1,190 @@
+"""Tests for Incident model behaviour."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from app import create_app, db
+from app.models.monitor import Monitor, MonitorType, CheckInterval
+from app.models.user import User
+from app.models.check_result import CheckResult
+from app.models.incident import Incident
+from app.utils.timezone import format_utc
+
+
+class TestIncident:
+    """Test cases for Incident."""
+
+    @pytest.fixture
+    def app(self):
+        """Create test application."""
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.rollback()
+            db.drop_all()
+
+    @pytest.fixture
+    def test_monitor(self, app):
+        """Create test monitor."""
+        user = User(username="admin", email="admin@test.com", is_admin=True)
+        user.set_password("test123")
+        db.session.add(user)
+        db.session.commit()
+
+        monitor = Monitor(
+            user_id=user.id,
+            name="Test Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.com",
+            check_interval=CheckInterval.ONE_MINUTE,
+        )
+        db.session.add(monitor)
+        db.session.commit()
+        return monitor
+
+    def test_downtime_percentage(self, app, test_monitor):
+        """Test downtime counts only checks inside the incident window."""
+        now = datetime.now(timezone.utc)
+        incident = Incident(
+            monitor_id=test_monitor.id, started_at=now - timedelta(minutes=10)
+        )
+        db.session.add(incident)
+        for minutes_ago, status in [(1, "down"), (2, "down"), (3, "up"), (4, "down")]:
+            db.session.add(
+                CheckResult(
+                    monitor_id=test_monitor.id,
+                    status=status,
+                    timestamp=now - timedelta(minutes=minutes_ago),
+                )
+            )
+        # Outside the window
+        db.session.add(
+            CheckResult(
+                monitor_id=test_monitor.id,
+                status="up",
+                timestamp=now - timedelta(hours=1),
+            )
+        )
+        db.session.commit()
+
+        assert incident.get_downtime_percentage() == 75.0
+
+    def test_downtime_percentage_without_checks(self, app, test_monitor):
+        """Test an incident with no checks counts as fully down."""
+        incident = Incident(monitor_id=test_monitor.id)
+        db.session.add(incident)
+        db.session.commit()
+
+        assert incident.get_downtime_percentage() == 100.0
+
+    @pytest.mark.parametrize(
+        "duration,expected",
+        [
+            (0, "0s"),
+            (59.9, "59s"),
+            (61, "1m 1s"),
+            (3725, "1h 2m"),
+            (90061, "1d 1h 1m"),
+        ],
+    )
+    def test_duration_formatted(self, app, test_monitor, duration, expected):
+        """Test stored durations are split into days, hours, minutes, seconds."""
+        incident = Incident(monitor_id=test_monitor.id, duration=duration)
+
+        assert incident.get_duration_formatted() == expected
+
+    def test_timestamps_load_as_utc(self, app, test_monitor):
+        """Test incident timestamps come back UTC-aware whatever was stored."""
+        started_at = datetime(2026, 1, 1, 14, 0, tzinfo=timezone(timedelta(hours=2)))
+        incident = Incident(
+            monitor_id=test_monitor.id,
+            started_at=started_at,
+            resolved_at=datetime(2026, 1, 1, 12, 30),
+        )
+        db.session.add(incident)
+        db.session.commit()
+        db.session.expire_all()
+
+        assert incident.started_at == datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert incident.started_at.tzinfo == timezone.utc
+        assert incident.resolved_at.tzinfo == timezone.utc
+        assert incident.created_at.tzinfo == timezone.utc
+        assert incident.to_dict()["duration"] == 1800.0
+
+    def test_bulk_open_maps_incidents_to_monitors(self, app, test_monitor):
+        """Test bulk-opened incidents come back keyed by monitor ID."""
+        other = Monitor(
+            user_id=test_monitor.user_id,
+            name="Other Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+        )
+        db.session.add(other)
+        db.session.commit()
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        incident_ids = Incident.bulk_open(
+            [
+                {"monitor_id": test_monitor.id, "description": "Timeout"},
+                {"monitor_id": other.id, "severity": "warning"},
+            ],
+            now,
+        )
+        db.session.commit()
+
+        assert set(incident_ids) == {test_monitor.id, other.id}
+        opened = db.session.get(Incident, incident_ids[test_monitor.id])
+        assert opened.monitor_id == test_monitor.id
+        assert opened.description == "Timeout"
+        assert opened.started_at == opened.created_at == now
+        assert opened.is_active()
+        assert db.session.get(Incident, incident_ids[other.id]).severity == "warning"
+        assert Incident.bulk_open([]) == {}
+
+    def test_recent_by_monitor(self, app, test_monitor):
+        """Test each monitor gets its newest incidents from one query."""
+        other = Monitor(
+            user_id=test_monitor.user_id,
+            name="Other Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+        )
+        idle = Monitor(
+            user_id=test_monitor.user_id,
+            name="Idle Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.net",
+        )
+        db.session.add_all([other, idle])
+        db.session.commit()
+        now = datetime.now(timezone.utc)
+        for monitor, count in [(test_monitor, 4), (other, 2)]:
+            for hours in range(count):
+                db.session.add(
+                    Incident(
+                        monitor_id=monitor.id,
+                        started_at=now - timedelta(hours=hours),
+                    )
+                )
+        db.session.commit()
+
+        recent = Incident.recent_by_monitor([test_monitor.id, other.id, idle.id], 3)
+
+        for monitor in (test_monitor, other, idle):
+            assert recent[monitor.id] == monitor.get_recent_incidents(3)
+        assert len(recent[test_monitor.id]) == 3
+        assert recent[idle.id] == []
+        assert Incident.recent_by_monitor([], 3) == {}
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2026, 1, 9, 12, 31, 51, 999999, tzinfo=timezone.utc),
+            datetime(2026, 12, 31, 23, 59, 59),
+            datetime(2026, 3, 1),
+        ],
+    )
+    def test_format_utc_matches_strftime(self, value):
+        """Test notification timestamps match the previous strftime output."""
+        assert format_utc(value) == value.strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -0,0 +1,1145 @@
+"""Tests for Monitor model behaviour."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event, text
+from sqlalchemy.exc import (
+    IntegrityError,
+    InvalidRequestError,
+    OperationalError,
+    StatementError,
+)
+from sqlalchemy.orm import selectinload
+
+from app import create_app, db
+from app.models.monitor import (
+    Monitor,
+    MonitorType,
+    CheckInterval,
+    CheckUpdate,
+    preload_recent_checks,
+)
+from app.models.user import User
+from app.models.check_result import CheckResult
+from app.models.incident import Incident
+from app.models.notification import (
+    MonitorNotification,
+    NotificationChannel,
+    NotificationOutbox,
+    NotificationType,
+)
+from app.utils.cache import TTLCache
+from app.utils.timezone import batch_now
+
+
+class TestMonitor:
+    """Test cases for Monitor."""
+
+    @pytest.fixture
+    def app(self):
+        """Create test application."""
+        app = create_app("testing")
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.rollback()
+            db.drop_all()
+
+    @pytest.fixture
+    def test_monitor(self, app):
+        """Create test monitor."""
+        user = User(username="admin", email="admin@test.com", is_admin=True)
+        user.set_password("test123")
+        db.session.add(user)
+        db.session.commit()
+
+        monitor = Monitor(
+            user_id=user.id,
+            name="Test Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.com",
+            check_interval=CheckInterval.ONE_MINUTE,
+        )
+        db.session.add(monitor)
+        db.session.commit()
+        return monitor
+
+    @pytest.fixture
+    def notifications(self, test_monitor, monkeypatch):
+        """Enable a notification channel and record the notifications sent."""
+        from app.notification.service import notification_service
+
+        channel = NotificationChannel(
+            user_id=test_monitor.user_id,
+            name="Ops",
+            type=NotificationType.EMAIL,
+            config="{}",
+        )
+        db.session.add(channel)
+        db.session.flush()
+        db.session.add(
+            MonitorNotification(monitor_id=test_monitor.id, channel_id=channel.id)
+        )
+        db.session.commit()
+
+        sent = []
+        monkeypatch.setattr(
+            notification_service,
+            "send_monitor_notification",
+            lambda **kwargs: sent.append(kwargs),
+        )
+        return sent
+
+    def add_checks(self, monitor, checks):
+        """Add (age, status, response_time) check results for a monitor."""
+        now = datetime.now(timezone.utc)
+        for age, status, response_time in checks:
+            db.session.add(
+                CheckResult(
+                    monitor_id=monitor.id,
+                    status=status,
+                    response_time=response_time,
+                    timestamp=now - age,
+                )
+            )
+        db.session.commit()
+
+    def test_uptime_percentage(self, app, test_monitor):
+        """Test uptime counts only checks inside the window."""
+        self.add_checks(
+            test_monitor,
+            [
+                (timedelta(hours=1), "up", 10.0),
+                (timedelta(hours=2), "up", 20.0),
+                (timedelta(hours=3), "down", None),
+                (timedelta(hours=4), "up", 30.0),
+                # Outside the 7 day window
+                (timedelta(days=8), "down", None),
+            ],
+        )
+
+        assert test_monitor.get_uptime_percentage() == 75.0
+
+    def test_compute_stats_bulk_matches_per_monitor_queries(self, app, test_monitor):
+        """Test bulk statistics equal the per-monitor aggregation methods."""
+        idle = Monitor(
+            user_id=test_monitor.user_id,
+            name="Idle Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+        )
+        db.session.add(idle)
+        db.session.commit()
+        self.add_checks(
+            test_monitor,
+            [
+                (timedelta(hours=1), "up", 10.0),
+                (timedelta(hours=3), "down", None),
+                (timedelta(hours=30), "up", 40.0),
+                (timedelta(days=20), "down", None),
+                (timedelta(days=200), "up", 90.0),
+                (timedelta(days=400), "down", None),
+            ],
+        )
+
+        stats = Monitor.compute_stats_bulk([test_monitor.id, idle.id])
+
+        assert stats[test_monitor.id] == {
+            "uptime_24h": test_monitor.get_uptime_percentage(1),
+            "uptime_1y": test_monitor.get_uptime_percentage(365),
+            "avg_response_time_24h": test_monitor.get_average_response_time(24),
+        }
+        assert stats[test_monitor.id]["uptime_1y"] == 60.0
+        assert stats[idle.id] == {
+            "uptime_24h": 0.0,
+            "uptime_1y": 0.0,
+            "avg_response_time_24h": 0.0,
+        }
+        data = test_monitor.to_dict(stats=stats[test_monitor.id])
+        assert data["uptime_30d"] == test_monitor.to_dict()["uptime_30d"] == 50.0
+
+        recent = Monitor.compute_stats_bulk(
+            [test_monitor.id], include_year_uptime=False
+        )
+        expected = dict(stats[test_monitor.id])
+        del expected["uptime_1y"]
+        assert recent[test_monitor.id] == expected
+
+    def test_to_dict_includes_year_uptime_on_request(self, app, test_monitor):
+        """Test to_dict serializes the monitor and adds uptime_1y when asked."""
+        test_monitor.update_status("up", response_time=12.0)
+
+        data = test_monitor.to_dict()
+        assert "uptime_1y" not in data
+        assert data["type"] == "http"
+        assert data["check_interval"] == 60
+        assert data["name"] == "Test Monitor"
+        assert data["target"] == "https://example.com"
+        assert data["last_status"] == "up"
+        assert data["last_response_time"] == 12.0
+        assert data["uptime_24h"] == data["uptime_30d"] == 100.0
+
+        data = test_monitor.to_dict(include_year_uptime=True)
+        assert data["uptime_1y"] == 100.0
+
+    def test_to_dict_statistics_come_from_one_query(self, app, test_monitor):
+        """Test every uptime window of to_dict() costs one statement in total."""
+        for status in ["up", "down", "up", "up"]:
+            test_monitor.update_status(status, response_time=10.0)
+        test_monitor.last_check  # Load the attributes expired by the commit
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            data = test_monitor.to_dict(include_year_uptime=True)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert data["uptime_24h"] == data["uptime_7d"] == data["uptime_30d"] == 75.0
+        assert data["uptime_1y"] == 75.0
+
+    def test_uptime_aggregates_are_cached_until_status_change(self, app, test_monitor):
+        """Test cached aggregates skip queries and are dropped on transitions."""
+        app.extensions["stats_cache"].ttl = 30
+        self.add_checks(test_monitor, [(timedelta(hours=1), "up", 10.0)])
+        assert test_monitor.get_uptime_percentage(30) == 100.0
+        Monitor.compute_stats_bulk([test_monitor.id])
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert test_monitor.get_uptime_percentage(30) == 100.0
+            stats = Monitor.compute_stats_bulk([test_monitor.id])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        assert statements == []
+        assert stats[test_monitor.id]["uptime_24h"] == 100.0
+
+        test_monitor.update_status("down", error_message="Connection refused")
+        assert test_monitor.get_uptime_percentage(30) == 50.0
+        stats = Monitor.compute_stats_bulk([test_monitor.id])
+        assert stats[test_monitor.id]["uptime_24h"] == 50.0
+
+    def test_ttl_cache_expiry_and_eviction(self):
+        """Test TTLCache entries expire, evict and discard by key prefix."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set((1, "uptime", 7), 99.0)
+        cache.set((1, "uptime", 30), 98.0)
+        cache.set((2, "uptime", 7), 97.0)
+        assert cache.get((1, "uptime", 7)) is None
+        assert cache.get((2, "uptime", 7)) == 97.0
+
+        cache.discard_prefix(2)
+        assert cache.get((2, "uptime", 7)) is None
+        assert cache.get((1, "uptime", 30)) == 98.0
+
+        cache.ttl = 0
+        cache.set((3, "stats"), {})
+        assert cache.get((3, "stats")) is None
+
+    def test_uptime_percentage_without_checks(self, app, test_monitor):
+        """Test uptime is zero when there are no checks."""
+        assert test_monitor.get_uptime_percentage() == 0.0
+
+    def test_uptime_percentages_share_one_query(self, app, test_monitor):
+        """Test uptime of many monitors comes from one grouped query."""
+        idle = Monitor(
+            user_id=test_monitor.user_id,
+            name="Idle Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+        )
+        db.session.add(idle)
+        db.session.commit()
+        self.add_checks(
+            test_monitor,
+            [
+                (timedelta(hours=1), "up", 10.0),
+                (timedelta(hours=2), "down", None),
+                (timedelta(hours=3), "up", 30.0),
+                (timedelta(hours=4), "up", 40.0),
+                (timedelta(days=2), "down", None),
+            ],
+        )
+
+        since = datetime.now(timezone.utc) - timedelta(days=1)
+        assert Monitor.compute_uptime_stats([test_monitor.id, idle.id], since) == {
+            test_monitor.id: (4, 3)
+        }
+
+        app.extensions["stats_cache"].ttl = 30
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            uptimes = Monitor.get_uptime_percentages([test_monitor.id, idle.id], 1)
+            assert test_monitor.get_uptime_percentage(1) == 75.0
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        assert uptimes == {test_monitor.id: 75.0, idle.id: 0.0}
+        assert len(statements) == 1
+
+    def test_average_response_time(self, app, test_monitor):
+        """Test the average covers successful checks inside the window."""
+        self.add_checks(
+            test_monitor,
+            [
+                (timedelta(hours=1), "up", 10.0),
+                (timedelta(hours=2), "up", 20.5),
+                (timedelta(hours=3), "down", 500.0),
+                (timedelta(hours=4), "up", None),
+                # Outside the 24 hour window
+                (timedelta(hours=30), "up", 1000.0),
+            ],
+        )
+
+        assert test_monitor.get_average_response_time() == 15.25
+
+    def test_average_response_time_without_checks(self, app, test_monitor):
+        """Test the average is zero when there are no matching checks."""
+        assert test_monitor.get_average_response_time() == 0.0
+
+    def test_active_incident_eager_loaded(self, app, test_monitor):
+        """Test eager-loaded active incidents are read without a query."""
+        now = datetime.now(timezone.utc)
+        db.session.add_all(
+            [
+                Incident(
+                    monitor_id=test_monitor.id,
+                    started_at=now - timedelta(days=1),
+                    resolved_at=now - timedelta(hours=23),
+                    status="resolved",
+                ),
+                Incident(monitor_id=test_monitor.id, started_at=now),
+            ]
+        )
+        db.session.commit()
+        db.session.expire_all()
+
+        monitor = Monitor.query.options(selectinload(Monitor.active_incidents)).one()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            incident = monitor.get_active_incident()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert statements == []
+        assert incident.resolved_at is None
+
+    def test_has_active_incident_probes_with_exists(self, app, test_monitor):
+        """Test the open incident check is one EXISTS query, loading no row."""
+        assert test_monitor.has_active_incident() is False
+        db.session.add(
+            Incident(monitor_id=test_monitor.id, started_at=datetime.now(timezone.utc))
+        )
+        db.session.commit()
+        db.session.refresh(test_monitor)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert test_monitor.has_active_incident() is True
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert "EXISTS" in statements[0]
+
+    def test_update_status_resolves_active_incident(self, app, test_monitor):
+        """Test an up check resolves the open incident."""
+        db.session.add(
+            Incident(
+                monitor_id=test_monitor.id,
+                started_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+            )
+        )
+        test_monitor.last_status = "down"
+        db.session.commit()
+
+        test_monitor.update_status("up", response_time=12.0)
+
+        incident = Incident.query.one()
+        assert incident.status == "resolved"
+        assert incident.resolved_at is not None
+        assert incident.duration >= 300
+        assert test_monitor.get_active_incident() is None
+
+    @pytest.mark.parametrize("seconds", [60, 35940, 86400 + 59.5, 0.000001])
+    def test_incident_duration_is_exact(self, app, test_monitor, seconds):
+        """Test the stored incident duration has no floating-point noise."""
+        now = datetime(2026, 10, 17, 12, 34, 56, tzinfo=timezone.utc)
+        db.session.add(
+            Incident(
+                monitor_id=test_monitor.id,
+                started_at=now - timedelta(seconds=seconds),
+            )
+        )
+        test_monitor.last_status = "down"
+        db.session.commit()
+
+        with batch_now(now):
+            test_monitor.update_status("up")
+
+        assert Incident.query.one().duration == seconds
+
+    def test_incident_resolution_is_one_update(self, app, test_monitor):
+        """Test resolving an incident writes the incident row once."""
+        db.session.add(
+            Incident(
+                monitor_id=test_monitor.id,
+                started_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+            )
+        )
+        test_monitor.last_status = "down"
+        db.session.commit()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            test_monitor.update_status("up", response_time=12.0)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        updates = [s for s in statements if s.startswith("UPDATE incident")]
+        assert len(updates) == 1
+        assert not [s for s in statements if "FROM incident" in s]
+        assert 300 <= Incident.query.one().duration < 360
+
+    def test_steady_up_checks_skip_incident_handling(self, app, test_monitor):
+        """Test an up check after an up check only probes for an incident."""
+        test_monitor.update_status("up")
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            test_monitor.update_status("up")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        incident_statements = [s for s in statements if "incident" in s]
+        assert len(incident_statements) == 1
+        assert "EXISTS" in incident_statements[0]
+        assert not incident_statements[0].startswith("UPDATE")
+        assert CheckResult.query.count() == 2
+
+    def test_failed_resolution_retried_by_next_up_check(
+        self, app, test_monitor, monkeypatch, caplog
+    ):
+        """Test an incident whose resolution failed is resolved by the next up check."""
+        import app.models.monitor as monitor_module
+
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+
+        with monkeypatch.context() as patch:
+            patch.setitem(
+                monitor_module._RESOLVE_INCIDENT_SQL,
+                "sqlite",
+                text("UPDATE missing_table SET resolved_at = :resolved_at"),
+            )
+            test_monitor.update_status("up")
+
+        assert Incident.query.one().resolved_at is None
+        assert any(
+            record.getMessage()
+            == f"Could not resolve the incident of monitor {test_monitor.id}"
+            for record in caplog.records
+        )
+
+        test_monitor.update_status("up")
+        db.session.expire_all()
+        assert Incident.query.one().resolved_at is not None
+        assert CheckResult.query.count() == 5
+
+    def test_recovery_resolves_incident_opened_by_checks(
+        self, app, test_monitor, notifications
+    ):
+        """Test recovery resolves an incident opened by failed checks."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        test_monitor.update_status("up")
+        Monitor.send_queued_notifications()
+
+        incident = Incident.query.one()
+        assert incident.resolved_at is not None
+        assert 0 <= incident.duration < 60
+        assert [kwargs["event_type"] for kwargs in notifications] == ["down", "up"]
+        assert notifications[1]["incident"].id == incident.id
+        assert notifications[0]["message"].startswith(
+            "Monitor 'Test Monitor' (HTTP - https://example.com) is down. Started: "
+        )
+        assert notifications[0]["message"].endswith(
+            " UTC\n\nReason: Connection refused"
+        )
+        assert notifications[1]["message"].startswith(
+            "Monitor 'Test Monitor' (HTTP - https://example.com) is back up after "
+        )
+        assert " of downtime. Resolved: " in notifications[1]["message"]
+
+    def test_update_status_opens_single_incident(self, app, test_monitor):
+        """Test sustained failures open exactly one incident."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+
+        incident = test_monitor.get_active_incident()
+        assert incident is not None
+        assert Incident.query.count() == 1
+
+    def test_down_notification_carries_new_incident_id(
+        self, app, test_monitor, notifications
+    ):
+        """Test the down notification gets the ID of the incident just created."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        Monitor.send_queued_notifications()
+
+        incident = Incident.query.one()
+        assert [kwargs["event_type"] for kwargs in notifications] == ["down"]
+        assert notifications[0]["incident"].id == incident.id
+
+    def test_notification_incident_matches_notifier_interface(
+        self, app, test_monitor, notifications
+    ):
+        """Test notification incidents support what notifiers call on them."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        test_monitor.update_status("up")
+        Monitor.send_queued_notifications()
+
+        opened, resolved = [kwargs["incident"] for kwargs in notifications]
+        assert opened.is_active()
+        assert opened.description == "Connection refused"
+        assert opened.get_duration_formatted().endswith("s")
+        assert not resolved.is_active()
+        assert resolved.resolved_at is not None
+        with pytest.raises(AttributeError):
+            opened.severity
+
+    def test_notifications_queued_with_check(self, app, test_monitor, notifications):
+        """Test transition notifications are queued and sent from the outbox."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        test_monitor.update_status("up")
+
+        assert notifications == []
+        queued = NotificationOutbox.query.order_by(NotificationOutbox.id).all()
+        assert [row.event_type for row in queued] == ["down", "up"]
+        assert queued[1].payload["incident"]["id"] == Incident.query.one().id
+
+        assert Monitor.send_queued_notifications(limit=1) == 1
+        assert Monitor.send_queued_notifications() == 1
+        assert Monitor.send_queued_notifications() == 0
+        assert [kwargs["event_type"] for kwargs in notifications] == ["down", "up"]
+        assert NotificationOutbox.query.count() == 0
+
+    def test_empty_outbox_takes_no_write_lock(self, app, test_monitor):
+        """Test an empty outbox is probed without BEGIN IMMEDIATE."""
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert Monitor.send_queued_notifications() == 0
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("SELECT EXISTS")
+
+    def test_failed_notification_stays_queued(
+        self, app, test_monitor, notifications, monkeypatch
+    ):
+        """Test a notification whose send raised is kept and retried later."""
+        from app.notification.service import notification_service
+
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+
+        def fail(**kwargs):
+            raise ConnectionError("SMTP server unavailable")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(notification_service, "send_monitor_notification", fail)
+            assert Monitor.send_queued_notifications() == 1
+
+        row = NotificationOutbox.query.one()
+        assert row.attempts == 1
+        assert row.claimed_at is not None
+        # Still claimed, so not sent again before the claim expires
+        assert Monitor.send_queued_notifications() == 0
+
+        row.claimed_at -= timedelta(hours=1)
+        db.session.commit()
+        assert Monitor.send_queued_notifications() == 1
+        assert [kwargs["event_type"] for kwargs in notifications] == ["down"]
+        assert NotificationOutbox.query.count() == 0
+
+    def test_channel_config_stored_as_json(self, app, test_monitor):
+        """Test channel config is a native JSON object, also accepted as text."""
+        channel = NotificationChannel(
+            user_id=test_monitor.user_id,
+            name="Ops",
+            type=NotificationType.EMAIL,
+            config='{"to_email": "ops@example.com"}',
+        )
+        db.session.add(channel)
+        db.session.commit()
+        db.session.expire_all()
+
+        assert channel.get_config() == {"to_email": "ops@example.com"}
+
+        channel.set_config({"chat_id": "42"})
+        db.session.commit()
+        db.session.expire_all()
+        assert channel.config == {"chat_id": "42"}
+
+        with pytest.raises(ValueError):
+            channel.config = "not json"
+        with pytest.raises(ValueError):
+            channel.config = "[1, 2]"
+
+    def test_notifications_skipped_without_channels(
+        self, app, test_monitor, monkeypatch
+    ):
+        """Test no notifications are queued without enabled channels."""
+        from app.notification.service import notification_service
+
+        sent = []
+        monkeypatch.setattr(
+            notification_service,
+            "send_monitor_notification",
+            lambda **kwargs: sent.append(kwargs),
+        )
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        test_monitor.update_status("up")
+
+        assert NotificationOutbox.query.count() == 0
+        assert Monitor.send_queued_notifications() == 0
+        assert Incident.query.one().resolved_at is not None
+        assert sent == []
+
+    def test_incident_description_from_latest_check(self, app, test_monitor):
+        """Test a new incident is described by the latest check's failure."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        db.session.expire_all()
+        assert test_monitor.get_active_incident().description == "Connection refused"
+
+        test_monitor.update_status("up")
+        for _ in range(3):
+            test_monitor.update_status("down", status_code=503)
+        db.session.expire_all()
+        assert test_monitor.get_active_incident().description == "HTTP 503"
+
+    def test_preload_recent_checks(self, app, test_monitor):
+        """Test preloaded recent checks match per-monitor queries."""
+        other = Monitor(
+            user_id=test_monitor.user_id,
+            name="Other Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+            check_interval=CheckInterval.ONE_MINUTE,
+        )
+        db.session.add(other)
+        db.session.commit()
+        self.add_checks(
+            test_monitor,
+            [(timedelta(minutes=i), "up", float(i)) for i in range(1, 8)],
+        )
+        self.add_checks(other, [(timedelta(minutes=1), "down", None)])
+
+        expected = {m.id: m.get_recent_checks(5) for m in (test_monitor, other)}
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            with preload_recent_checks([test_monitor.id, other.id], 5):
+                loaded = {m.id: m.get_recent_checks(5) for m in (test_monitor, other)}
+                assert test_monitor.get_recent_checks(3) == loaded[test_monitor.id][:3]
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert loaded == expected
+        assert len(loaded[test_monitor.id]) == 5
+
+    def test_recent_checks_binds_count(self, app, test_monitor):
+        """Test the shared recent checks statement honours each call's count."""
+        self.add_checks(
+            test_monitor,
+            [(timedelta(minutes=i), "up", float(i)) for i in range(1, 8)],
+        )
+
+        newest = test_monitor.get_recent_checks(2)
+        assert [check.response_time for check in newest] == [1.0, 2.0]
+        assert len(test_monitor.get_recent_checks(10)) == 7
+
+    def test_checks_with_recent_match_separate_queries(self, app, test_monitor):
+        """Test the fused timespan/recent read equals the two separate reads."""
+        self.add_checks(
+            test_monitor,
+            [(timedelta(minutes=i), "up", float(i)) for i in range(1, 8)]
+            + [(timedelta(hours=5), "down", None)],
+        )
+
+        checks, recent = test_monitor.get_checks_with_recent(1, 3)
+        assert checks == test_monitor.get_checks_by_timespan(1)
+        assert recent == test_monitor.get_recent_checks(3)
+
+        checks, recent = test_monitor.get_checks_with_recent(1, 8)
+        assert len(checks) == 7
+        assert recent == test_monitor.get_recent_checks(8)
+
+    def test_rolling_uptime_counters(self, app, test_monitor):
+        """Test update_status maintains the rolling 7 and 30 day uptime."""
+        for status in ["up", "up", "up", "down"]:
+            test_monitor.update_status(status)
+
+        assert (test_monitor.uptime_7d_num, test_monitor.uptime_7d_den) == (3, 4)
+        assert (test_monitor.uptime_30d_num, test_monitor.uptime_30d_den) == (3, 4)
+        assert test_monitor.get_uptime_7d() == 75.0
+        assert test_monitor.get_uptime_30d() == 75.0
+
+    def test_rolling_uptime_drops_expired_days(self, app, test_monitor):
+        """Test buckets are ignored outside each window and pruned after 30 days."""
+        today = datetime.now(timezone.utc).date().toordinal()
+        test_monitor.uptime_days = [
+            [today - 30, 0, 5],
+            [today - 7, 0, 10],
+            [today - 1, 1, 1],
+        ]
+        test_monitor.uptime_7d_num = 1
+        test_monitor.uptime_7d_den = 16
+        test_monitor.uptime_30d_num = 1
+        test_monitor.uptime_30d_den = 16
+        db.session.commit()
+
+        assert test_monitor.get_uptime_7d() == 100.0
+        assert test_monitor.get_uptime_30d() == round(100 / 11, 2)
+
+        test_monitor.update_status("down")
+        assert test_monitor.uptime_days == [
+            [today - 7, 0, 10],
+            [today - 1, 1, 1],
+            [today, 0, 1],
+        ]
+        assert test_monitor.get_uptime_7d() == 50.0
+        assert test_monitor.get_uptime_30d() == round(100 / 12, 2)
+
+    def test_rolling_uptime_falls_back_to_query(self, app, test_monitor):
+        """Test monitors without counters compute uptime from check results."""
+        self.add_checks(
+            test_monitor,
+            [(timedelta(hours=1), "up", 10.0), (timedelta(days=20), "down", None)],
+        )
+
+        assert test_monitor.uptime_days is None
+        assert test_monitor.get_uptime_7d() == 100.0
+        assert test_monitor.get_uptime_30d() == 50.0
+
+    def test_update_status_shares_one_timestamp(self, app, test_monitor):
+        """Test the monitor row and its check result use the same timestamp."""
+        test_monitor.update_status("up", response_time=5.0)
+
+        check = CheckResult.query.one()
+        last_check = test_monitor.last_check.replace(tzinfo=None)
+        assert check.timestamp.replace(tzinfo=None) == last_check
+        assert test_monitor.updated_at.replace(tzinfo=None) == last_check
+
+    def test_repeated_status_keeps_updated_at(self, app, test_monitor):
+        """Test only status changes move the monitor's updated_at."""
+        test_monitor.update_status("up", response_time=5.0)
+        changed_at = test_monitor.updated_at
+
+        test_monitor.update_status("up", response_time=7.0)
+        db.session.expire_all()
+        assert test_monitor.updated_at == changed_at
+        assert test_monitor.last_check > changed_at
+        assert test_monitor.last_response_time == 7.0
+
+        test_monitor.update_status("down", error_message="Connection refused")
+        assert test_monitor.updated_at == test_monitor.last_check
+
+    def test_incident_transitions_use_check_timestamp(
+        self, app, test_monitor, notifications
+    ):
+        """Test incidents open and resolve at the time of the triggering check."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        opened_at = test_monitor.last_check.replace(tzinfo=None)
+        test_monitor.update_status("up")
+        resolved_at = test_monitor.last_check.replace(tzinfo=None)
+
+        incident = Incident.query.one()
+        assert incident.started_at.replace(tzinfo=None) == opened_at
+        assert incident.created_at.replace(tzinfo=None) == opened_at
+        assert incident.updated_at.replace(tzinfo=None) == opened_at
+        assert incident.resolved_at.replace(tzinfo=None) == resolved_at
+        queued = NotificationOutbox.query.order_by(NotificationOutbox.id).all()
+        assert [row.created_at.replace(tzinfo=None) for row in queued] == [
+            opened_at,
+            resolved_at,
+        ]
+
+    def test_update_status_writes_in_one_transaction(self, app, test_monitor):
+        """Test a check writes one INSERT, one UPDATE and commits once."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        commits = []
+
+        def record_commit(conn):
+            commits.append(conn)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        event.listen(db.engine, "commit", record_commit)
+        try:
+            test_monitor.update_status(
+                "down",
+                response_time=5.0,
+                error_message="Connection timeout",
+                additional_data={
+                    "reason": "timeout",
+                    # Deduplicated into their own tables in the same transaction
+                    "cert_info": {
+                        "domain": "example.com",
+                        "not_after": "Jan 9 12:31:51 2099 GMT",
+                    },
+                    "domain_check": {
+                        "domain": "example.com",
+                        "ip_address": "93.184.216.34",
+                    },
+                },
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+            event.remove(db.engine, "commit", record_commit)
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO check_result")]
+        updates = [s for s in statements if s.startswith("UPDATE monitor")]
+        assert len(inserts) == 1
+        assert len(updates) == 1
+        assert len(commits) == 1
+
+        check = CheckResult.query.one()
+        assert check.get_error_message() == "Connection timeout"
+        assert check.is_timeout()
+        data = check.get_additional_data()
+        assert data["reason"] == "timeout"
+        assert data["cert_info"]["domain"] == "example.com"
+        assert data["domain_check"]["ip_address"] == "93.184.216.34"
+
+    def test_check_batch_writes_in_one_transaction(self, app, test_monitor):
+        """Test a batch of checks shares one INSERT, one UPDATE and one commit."""
+        other = Monitor(
+            user_id=test_monitor.user_id,
+            name="Other Monitor",
+            type=MonitorType.HTTP,
+            target="https://example.org",
+            check_interval=CheckInterval.ONE_MINUTE,
+        )
+        db.session.add(other)
+        db.session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        commits = []
+
+        def record_commit(conn):
+            commits.append(conn)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        event.listen(db.engine, "commit", record_commit)
+        try:
+            Monitor.apply_check_batch(
+                [
+                    CheckUpdate(test_monitor, "up", response_time=12.0),
+                    CheckUpdate(other, "down", error_message="Connection refused"),
+                ]
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+            event.remove(db.engine, "commit", record_commit)
+
+        inserts = [s for s in statements if s.startswith("INSERT INTO check_result")]
+        updates = [s for s in statements if s.startswith("UPDATE monitor")]
+        assert len(inserts) == 1
+        assert len(updates) == 1
+        assert len(commits) == 1
+
+        assert test_monitor.last_status == "up"
+        assert other.last_status == "down"
+        assert other.consecutive_failures == 1
+        checks = {c.monitor_id: c for c in CheckResult.query.all()}
+        assert checks[test_monitor.id].response_time == 12.0
+        assert checks[other.id].get_error_message() == "Connection refused"
+        assert checks[test_monitor.id].timestamp == checks[other.id].timestamp
+
+    def test_failed_incident_write_keeps_check_result(
+        self, app, test_monitor, monkeypatch, caplog
+    ):
+        """Test a failed incident INSERT rolls back only to its savepoint."""
+
+        def fail(rows, now=None):
+            db.session.execute(text("INSERT INTO missing_table VALUES (1)"))
+
+        monkeypatch.setattr(Incident, "bulk_open", fail)
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+
+        assert CheckResult.query.count() == 3
+        assert Incident.query.count() == 0
+        assert test_monitor.consecutive_failures == 3
+        assert any(
+            record.levelname == "WARNING"
+            and record.getMessage()
+            == f"Could not open an incident for monitor {test_monitor.id}"
+            and record.exc_info
+            for record in caplog.records
+        )
+
+    def test_failed_check_write_rolls_back(self, app, test_monitor, monkeypatch):
+        """Test a failed check write rolls back, leaving the session usable."""
+
+        def fail(rows):
+            db.session.execute(text("INSERT INTO missing_table VALUES (1)"))
+
+        monkeypatch.setattr(CheckResult, "bulk_create", fail)
+        with pytest.raises(OperationalError):
+            test_monitor.update_status("down", error_message="Connection refused")
+        monkeypatch.undo()
+
+        assert test_monitor.last_status == "unknown"
+        test_monitor.update_status("up")
+        assert CheckResult.query.count() == 1
+
+    @pytest.mark.parametrize(
+        "statuses, pattern_type, should_create",
+        [
+            (["down", "up", "up", "up", "up"], "isolated_failure", False),
+            (["down", "up", "down", "up", "down"], "flapping", False),
+            (["down", "down", "down", "up", "up"], "sustained_failure", True),
+            (["down", "up"], "insufficient_data", False),
+        ],
+    )
+    def test_analyze_failure_pattern(
+        self, app, test_monitor, statuses, pattern_type, should_create
+    ):
+        """Test recent check windows are classified by pattern."""
+        checks = [CheckResult(monitor_id=test_monitor.id, status=s) for s in statuses]
+
+        analysis = test_monitor._analyze_failure_pattern(checks)
+
+        assert analysis["pattern_type"] == pattern_type
+        assert analysis["should_create_incident"] is should_create
+        assert analysis["down_count"] == (
+            statuses.count("down") if len(statuses) >= 3 else 0
+        )
+
+    def test_analyze_failure_pattern_shares_read_only_result(self, app, test_monitor):
+        """Test the common all-up window returns one shared, read-only result."""
+        checks = [CheckResult(monitor_id=test_monitor.id, status="up")] * 5
+
+        first = test_monitor._analyze_failure_pattern(checks)
+        second = test_monitor._analyze_failure_pattern(checks)
+
+        assert first is second
+        assert first["should_create_incident"] is False
+        assert first["up_count"] == 5
+        with pytest.raises(TypeError):
+            first["should_create_incident"] = True
+
+    def test_to_dict_incidents_do_not_lazy_load(self, app, test_monitor):
+        """Test serialized incidents are loaded without relationship loads."""
+        now = datetime.now(timezone.utc)
+        for hours in range(1, 13):
+            db.session.add(
+                Incident(
+                    monitor_id=test_monitor.id,
+                    started_at=now - timedelta(hours=hours),
+                    resolved_at=now - timedelta(hours=hours) + timedelta(minutes=5),
+                )
+            )
+        db.session.commit()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            data = test_monitor.to_dict(include_incidents=True)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert len(data["incidents"]) == 10
+        assert data["incidents"][0]["started_at"] > data["incidents"][1]["started_at"]
+        assert len([s for s in statements if "FROM incident" in s]) == 1
+
+        # Incidents the caller already loaded are serialized without a query
+        statements.clear()
+        incidents = Incident.recent_by_monitor([test_monitor.id], 10)
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            preloaded = test_monitor.to_dict(
+                include_incidents=True, incidents=incidents[test_monitor.id]
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        assert preloaded["incidents"] == data["incidents"]
+        assert not [s for s in statements if "FROM incident" in s]
+
+    def test_check_results_are_not_lazy_loaded(self, app, test_monitor):
+        """Test implicit check result loading raises instead of querying."""
+        with pytest.raises(InvalidRequestError):
+            test_monitor.check_results
+
+    def test_delete_monitor_cascades_to_check_results(self, app, test_monitor):
+        """Test deleting a monitor still removes its check results."""
+        self.add_checks(test_monitor, [(timedelta(minutes=1), "up", 1.0)])
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        assert Incident.query.count() == 1
+
+        db.session.delete(test_monitor)
+        db.session.commit()
+
+        assert CheckResult.query.count() == 0
+        assert Incident.query.count() == 0
+
+    def test_incident_relationships_are_never_lazy_loaded(self, app, test_monitor):
+        """Test incidents and settings must be queried explicitly."""
+        for _ in range(3):
+            test_monitor.update_status("down", error_message="Connection refused")
+        test_monitor.update_status("up", response_time=10.0)
+        for _ in range(3):
+            test_monitor.update_status("down", status_code=503)
+
+        with pytest.raises(InvalidRequestError):
+            test_monitor.incidents
+        with pytest.raises(InvalidRequestError):
+            test_monitor.notification_settings
+
+        recent = test_monitor.get_recent_incidents()
+        assert [incident.description for incident in recent] == [
+            "HTTP 503",
+            "Connection refused",
+        ]
+        assert test_monitor.get_active_incident() == recent[0]
+
+    def test_current_status_is_memoized(self, app, test_monitor):
+        """Test is_up/is_down/is_unknown share one status computation."""
+        test_monitor.update_status("up", response_time=100.0)
+
+        calls = []
+        compute = test_monitor._compute_current_status
+
+        def counting_compute():
+            calls.append(1)
+            return compute()
+
+        test_monitor._compute_current_status = counting_compute
+        assert test_monitor.is_up()
+        assert not test_monitor.is_down()
+        assert not test_monitor.is_unknown()
+        assert len(calls) == 1
+
+        # A status update invalidates the cached result
+        test_monitor.update_status("down", error_message="boom")
+        assert test_monitor.is_down()
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "intervals, expected", [(2, "up"), (5, "up"), (11, "unknown")]
+    )
+    def test_current_status_goes_stale(self, app, test_monitor, intervals, expected):
+        """Test the last status is kept until 10 check intervals have passed."""
+        test_monitor.last_status = "up"
+        test_monitor.last_check = datetime.now(timezone.utc) - timedelta(
+            seconds=test_monitor.check_interval.value * intervals
+        )
+
+        assert test_monitor._compute_current_status()[0] == expected
+
+    def test_enums_stored_as_small_integers(self, app, test_monitor):
+        """Test type and check_interval are stored as integer codes."""
+        row = db.session.execute(
+            db.text("SELECT type, check_interval FROM monitor WHERE id = :id"),
+            {"id": test_monitor.id},
+        ).one()
+        assert row == (1, 60)
+
+        db.session.expire_all()
+        monitor = db.session.get(Monitor, test_monitor.id)
+        assert monitor.type is MonitorType.HTTP
+        assert monitor.check_interval is CheckInterval.ONE_MINUTE
+        assert Monitor.query.filter_by(type=MonitorType.HTTP).count() == 1
+
+    def test_statuses_stored_as_small_integers(self, app, test_monitor):
+        """Test check and monitor statuses are stored as integer codes."""
+        test_monitor.update_status("up")
+        test_monitor.update_status("down", error_message="Connection refused")
+
+        codes = db.session.execute(
+            db.text("SELECT status FROM check_result ORDER BY id")
+        ).scalars()
+        assert list(codes) == [1, 2]
+        last_status = db.session.execute(
+            db.text("SELECT last_status FROM monitor WHERE id = :id"),
+            {"id": test_monitor.id},
+        ).scalar()
+        assert last_status == 2
+
+        db.session.expire_all()
+        assert test_monitor.last_status == "down"
+        assert CheckResult.query.filter_by(status="up").count() == 1
+        with pytest.raises(StatementError):
+            test_monitor.update_status("degraded")
+
+    @pytest.mark.parametrize(
+        "column, code", [("type", 6), ("check_interval", 45)], ids=["type", "interval"]
+    )
+    def test_enum_codes_are_checked(self, app, test_monitor, column, code):
+        """Test the database rejects codes outside the enums."""
+        with pytest.raises(IntegrityError):
+            db.session.execute(
+                db.text(f"UPDATE monitor SET {column} = :code WHERE id = :id"),
+                {"code": code, "id": test_monitor.id},
+            )